@@ -146,5 +146,10 @@ export const apiClient = {
   },
   getSyncJob(jobId: string): Promise<SyncJobResponse> {
     return requestJson<SyncJobResponse>(`/v1/sync/jobs/${jobId}`);
+  },
+  cancelSyncJob(jobId: string): Promise<SyncJobResponse> {
+    return requestJson<SyncJobResponse>(`/v1/sync/jobs/${jobId}/cancel`, {
+      method: "POST"
+    });
   }
 };
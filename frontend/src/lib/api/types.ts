@@ -12,6 +12,8 @@ export interface SyncJobCounts {
   running: number;
   finished: number;
   failed: number;
+  skipped: number;
+  cancelled: number;
 }
 
 export interface HealthResponse {
@@ -97,15 +99,44 @@ export interface SyncResponse {
   job_id: string;
   accepted: boolean;
   detail: string;
+  coalesced: boolean;
+}
+
+export interface SyncModuleProgress {
+  pages_done: number;
+  pages_total: number | null;
+  rows: number;
+  rows_per_s: number | null;
+  eta_s: number | null;
+  finished: boolean;
+}
+
+export interface SyncJobProgress {
+  module: string | null;
+  active_modules: string[];
+  pages_done: number;
+  pages_total: number | null;
+  rows: number;
+  rows_per_s: number | null;
+  eta_s: number | null;
+  elapsed_s: number;
+  cancel_requested: boolean;
+  modules: Record<string, SyncModuleProgress>;
+  updated_at: string;
 }
 
 export interface SyncJobResponse {
   id: string;
-  status: "queued" | "running" | "finished" | "failed" | string;
+  status: "queued" | "running" | "finished" | "failed" | "skipped" | "cancelled" | string;
   payload: Record<string, unknown>;
   started_at: string | null;
   finished_at: string | null;
   error_message: string | null;
+  lease_owner: string | null;
+  heartbeat_at: string | null;
+  attempts: number;
+  progress: SyncJobProgress | null;
+  cancel_requested_at: string | null;
   created_at: string;
   updated_at: string;
 }
@@ -0,0 +1,43 @@
+"""shared retrieval cache entries
+
+Revision ID: 20261019_0002
+Revises: 20260221_0001
+Create Date: 2026-10-19 09:00:00
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0002"
+down_revision = "20260221_0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "retrieval_cache_entry",
+        sa.Column("cache_key", sa.String(length=64), primary_key=True),
+        sa.Column("generation", sa.String(length=255), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+    )
+    op.create_index("ix_retrieval_cache_entry_generation", "retrieval_cache_entry", ["generation"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_retrieval_cache_entry_generation", table_name="retrieval_cache_entry")
+    op.drop_table("retrieval_cache_entry")
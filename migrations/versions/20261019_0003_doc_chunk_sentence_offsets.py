@@ -0,0 +1,25 @@
+"""doc chunk sentence offsets
+
+Revision ID: 20261019_0003
+Revises: 20261019_0002
+Create Date: 2026-10-19 10:00:00
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0003"
+down_revision = "20261019_0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("doc_chunk", sa.Column("sentence_offsets", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    # Native DROP COLUMN (SQLite >= 3.35) keeps the doc_chunk FTS triggers intact.
+    op.drop_column("doc_chunk", "sentence_offsets")
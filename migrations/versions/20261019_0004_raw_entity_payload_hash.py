@@ -0,0 +1,24 @@
+"""raw entity payload hash
+
+Revision ID: 20261019_0004
+Revises: 20261019_0003
+Create Date: 2026-10-19 11:00:00
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0004"
+down_revision = "20261019_0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("raw_entity", sa.Column("payload_hash", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("raw_entity", "payload_hash")
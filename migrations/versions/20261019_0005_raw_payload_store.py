@@ -0,0 +1,166 @@
+"""content-addressed raw payload store
+
+Revision ID: 20261019_0005
+Revises: 20261019_0004
+Create Date: 2026-10-19 14:00:00
+
+"""
+
+import zlib
+from hashlib import sha256
+from typing import Any
+
+import orjson
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0005"
+down_revision = "20261019_0004"
+branch_labels = None
+depends_on = None
+
+RAW_TABLES = ("raw_entity", "raw_issue", "raw_journal", "raw_wiki")
+BATCH_SIZE = 500
+
+# The codec as of this revision, frozen here so later changes to the application's
+# payload store cannot alter what this migration writes or reads.
+PAYLOAD_CODEC = "zlib"
+ZLIB_LEVEL = 6
+
+
+def canonical_payload(payload: Any) -> bytes:
+    return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+
+
+def compress_payload(data: bytes) -> bytes:
+    return zlib.compress(data, ZLIB_LEVEL)
+
+
+def decompress_payload(codec: str, data: bytes) -> Any:
+    if codec != PAYLOAD_CODEC:
+        raise ValueError(f"Unsupported raw payload codec: {codec}")
+    return orjson.loads(zlib.decompress(data))
+
+
+def upgrade() -> None:
+    op.create_table(
+        "raw_payload",
+        sa.Column("hash", sa.String(length=64), primary_key=True),
+        sa.Column("codec", sa.String(length=16), nullable=False),
+        sa.Column("size_bytes", sa.Integer(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+    )
+    for table_name in RAW_TABLES[1:]:
+        op.add_column(table_name, sa.Column("payload_hash", sa.String(length=64), nullable=True))
+
+    bind = op.get_bind()
+    payload_table = sa.table(
+        "raw_payload",
+        sa.column("hash", sa.String()),
+        sa.column("codec", sa.String()),
+        sa.column("size_bytes", sa.Integer()),
+        sa.column("data", sa.LargeBinary()),
+    )
+    for table_name in RAW_TABLES:
+        raw = sa.table(
+            table_name,
+            sa.column("id", sa.Integer()),
+            sa.column("payload", sa.JSON()),
+            sa.column("payload_hash", sa.String()),
+        )
+        last_id = 0
+        while True:
+            rows = bind.execute(
+                sa.select(raw.c.id, raw.c.payload)
+                .where(raw.c.id > last_id)
+                .order_by(raw.c.id)
+                .limit(BATCH_SIZE)
+            ).all()
+            if not rows:
+                break
+            blobs: dict[str, bytes] = {}
+            updates = []
+            for row_id, payload in rows:
+                data = canonical_payload(payload)
+                hash_value = sha256(data).hexdigest()
+                blobs.setdefault(hash_value, data)
+                updates.append({"row_id": row_id, "hash_value": hash_value})
+            bind.execute(
+                payload_table.insert().prefix_with("OR IGNORE"),
+                [
+                    {
+                        "hash": hash_value,
+                        "codec": PAYLOAD_CODEC,
+                        "size_bytes": len(data),
+                        "data": compress_payload(data),
+                    }
+                    for hash_value, data in blobs.items()
+                ],
+            )
+            bind.execute(
+                raw.update()
+                .where(raw.c.id == sa.bindparam("row_id"))
+                .values(payload_hash=sa.bindparam("hash_value")),
+                updates,
+            )
+            last_id = rows[-1][0]
+
+    for table_name in RAW_TABLES:
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.drop_column("payload")
+            batch_op.alter_column(
+                "payload_hash", existing_type=sa.String(length=64), nullable=False
+            )
+            batch_op.create_index(f"ix_{table_name}_payload_hash", ["payload_hash"])
+
+
+def downgrade() -> None:
+    for table_name in RAW_TABLES:
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.drop_index(f"ix_{table_name}_payload_hash")
+            batch_op.add_column(sa.Column("payload", sa.JSON(), nullable=True))
+
+    bind = op.get_bind()
+    for table_name in RAW_TABLES:
+        rows = bind.execute(
+            sa.text(
+                f"SELECT p.hash, p.codec, p.data FROM raw_payload p "
+                f"JOIN (SELECT DISTINCT payload_hash FROM {table_name}) r "
+                f"ON r.payload_hash = p.hash"
+            )
+        )
+        raw = sa.table(
+            table_name,
+            sa.column("payload", sa.JSON()),
+            sa.column("payload_hash", sa.String()),
+        )
+        for hash_value, codec, data in rows.all():
+            bind.execute(
+                raw.update()
+                .where(raw.c.payload_hash == hash_value)
+                .values(payload=decompress_payload(codec, data))
+            )
+
+    for table_name in RAW_TABLES:
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.alter_column("payload", existing_type=sa.JSON(), nullable=False)
+            if table_name == "raw_entity":
+                batch_op.alter_column(
+                    "payload_hash", existing_type=sa.String(length=64), nullable=True
+                )
+            else:
+                batch_op.drop_column("payload_hash")
+    op.drop_table("raw_payload")
@@ -0,0 +1,47 @@
+"""entity tombstones for deletion sweeps
+
+Revision ID: 20261019_0006
+Revises: 20261019_0005
+Create Date: 2026-10-19 16:00:00
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0006"
+down_revision = "20261019_0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "entity_tombstone",
+        sa.Column("entity_type", sa.String(length=64), primary_key=True),
+        sa.Column("entity_id", sa.String(length=128), primary_key=True),
+        sa.Column("project_id", sa.Integer(), nullable=True),
+        sa.Column("reason", sa.String(length=32), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+    )
+    op.create_index("ix_entity_tombstone_project_id", "entity_tombstone", ["project_id"])
+    op.create_index("ix_entity_tombstone_deleted_at", "entity_tombstone", ["deleted_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_entity_tombstone_deleted_at", table_name="entity_tombstone")
+    op.drop_index("ix_entity_tombstone_project_id", table_name="entity_tombstone")
+    op.drop_table("entity_tombstone")
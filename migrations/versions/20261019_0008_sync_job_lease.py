@@ -0,0 +1,36 @@
+"""sync job worker lease
+
+Revision ID: 20261019_0008
+Revises: 20261019_0007
+Create Date: 2026-10-19 18:00:00
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0008"
+down_revision = "20261019_0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("sync_job", sa.Column("lease_owner", sa.String(length=128), nullable=True))
+    op.add_column(
+        "sync_job", sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    op.add_column("sync_job", sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column(
+        "sync_job",
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("sync_job") as batch_op:
+        batch_op.drop_column("attempts")
+        batch_op.drop_column("heartbeat_at")
+        batch_op.drop_column("lease_expires_at")
+        batch_op.drop_column("lease_owner")
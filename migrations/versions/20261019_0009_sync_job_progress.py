@@ -0,0 +1,29 @@
+"""sync job progress and cancellation
+
+Revision ID: 20261019_0009
+Revises: 20261019_0008
+Create Date: 2026-10-19 19:00:00
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0009"
+down_revision = "20261019_0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("sync_job", sa.Column("progress", sa.JSON(), nullable=True))
+    op.add_column(
+        "sync_job", sa.Column("cancel_requested_at", sa.DateTime(timezone=True), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("sync_job") as batch_op:
+        batch_op.drop_column("cancel_requested_at")
+        batch_op.drop_column("progress")
@@ -0,0 +1,46 @@
+"""cache generation markers
+
+Revision ID: 20261019_0010
+Revises: 20261019_0009
+Create Date: 2026-10-19 20:00:00
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0010"
+down_revision = "20261019_0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cache_generation",
+        sa.Column("name", sa.String(length=64), primary_key=True),
+        sa.Column("generation", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+    )
+    # The retrieval index marker used to live in sync_state; carry it over.
+    op.execute(
+        "INSERT INTO cache_generation (name, generation) "
+        "SELECT 'retrieval_index', 1 FROM sync_state WHERE key = 'retrieval_index'"
+    )
+    op.execute("DELETE FROM sync_state WHERE key = 'retrieval_index'")
+
+
+def downgrade() -> None:
+    op.drop_table("cache_generation")
@@ -4,6 +4,7 @@ import argparse
 import asyncio
 import os
 from datetime import UTC, datetime
+from time import monotonic
 
 import httpx
 
@@ -15,8 +16,22 @@ from redmine_rag.ingestion.sync_pipeline import run_incremental_sync
 from redmine_rag.mock_redmine.app import app as mock_redmine_app
 
 
-async def _run_soak(iterations: int, project_ids: list[int]) -> None:
+async def _run_soak(
+    iterations: int,
+    project_ids: list[int],
+    *,
+    cassette: str | None,
+    cassette_mode: str,
+    latency: str,
+    latency_fixed_s: float,
+) -> None:
     os.environ["MOCK_REDMINE_DATASET_PROFILE"] = "medium"
+    if cassette is not None:
+        # Record against the mock (or replay a production recording) via RedmineClient.
+        os.environ["REDMINE_CASSETTE_MODE"] = cassette_mode
+        os.environ["REDMINE_CASSETTE_PATH"] = cassette
+        os.environ["REDMINE_CASSETTE_LATENCY"] = latency
+        os.environ["REDMINE_CASSETTE_LATENCY_FIXED_S"] = str(latency_fixed_s)
     get_settings.cache_clear()
     get_engine.cache_clear()
 
@@ -35,10 +50,12 @@ async def _run_soak(iterations: int, project_ids: list[int]) -> None:
 
     started = datetime.now(UTC)
     for index in range(iterations):
+        cycle_started = monotonic()
         summary = await run_incremental_sync(project_ids=project_ids, client=client)
         print(
             f"[{index + 1}/{iterations}] issues={summary['issues_synced']} "
-            f"chunks={summary['chunks_updated']} vectors={summary['vectors_upserted']}"
+            f"chunks={summary['chunks_updated']} vectors={summary['vectors_upserted']} "
+            f"duration_s={monotonic() - cycle_started:.2f}"
         )
     finished = datetime.now(UTC)
     print(
@@ -58,10 +75,33 @@ def main() -> None:
         default=[],
         help="Project IDs for sync scope (repeat option to provide multiple ids)",
     )
+    parser.add_argument("--cassette", default=None, help="Cassette file (.jsonl.gz) to use")
+    parser.add_argument(
+        "--cassette-mode",
+        choices=("record", "replay"),
+        default="replay",
+        help="Record the mock responses or replay the cassette instead of calling Redmine",
+    )
+    parser.add_argument(
+        "--latency",
+        choices=("none", "fixed", "endpoint", "recorded"),
+        default="recorded",
+        help="Replay latency injection (REDMINE_CASSETTE_LATENCY_ENDPOINTS for 'endpoint')",
+    )
+    parser.add_argument("--latency-fixed-s", type=float, default=0.0)
     args = parser.parse_args()
 
     project_ids = [project_id for project_id in args.project_id if project_id > 0] or [1]
-    asyncio.run(_run_soak(iterations=max(args.iterations, 1), project_ids=project_ids))
+    asyncio.run(
+        _run_soak(
+            iterations=max(args.iterations, 1),
+            project_ids=project_ids,
+            cassette=args.cassette,
+            cassette_mode=args.cassette_mode,
+            latency=args.latency,
+            latency_fixed_s=max(args.latency_fixed_s, 0.0),
+        )
+    )
 
 
 if __name__ == "__main__":
@@ -32,7 +32,12 @@ from redmine_rag.services.ops_service import (
     run_backup_operation,
     run_maintenance_operation,
 )
-from redmine_rag.services.sync_service import get_sync_job, list_sync_jobs, queue_sync_job
+from redmine_rag.services.sync_service import (
+    cancel_sync_job,
+    get_sync_job,
+    list_sync_jobs,
+    queue_sync_job,
+)
 
 router = APIRouter()
 
@@ -60,10 +65,24 @@ async def sync_job(job_id: str) -> SyncJobResponse:
     return job
 
 
+@router.post("/v1/sync/jobs/{job_id}/cancel", response_model=SyncJobResponse)
+async def sync_job_cancel(job_id: str) -> SyncJobResponse:
+    job = await cancel_sync_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Sync job {job_id} was not found")
+    if job.status not in {"running", "cancelled"}:
+        raise HTTPException(
+            status_code=409, detail=f"Sync job {job_id} already ended with status {job.status}"
+        )
+    return job
+
+
 @router.get("/v1/sync/jobs", response_model=SyncJobListResponse)
 async def sync_jobs(
     limit: int = Query(default=20, ge=1, le=200),
-    status: str | None = Query(default=None, pattern="^(queued|running|finished|failed)$"),
+    status: str | None = Query(
+        default=None, pattern="^(queued|running|finished|failed|skipped|cancelled)$"
+    ),
 ) -> SyncJobListResponse:
     return await list_sync_jobs(limit=limit, status=status)
 
@@ -35,6 +35,8 @@ class SyncJobCounts(BaseModel):
     running: int = 0
     finished: int = 0
     failed: int = 0
+    skipped: int = 0
+    cancelled: int = 0
 
 
 class HealthResponse(BaseModel):
@@ -108,6 +110,7 @@ class SyncResponse(BaseModel):
     job_id: str
     accepted: bool
     detail: str
+    coalesced: bool = False
 
 
 class ExtractRequest(BaseModel):
@@ -127,6 +130,11 @@ class SyncJobResponse(BaseModel):
     started_at: datetime | None
     finished_at: datetime | None
     error_message: str | None
+    lease_owner: str | None = None
+    heartbeat_at: datetime | None = None
+    attempts: int = 0
+    progress: dict | None = None
+    cancel_requested_at: datetime | None = None
     created_at: datetime
     updated_at: datetime
 
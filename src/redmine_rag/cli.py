@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import socket
+from collections.abc import Callable, Coroutine
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from typing import Any
 
 import typer
 import uvicorn
@@ -12,12 +16,16 @@ from redmine_rag.core.logging import configure_logging
 from redmine_rag.extraction.properties import extract_issue_properties
 from redmine_rag.indexing.chunk_indexer import rebuild_chunk_index
 from redmine_rag.indexing.embedding_indexer import refresh_embeddings
+from redmine_rag.ingestion.deletion_sweep import run_deletion_sweep
 from redmine_rag.ingestion.sync_pipeline import run_incremental_sync
 from redmine_rag.services.ops_service import (
     create_state_backup,
     restore_state_backup,
     run_sqlite_maintenance,
 )
+from redmine_rag.workers.locks import SYNC_LOCK_NAME, LockHeldError, run_under_lock
+from redmine_rag.workers.scheduler import run_periodic_sync_loop
+from redmine_rag.workers.sync_worker import run_sync_worker
 
 app = typer.Typer(help="redmine-rag command line")
 sync_app = typer.Typer(help="sync operations")
@@ -42,12 +50,52 @@ def serve(reload: bool = True) -> None:
     )
 
 
+@app.command("worker")
+def worker() -> None:
+    settings = get_settings()
+    configure_logging(settings.log_level)
+    asyncio.run(run_sync_worker())
+
+
+def _run_with_sync_lock(
+    work: Callable[[], Coroutine[Any, Any, dict[str, Any]]],
+) -> dict[str, Any]:
+    """Run `work` under the sync lock shared with the scheduler and workers."""
+
+    owner = f"cli:{socket.gethostname()}:{os.getpid()}"
+    try:
+        return asyncio.run(
+            run_under_lock(
+                work,
+                name=SYNC_LOCK_NAME,
+                owner=owner,
+                ttl_s=get_settings().sync_scheduler_lock_ttl_s,
+            )
+        )
+    except LockHeldError as exc:
+        typer.echo(f"Sync already running: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+
 @sync_app.command("run")
 def sync_run(project_id: list[int] | None = typer.Option(None)) -> None:
-    summary = asyncio.run(run_incremental_sync(project_ids=project_id or []))
+    summary = _run_with_sync_lock(lambda: run_incremental_sync(project_ids=project_id or []))
     typer.echo(summary)
 
 
+@sync_app.command("sweep")
+def sync_sweep(project_id: list[int] | None = typer.Option(None)) -> None:
+    summary = _run_with_sync_lock(lambda: run_deletion_sweep(project_ids=project_id or []))
+    typer.echo(summary)
+
+
+@sync_app.command("scheduler")
+def sync_scheduler() -> None:
+    settings = get_settings()
+    configure_logging(settings.log_level)
+    asyncio.run(run_periodic_sync_loop())
+
+
 @extract_app.command("run")
 def extract_run(issue_id: list[int] | None = typer.Option(None)) -> None:
     summary = asyncio.run(extract_issue_properties(issue_ids=issue_id))
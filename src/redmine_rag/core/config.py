@@ -33,6 +33,17 @@ class Settings(BaseSettings):
     retrieval_planner_enabled: bool = False
     retrieval_planner_max_expansions: int = 3
     retrieval_planner_timeout_s: float = 12.0
+    retrieval_cache_enabled: bool = True
+    retrieval_cache_max_entries: int = 256
+    retrieval_cache_shared: bool = False
+    reference_cache_ttl_s: float = 300.0
+    fts_prefix_lengths: list[int] = Field(default_factory=list)
+    fts_detail: str = "full"
+    fts_automerge: int = 4
+    fts_crisismerge: int = 16
+    fts_merge_pages: int = 500
+    fts_merge_max_steps: int = 20
+    fts_segment_warn_threshold: int = 64
     ask_answer_mode: str = "deterministic"
     ask_llm_timeout_s: float = 20.0
     ask_llm_max_claims: int = 5
@@ -63,8 +74,47 @@ class Settings(BaseSettings):
     redmine_wiki_pages: list[str] = Field(default_factory=list)
     redmine_verify_ssl: bool = True
     redmine_http_timeout_s: float = 30.0
+    redmine_http_max_connections: int = 10
+    redmine_http_max_keepalive_connections: int = 5
+    redmine_http_keepalive_expiry_s: float = 30.0
+    redmine_http2: bool = False
+    redmine_rate_limit_rps: float = 0.0
+    redmine_rate_limit_burst: int = 10
+    redmine_adaptive_min_concurrency: int = 1
+    redmine_adaptive_max_concurrency: int = 8
+    redmine_adaptive_latency_target_s: float = 5.0
+    redmine_retry_after_max_s: float = 120.0
     redmine_allowed_hosts: list[str] = Field(default_factory=list)
+    redmine_cassette_mode: str = "off"
+    redmine_cassette_path: str = "./data/cassettes/redmine.jsonl.gz"
+    redmine_cassette_latency: str = "recorded"
+    redmine_cassette_latency_fixed_s: float = 0.0
+    redmine_cassette_latency_endpoints: dict[str, float] = Field(default_factory=dict)
+    redmine_cassette_latency_scale: float = 1.0
     sync_overlap_minutes: int = 15
+    sync_page_prefetch: int = 4
+    sync_module_concurrency: int = 4
+    sync_detail_concurrency: int = 8
+    sync_project_shards: int = 1
+    sync_stream_indexing: bool = True
+    sync_index_queue_size: int = 16
+    sync_vector_flush_interval_s: float = 5.0
+    sync_deletion_sweep_interval_s: float = 21600.0
+    sync_deletion_max_ratio: float = 0.25
+    sync_deletion_min_count: int = 10
+    sync_scheduler_enabled: bool = False
+    sync_scheduler_interval_s: float = 900.0
+    sync_scheduler_min_interval_s: float = 60.0
+    sync_scheduler_max_interval_s: float = 3600.0
+    sync_scheduler_jitter: float = 0.1
+    sync_scheduler_busy_changes: int = 100
+    sync_scheduler_lock_ttl_s: float = 120.0
+    sync_job_executor: str = "worker"
+    sync_job_coalesce: bool = True
+    sync_progress_interval_s: float = 2.0
+    sync_worker_lease_ttl_s: float = 60.0
+    sync_worker_poll_interval_s: float = 2.0
+    sync_worker_max_attempts: int = 3
     sync_job_history_limit: int = 100
 
     llm_provider: str = "api"
@@ -116,6 +166,43 @@ class Settings(BaseSettings):
             return [int(item.strip()) for item in value.split(",") if item.strip()]
         raise ValueError("Invalid REDMINE_BOARD_IDS value")
 
+    @field_validator("fts_prefix_lengths", mode="before")
+    @classmethod
+    def parse_fts_prefix_lengths(cls, value: object) -> list[int]:
+        if value is None or value == "":
+            return []
+        if isinstance(value, list):
+            items = [int(item) for item in value]
+        elif isinstance(value, str):
+            items = [int(item.strip()) for item in value.split(",") if item.strip()]
+        else:
+            raise ValueError("Invalid FTS_PREFIX_LENGTHS value")
+        if any(item <= 0 or item > 999 for item in items):
+            raise ValueError("FTS_PREFIX_LENGTHS values must be in range 1..999")
+        return sorted(set(items))
+
+    @field_validator("fts_detail")
+    @classmethod
+    def validate_fts_detail(cls, value: str) -> str:
+        normalized = value.strip().lower()
+        if normalized not in {"full", "column", "none"}:
+            raise ValueError("FTS_DETAIL must be one of: full, column, none")
+        return normalized
+
+    @field_validator("fts_automerge")
+    @classmethod
+    def validate_fts_automerge(cls, value: int) -> int:
+        if value < 0 or value > 16:
+            raise ValueError("FTS_AUTOMERGE must be in range 0..16")
+        return value
+
+    @field_validator("fts_crisismerge")
+    @classmethod
+    def validate_fts_crisismerge(cls, value: int) -> int:
+        if value < 2:
+            raise ValueError("FTS_CRISISMERGE must be >= 2")
+        return value
+
     @field_validator("redmine_modules", mode="before")
     @classmethod
     def parse_modules(cls, value: object) -> list[str]:
@@ -149,17 +236,81 @@ class Settings(BaseSettings):
             return [item.strip().lower() for item in value.split(",") if item.strip()]
         raise ValueError("Invalid REDMINE_ALLOWED_HOSTS value")
 
+    @field_validator("redmine_cassette_mode")
+    @classmethod
+    def validate_redmine_cassette_mode(cls, value: str) -> str:
+        normalized = value.strip().lower()
+        if normalized not in {"off", "record", "replay"}:
+            raise ValueError("REDMINE_CASSETTE_MODE must be one of: off, record, replay")
+        return normalized
+
+    @field_validator("sync_job_executor")
+    @classmethod
+    def validate_sync_job_executor(cls, value: str) -> str:
+        normalized = value.strip().lower()
+        if normalized not in {"worker", "inline"}:
+            raise ValueError("SYNC_JOB_EXECUTOR must be one of: worker, inline")
+        return normalized
+
+    @field_validator("redmine_cassette_latency")
+    @classmethod
+    def validate_redmine_cassette_latency(cls, value: str) -> str:
+        normalized = value.strip().lower()
+        if normalized not in {"none", "fixed", "endpoint", "recorded"}:
+            raise ValueError(
+                "REDMINE_CASSETTE_LATENCY must be one of: none, fixed, endpoint, recorded"
+            )
+        return normalized
+
+    @field_validator("redmine_cassette_latency_endpoints", mode="before")
+    @classmethod
+    def parse_redmine_cassette_latency_endpoints(cls, value: object) -> dict[str, float]:
+        if value is None or value == "":
+            return {}
+        if isinstance(value, dict):
+            items = [(str(key), float(item)) for key, item in value.items()]
+        elif isinstance(value, str):
+            items = []
+            for token in value.split(","):
+                if not token.strip():
+                    continue
+                pattern, separator, seconds = token.rpartition("=")
+                if not separator or not pattern.strip():
+                    raise ValueError("REDMINE_CASSETTE_LATENCY_ENDPOINTS items must be pattern=s")
+                items.append((pattern.strip(), float(seconds)))
+        else:
+            raise ValueError("Invalid REDMINE_CASSETTE_LATENCY_ENDPOINTS value")
+        if any(seconds < 0 for _, seconds in items):
+            raise ValueError("REDMINE_CASSETTE_LATENCY_ENDPOINTS delays must be >= 0")
+        return dict(items)
+
     @field_validator(
         "embedding_dim",
         "retrieval_rrf_k",
         "retrieval_candidate_multiplier",
         "retrieval_planner_max_expansions",
+        "retrieval_cache_max_entries",
+        "fts_merge_pages",
+        "fts_merge_max_steps",
+        "fts_segment_warn_threshold",
+        "redmine_http_max_connections",
+        "redmine_http_max_keepalive_connections",
+        "redmine_rate_limit_burst",
+        "redmine_adaptive_min_concurrency",
+        "redmine_adaptive_max_concurrency",
         "ask_llm_max_claims",
         "ask_llm_max_retries",
         "llm_extract_max_retries",
         "llm_extract_batch_size",
         "llm_extract_max_context_chars",
         "sync_job_history_limit",
+        "sync_page_prefetch",
+        "sync_module_concurrency",
+        "sync_detail_concurrency",
+        "sync_project_shards",
+        "sync_index_queue_size",
+        "sync_scheduler_busy_changes",
+        "sync_worker_max_attempts",
         "ollama_max_concurrency",
         "llm_circuit_failure_threshold",
         "llm_circuit_slow_threshold_ms",
@@ -187,9 +338,26 @@ class Settings(BaseSettings):
         "llm_runtime_cost_limit_usd",
         "llm_circuit_open_seconds",
         "redmine_http_timeout_s",
+        "redmine_http_keepalive_expiry_s",
+        "redmine_rate_limit_rps",
+        "redmine_adaptive_latency_target_s",
+        "redmine_retry_after_max_s",
         "ollama_timeout_s",
         "ask_llm_timeout_s",
         "retrieval_planner_timeout_s",
+        "reference_cache_ttl_s",
+        "sync_vector_flush_interval_s",
+        "sync_deletion_sweep_interval_s",
+        "sync_deletion_min_count",
+        "sync_scheduler_interval_s",
+        "sync_scheduler_min_interval_s",
+        "sync_scheduler_max_interval_s",
+        "sync_scheduler_lock_ttl_s",
+        "sync_worker_lease_ttl_s",
+        "sync_worker_poll_interval_s",
+        "sync_progress_interval_s",
+        "redmine_cassette_latency_fixed_s",
+        "redmine_cassette_latency_scale",
     )
     @classmethod
     def validate_non_negative_floats(cls, value: float) -> float:
@@ -197,7 +365,7 @@ class Settings(BaseSettings):
             raise ValueError("Value must be >= 0")
         return value
 
-    @field_validator("llm_slo_min_success_rate")
+    @field_validator("llm_slo_min_success_rate", "sync_deletion_max_ratio", "sync_scheduler_jitter")
     @classmethod
     def validate_rate_between_zero_and_one(cls, value: float) -> float:
         if value < 0 or value > 1:
@@ -2,10 +2,12 @@ from redmine_rag.db.base import Base
 from redmine_rag.db.models import (
     Attachment,
     Board,
+    CacheGeneration,
     CustomField,
     CustomValue,
     DocChunk,
     Document,
+    EntityTombstone,
     Group,
     Issue,
     IssueCategory,
@@ -23,9 +25,12 @@ from redmine_rag.db.models import (
     RawEntity,
     RawIssue,
     RawJournal,
+    RawPayload,
     RawWiki,
+    RetrievalCacheEntry,
     SyncCursor,
     SyncJob,
+    SyncLock,
     SyncState,
     TimeEntry,
     Tracker,
@@ -40,6 +45,7 @@ __all__ = [
     "RawEntity",
     "RawIssue",
     "RawJournal",
+    "RawPayload",
     "RawWiki",
     "Project",
     "User",
@@ -70,4 +76,8 @@ __all__ = [
     "SyncCursor",
     "SyncState",
     "SyncJob",
+    "SyncLock",
+    "EntityTombstone",
+    "RetrievalCacheEntry",
+    "CacheGeneration",
 ]
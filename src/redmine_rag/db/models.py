@@ -10,6 +10,7 @@ from sqlalchemy import (
     Float,
     ForeignKey,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
@@ -19,6 +20,17 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from redmine_rag.db.base import Base, TimestampMixin
 
 
+class RawPayload(Base, TimestampMixin):
+    """Content-addressed, compressed Redmine payload shared by all raw_* rows."""
+
+    __tablename__ = "raw_payload"
+
+    hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    codec: Mapped[str] = mapped_column(String(16))
+    size_bytes: Mapped[int] = mapped_column(Integer)
+    data: Mapped[bytes] = mapped_column(LargeBinary)
+
+
 class RawEntity(Base, TimestampMixin):
     __tablename__ = "raw_entity"
     __table_args__ = (
@@ -34,7 +46,7 @@ class RawEntity(Base, TimestampMixin):
         DateTime(timezone=True), nullable=True, index=True
     )
     fetched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
-    payload: Mapped[dict] = mapped_column(JSON)
+    payload_hash: Mapped[str] = mapped_column(String(64), index=True)
 
 
 class RawIssue(Base, TimestampMixin):
@@ -44,7 +56,7 @@ class RawIssue(Base, TimestampMixin):
     project_id: Mapped[int] = mapped_column(Integer, index=True)
     updated_on: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
     fetched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
-    payload: Mapped[dict] = mapped_column(JSON)
+    payload_hash: Mapped[str] = mapped_column(String(64), index=True)
 
 
 class RawJournal(Base, TimestampMixin):
@@ -54,7 +66,7 @@ class RawJournal(Base, TimestampMixin):
     issue_id: Mapped[int] = mapped_column(Integer, index=True)
     created_on: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
     fetched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
-    payload: Mapped[dict] = mapped_column(JSON)
+    payload_hash: Mapped[str] = mapped_column(String(64), index=True)
 
 
 class RawWiki(Base, TimestampMixin):
@@ -65,7 +77,7 @@ class RawWiki(Base, TimestampMixin):
     title: Mapped[str] = mapped_column(String(255), index=True)
     updated_on: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
     fetched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
-    payload: Mapped[dict] = mapped_column(JSON)
+    payload_hash: Mapped[str] = mapped_column(String(64), index=True)
 
 
 class Project(Base, TimestampMixin):
@@ -446,6 +458,7 @@ class DocChunk(Base, TimestampMixin):
         DateTime(timezone=True), nullable=True, index=True
     )
     source_metadata: Mapped[dict] = mapped_column(JSON, default=dict)
+    sentence_offsets: Mapped[list | None] = mapped_column(JSON, nullable=True)
     embedding_key: Mapped[str | None] = mapped_column(String(128), nullable=True, unique=True)
 
 
@@ -492,6 +505,30 @@ class SyncState(Base, TimestampMixin):
     last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
 
 
+class EntityTombstone(Base, TimestampMixin):
+    """Local rows removed because the entity vanished from Redmine or left the synced scope."""
+
+    __tablename__ = "entity_tombstone"
+
+    entity_type: Mapped[str] = mapped_column(String(64), primary_key=True)
+    entity_id: Mapped[str] = mapped_column(String(128), primary_key=True)
+    project_id: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
+    reason: Mapped[str] = mapped_column(String(32))
+    deleted_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+
+
+class SyncLock(Base, TimestampMixin):
+    """Named lease shared by all processes; `owner` is NULL or expired when free."""
+
+    __tablename__ = "sync_lock"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    owner: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    acquired_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
 class SyncJob(Base, TimestampMixin):
     __tablename__ = "sync_job"
 
@@ -501,3 +538,30 @@ class SyncJob(Base, TimestampMixin):
     started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    lease_owner: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    progress: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    cancel_requested_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+
+class RetrievalCacheEntry(Base, TimestampMixin):
+    __tablename__ = "retrieval_cache_entry"
+
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    generation: Mapped[str] = mapped_column(String(255), index=True)
+    payload: Mapped[dict] = mapped_column(JSON)
+
+
+class CacheGeneration(Base, TimestampMixin):
+    """Counter bumped by writers so caches in every process can detect stale entries."""
+
+    __tablename__ = "cache_generation"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    generation: Mapped[int] = mapped_column(Integer, default=0)
@@ -11,7 +11,7 @@ from sqlalchemy.orm import selectinload
 
 from redmine_rag.api.schemas import ExtractResponse
 from redmine_rag.core.config import get_settings
-from redmine_rag.db.models import Issue, IssueMetric, IssueProperty, IssueStatus, Journal
+from redmine_rag.db.models import Issue, IssueMetric, IssueProperty, Journal
 from redmine_rag.db.session import get_session_factory
 from redmine_rag.extraction.llm_structured import (
     LLM_EXTRACTOR_VERSION,
@@ -35,18 +35,13 @@ from redmine_rag.services.llm_telemetry_service import (
     record_llm_fallback,
     record_llm_success,
 )
+from redmine_rag.services.reference_cache_service import ReferenceStatus, get_reference_data
 
 logger = logging.getLogger(__name__)
 
 EXTRACTOR_VERSION = "det-v1"
 
 
-@dataclass(slots=True)
-class _StatusMeta:
-    name: str
-    is_closed: bool
-
-
 @dataclass(slots=True)
 class _StatusTransition:
     old_status_id: int | None
@@ -117,13 +112,8 @@ async def extract_issue_properties(issue_ids: list[int] | None) -> ExtractRespon
                 detail="No issues matched extraction scope.",
             )
 
-        status_rows = (
-            await session.execute(select(IssueStatus.id, IssueStatus.name, IssueStatus.is_closed))
-        ).all()
-        status_meta: dict[int, _StatusMeta] = {
-            int(status_id): _StatusMeta(name=str(name), is_closed=bool(is_closed))
-            for status_id, name, is_closed in status_rows
-        }
+        reference = await get_reference_data(session, ttl_s=settings.reference_cache_ttl_s)
+        status_meta = reference.statuses
 
         llm_success_count = 0
         llm_failure_count = 0
@@ -351,7 +341,7 @@ async def extract_issue_properties(issue_ids: list[int] | None) -> ExtractRespon
     )
 
 
-def _extract_issue(issue: Issue, *, status_meta: dict[int, _StatusMeta]) -> _IssueExtraction:
+def _extract_issue(issue: Issue, *, status_meta: dict[int, ReferenceStatus]) -> _IssueExtraction:
     created_on = _ensure_utc(issue.created_on)
     journals = sorted(
         issue.journals,
@@ -569,11 +559,13 @@ def _extract_detail_items(journal: Journal) -> list[dict[str, Any]]:
 
 def _is_reopen_transition(
     *,
-    status_meta: dict[int, _StatusMeta],
+    status_meta: dict[int, ReferenceStatus],
     old_status_id: int | None,
     new_status_id: int,
 ) -> bool:
-    new_name = status_meta.get(new_status_id, _StatusMeta(name="", is_closed=False)).name.lower()
+    new_name = status_meta.get(
+        new_status_id, ReferenceStatus(name="", is_closed=False)
+    ).name.lower()
     if "reopen" in new_name:
         return True
     if old_status_id is None:
@@ -583,7 +575,7 @@ def _is_reopen_transition(
     )
 
 
-def _status_is_closed(status_meta: dict[int, _StatusMeta], status_id: int) -> bool:
+def _status_is_closed(status_meta: dict[int, ReferenceStatus], status_id: int) -> bool:
     metadata = status_meta.get(status_id)
     if metadata is None:
         return False
@@ -21,7 +21,20 @@ from redmine_rag.db.models import (
     WikiPage,
 )
 from redmine_rag.db.session import get_session_factory
-from redmine_rag.indexing.chunker import chunk_text
+from redmine_rag.indexing.chunker import chunk_text, sentence_offsets
+from redmine_rag.services.retrieval_cache_service import mark_retrieval_index_updated
+
+# DocChunk source type -> indexer method; entity ids are the primary keys of each model.
+_SOURCE_INDEXERS = {
+    "issue": "_index_issues",
+    "journal": "_index_journals",
+    "wiki": "_index_wiki_pages",
+    "attachment": "_index_attachments",
+    "news": "_index_news",
+    "document": "_index_documents",
+    "message": "_index_messages",
+    "time_entry": "_index_time_entries",
+}
 
 
 @dataclass(slots=True)
@@ -38,11 +51,15 @@ class ChunkIndexer:
         base_url: str,
         target_chars: int = 1200,
         overlap_chars: int = 150,
+        track_new_chunks: bool = False,
     ) -> None:
         self._session = session
         self._base_url = base_url.rstrip("/")
         self._target_chars = target_chars
         self._overlap_chars = overlap_chars
+        self._track_new_chunks = track_new_chunks
+        self._new_chunks: list[tuple[str, str]] = []
+        self._skip: dict[str, set[int]] = {}
 
     async def rebuild_all(self) -> dict[str, int]:
         await self._session.execute(delete(DocChunk))
@@ -52,7 +69,16 @@ class ChunkIndexer:
             "chunks_updated": stats.chunks_updated,
         }
 
-    async def refresh(self, since: datetime | None) -> ChunkStats:
+    async def refresh(
+        self, since: datetime | None, *, skip: dict[str, set[int]] | None = None
+    ) -> ChunkStats:
+        """Re-chunk every source changed since `since`.
+
+        `skip` maps a source type to entity ids already re-chunked in this cycle, e.g. by
+        the streaming index stage of a sync, so the catch-up pass does not redo them.
+        """
+
+        self._skip = skip or {}
         stats = ChunkStats()
         await self._index_issues(since, stats)
         await self._index_journals(since, stats)
@@ -62,14 +88,35 @@ class ChunkIndexer:
         await self._index_documents(since, stats)
         await self._index_messages(since, stats)
         await self._index_time_entries(since, stats)
+        self._skip = {}
+        return stats
+
+    async def refresh_sources(self, source_type: str, ids: list[int]) -> ChunkStats:
+        """Re-chunk specific entities of one source type, e.g. the issues of a synced page."""
+
+        stats = ChunkStats()
+        indexer = getattr(self, _SOURCE_INDEXERS[source_type])
+        await indexer(None, stats, ids=ids)
         return stats
 
-    async def _index_issues(self, since: datetime | None, stats: ChunkStats) -> None:
+    def take_new_chunks(self) -> list[tuple[str, str]]:
+        """Return and forget `(embedding_key, text)` of chunks written since the last call."""
+
+        chunks, self._new_chunks = self._new_chunks, []
+        return chunks
+
+    async def _index_issues(
+        self, since: datetime | None, stats: ChunkStats, *, ids: list[int] | None = None
+    ) -> None:
         stmt = select(Issue).order_by(Issue.id.asc())
         if since is not None:
             stmt = stmt.where(Issue.updated_on >= since)
+        if ids is not None:
+            stmt = stmt.where(Issue.id.in_(ids))
 
         for issue in (await self._session.execute(stmt)).scalars().all():
+            if issue.id in self._skip.get("issue", ()):
+                continue
             sections = [
                 f"Issue #{issue.id}",
                 issue.subject,
@@ -96,7 +143,9 @@ class ChunkIndexer:
             stats.sources_reindexed += 1
             stats.chunks_updated += chunk_count
 
-    async def _index_journals(self, since: datetime | None, stats: ChunkStats) -> None:
+    async def _index_journals(
+        self, since: datetime | None, stats: ChunkStats, *, ids: list[int] | None = None
+    ) -> None:
         stmt = (
             select(Journal, Issue.project_id)
             .join(Issue, Issue.id == Journal.issue_id)
@@ -104,8 +153,12 @@ class ChunkIndexer:
         )
         if since is not None:
             stmt = stmt.where(Journal.created_on >= since)
+        if ids is not None:
+            stmt = stmt.where(Journal.id.in_(ids))
 
         for journal, project_id in (await self._session.execute(stmt)).all():
+            if journal.id in self._skip.get("journal", ()):
+                continue
             sections = [
                 f"Journal #{journal.id} on issue #{journal.issue_id}",
                 journal.notes or "",
@@ -131,12 +184,18 @@ class ChunkIndexer:
             stats.sources_reindexed += 1
             stats.chunks_updated += chunk_count
 
-    async def _index_wiki_pages(self, since: datetime | None, stats: ChunkStats) -> None:
+    async def _index_wiki_pages(
+        self, since: datetime | None, stats: ChunkStats, *, ids: list[int] | None = None
+    ) -> None:
         stmt = select(WikiPage).order_by(WikiPage.id.asc())
         if since is not None:
             stmt = stmt.where(WikiPage.updated_on >= since)
+        if ids is not None:
+            stmt = stmt.where(WikiPage.id.in_(ids))
 
         for page in (await self._session.execute(stmt)).scalars().all():
+            if page.id in self._skip.get("wiki", ()):
+                continue
             sections = [
                 f"Wiki: {page.title}",
                 page.content,
@@ -157,12 +216,18 @@ class ChunkIndexer:
             stats.sources_reindexed += 1
             stats.chunks_updated += chunk_count
 
-    async def _index_attachments(self, since: datetime | None, stats: ChunkStats) -> None:
+    async def _index_attachments(
+        self, since: datetime | None, stats: ChunkStats, *, ids: list[int] | None = None
+    ) -> None:
         stmt = select(Attachment).order_by(Attachment.id.asc())
         if since is not None:
             stmt = stmt.where(Attachment.created_on >= since)
+        if ids is not None:
+            stmt = stmt.where(Attachment.id.in_(ids))
 
         for attachment in (await self._session.execute(stmt)).scalars().all():
+            if attachment.id in self._skip.get("attachment", ()):
+                continue
             sections = [
                 f"Attachment: {attachment.filename}",
                 attachment.description or "",
@@ -198,12 +263,18 @@ class ChunkIndexer:
             stats.sources_reindexed += 1
             stats.chunks_updated += chunk_count
 
-    async def _index_news(self, since: datetime | None, stats: ChunkStats) -> None:
+    async def _index_news(
+        self, since: datetime | None, stats: ChunkStats, *, ids: list[int] | None = None
+    ) -> None:
         stmt = select(News).order_by(News.id.asc())
         if since is not None:
             stmt = stmt.where(News.created_on >= since)
+        if ids is not None:
+            stmt = stmt.where(News.id.in_(ids))
 
         for news in (await self._session.execute(stmt)).scalars().all():
+            if news.id in self._skip.get("news", ()):
+                continue
             sections = [
                 news.title,
                 news.summary or "",
@@ -224,12 +295,18 @@ class ChunkIndexer:
             stats.sources_reindexed += 1
             stats.chunks_updated += chunk_count
 
-    async def _index_documents(self, since: datetime | None, stats: ChunkStats) -> None:
+    async def _index_documents(
+        self, since: datetime | None, stats: ChunkStats, *, ids: list[int] | None = None
+    ) -> None:
         stmt = select(Document).order_by(Document.id.asc())
         if since is not None:
             stmt = stmt.where(Document.created_on >= since)
+        if ids is not None:
+            stmt = stmt.where(Document.id.in_(ids))
 
         for document in (await self._session.execute(stmt)).scalars().all():
+            if document.id in self._skip.get("document", ()):
+                continue
             sections = [document.title, document.description or ""]
             text = "\n\n".join(section for section in sections if section.strip())
             chunk_count = await self._replace_source_chunks(
@@ -246,7 +323,9 @@ class ChunkIndexer:
             stats.sources_reindexed += 1
             stats.chunks_updated += chunk_count
 
-    async def _index_messages(self, since: datetime | None, stats: ChunkStats) -> None:
+    async def _index_messages(
+        self, since: datetime | None, stats: ChunkStats, *, ids: list[int] | None = None
+    ) -> None:
         stmt = (
             select(Message, Board.project_id)
             .join(Board, Board.id == Message.board_id)
@@ -254,8 +333,12 @@ class ChunkIndexer:
         )
         if since is not None:
             stmt = stmt.where(Message.updated_on >= since)
+        if ids is not None:
+            stmt = stmt.where(Message.id.in_(ids))
 
         for message, project_id in (await self._session.execute(stmt)).all():
+            if message.id in self._skip.get("message", ()):
+                continue
             sections = [
                 message.subject,
                 message.content or "",
@@ -283,12 +366,18 @@ class ChunkIndexer:
             stats.sources_reindexed += 1
             stats.chunks_updated += chunk_count
 
-    async def _index_time_entries(self, since: datetime | None, stats: ChunkStats) -> None:
+    async def _index_time_entries(
+        self, since: datetime | None, stats: ChunkStats, *, ids: list[int] | None = None
+    ) -> None:
         stmt = select(TimeEntry).order_by(TimeEntry.id.asc())
         if since is not None:
             stmt = stmt.where(TimeEntry.updated_on >= since)
+        if ids is not None:
+            stmt = stmt.where(TimeEntry.id.in_(ids))
 
         for entry in (await self._session.execute(stmt)).scalars().all():
+            if entry.id in self._skip.get("time_entry", ()):
+                continue
             if not entry.comments:
                 continue
             text = "\n\n".join(
@@ -360,9 +449,12 @@ class ChunkIndexer:
                     source_created_on=normalized_created,
                     source_updated_on=normalized_updated,
                     source_metadata=source_metadata,
+                    sentence_offsets=sentence_offsets(chunk),
                     embedding_key=chunk_key,
                 )
             )
+            if self._track_new_chunks:
+                self._new_chunks.append((chunk_key, chunk))
         return len(chunks)
 
 
@@ -378,6 +470,7 @@ async def rebuild_chunk_index(
             overlap_chars=overlap_chars,
         )
         summary = await indexer.rebuild_all()
+        await mark_retrieval_index_updated(session)
         await session.commit()
         return summary
 
@@ -24,3 +24,32 @@ def chunk_text(text: str, target_chars: int = 1200, overlap_chars: int = 150) ->
         start += step
 
     return chunks
+
+
+def sentence_offsets(text: str) -> list[list[int]]:
+    """Return `[start, end)` offsets of sentences ending in `.`, `!` or `?` before whitespace."""
+
+    offsets: list[list[int]] = []
+    length = len(text)
+    start = 0
+    index = 0
+    while index < length:
+        if text[index] in ".!?" and index + 1 < length and text[index + 1].isspace():
+            _append_sentence(offsets, text, start, index + 1)
+            index += 1
+            while index < length and text[index].isspace():
+                index += 1
+            start = index
+            continue
+        index += 1
+    _append_sentence(offsets, text, start, length)
+    return offsets
+
+
+def _append_sentence(offsets: list[list[int]], text: str, start: int, end: int) -> None:
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    if start < end:
+        offsets.append([start, end])
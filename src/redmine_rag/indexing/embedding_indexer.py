@@ -11,6 +11,7 @@ from redmine_rag.db.models import DocChunk
 from redmine_rag.db.session import get_session_factory
 from redmine_rag.indexing.embeddings import deterministic_embed_text
 from redmine_rag.indexing.vector_store import LocalNumpyVectorStore
+from redmine_rag.services.retrieval_cache_service import mark_retrieval_index_updated
 
 
 @dataclass(slots=True)
@@ -34,8 +35,18 @@ class EmbeddingIndexer:
         self._embedding_dim = embedding_dim
 
     async def refresh(
-        self, *, since: datetime | None, full_rebuild: bool = False
+        self,
+        *,
+        since: datetime | None,
+        full_rebuild: bool = False,
+        skip_keys: set[str] | None = None,
     ) -> EmbeddingStats:
+        """Embed chunks updated since `since` and drop vectors of deleted chunks.
+
+        `skip_keys` holds embedding keys whose vectors are already current in the store,
+        e.g. written by the streaming index stage of the same sync.
+        """
+
         stats = EmbeddingStats(mode="full_rebuild" if full_rebuild else "incremental")
         await self._ensure_embedding_keys()
 
@@ -55,6 +66,8 @@ class EmbeddingIndexer:
         for chunk in chunks:
             if chunk.embedding_key is None:
                 continue
+            if skip_keys and not full_rebuild and chunk.embedding_key in skip_keys:
+                continue
             vector = deterministic_embed_text(chunk.text, dim=self._embedding_dim)
             self._store.upsert(chunk.embedding_key, vector)
             stats.vectors_upserted += 1
@@ -70,6 +83,15 @@ class EmbeddingIndexer:
         self._store.save()
         return stats
 
+    def embed_chunks(self, chunks: list[tuple[str, str]]) -> int:
+        """Upsert vectors for `(embedding_key, text)` pairs without touching the database."""
+
+        for embedding_key, text in chunks:
+            self._store.upsert(
+                embedding_key, deterministic_embed_text(text, dim=self._embedding_dim)
+            )
+        return len(chunks)
+
     async def _ensure_embedding_keys(self) -> None:
         rows = (
             (
@@ -108,6 +130,7 @@ async def refresh_embeddings(
             embedding_dim=settings.embedding_dim,
         )
         stats = await indexer.refresh(since=since, full_rebuild=full_rebuild)
+        await mark_retrieval_index_updated(session)
         await session.commit()
         return {
             "mode": stats.mode,
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import re
+import sqlite3
+from dataclasses import dataclass
+from typing import Any
+
+FTS_TABLE = "doc_chunk_fts"
+
+# Every FTS5 segment owns at least one leaf page, so distinct segids in `%_idx` count segments.
+FTS_SEGMENT_STATS_SQL = f"""
+SELECT
+  (SELECT count(DISTINCT segid) FROM {FTS_TABLE}_idx) AS segments,
+  (SELECT count(*) FROM {FTS_TABLE}_data) AS data_pages
+"""
+
+
+@dataclass(slots=True, frozen=True)
+class FtsSegmentStats:
+    segments: int
+    data_pages: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"segments": self.segments, "data_pages": self.data_pages}
+
+
+@dataclass(slots=True, frozen=True)
+class FtsMaintenanceResult:
+    rebuilt: bool
+    merge_steps: int
+    segments_before: int | None
+    segments_after: int | None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "rebuilt": self.rebuilt,
+            "merge_steps": self.merge_steps,
+            "segments_before": self.segments_before,
+            "segments_after": self.segments_after,
+        }
+
+
+def build_fts_create_sql(*, prefix_lengths: list[int], detail: str) -> str:
+    options = ["text", "content='doc_chunk'", "content_rowid='id'"]
+    if prefix_lengths:
+        options.append(f"prefix='{' '.join(str(item) for item in sorted(set(prefix_lengths)))}'")
+    if detail != "full":
+        options.append(f"detail={detail}")
+    return f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5({', '.join(options)})"
+
+
+def read_fts_segment_stats(conn: sqlite3.Connection) -> FtsSegmentStats | None:
+    try:
+        row = conn.execute(FTS_SEGMENT_STATS_SQL).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return FtsSegmentStats(segments=int(row[0] or 0), data_pages=int(row[1] or 0))
+
+
+def run_fts_maintenance(
+    conn: sqlite3.Connection,
+    *,
+    prefix_lengths: list[int],
+    detail: str,
+    automerge: int,
+    crisismerge: int,
+    merge_pages: int,
+    merge_max_steps: int,
+) -> FtsMaintenanceResult | None:
+    """Apply configured FTS5 options and incrementally merge index segments.
+
+    Prefix indexes and `detail` are fixed at creation time, so a changed configuration
+    recreates the table and rebuilds it from `doc_chunk`. Returns `None` without an FTS table.
+    """
+
+    row = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (FTS_TABLE,),
+    ).fetchone()
+    if row is None:
+        return None
+
+    before = read_fts_segment_stats(conn)
+    desired_sql = build_fts_create_sql(prefix_lengths=prefix_lengths, detail=detail)
+    rebuilt = _fts_options(str(row[0])) != _fts_options(desired_sql)
+    if rebuilt:
+        conn.execute(f"DROP TABLE {FTS_TABLE}")
+        conn.execute(desired_sql)
+        conn.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES('rebuild')")
+
+    conn.execute(
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rank) VALUES('automerge', ?)",
+        (automerge,),
+    )
+    conn.execute(
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rank) VALUES('crisismerge', ?)",
+        (crisismerge,),
+    )
+    conn.commit()
+
+    merge_steps = 0
+    for _ in range(merge_max_steps):
+        changes_before = conn.total_changes
+        # A negative budget merges any level holding two or more segments, i.e. an
+        # incremental 'optimize' bounded to `merge_pages` leaf pages per step.
+        conn.execute(
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rank) VALUES('merge', ?)",
+            (-merge_pages,),
+        )
+        conn.commit()
+        merge_steps += 1
+        if conn.total_changes - changes_before < 2:
+            break
+
+    after = read_fts_segment_stats(conn)
+    return FtsMaintenanceResult(
+        rebuilt=rebuilt,
+        merge_steps=merge_steps,
+        segments_before=before.segments if before is not None else None,
+        segments_after=after.segments if after is not None else None,
+    )
+
+
+def _fts_options(create_sql: str) -> set[str]:
+    start = create_sql.find("(")
+    end = create_sql.rfind(")")
+    if start < 0 or end <= start:
+        return set()
+    options = {
+        re.sub(r"\s*=\s*", "=", " ".join(item.split())).lower().replace('"', "'")
+        for item in create_sql[start + 1 : end].split(",")
+        if item.strip()
+    }
+    options.discard("detail=full")
+    return options
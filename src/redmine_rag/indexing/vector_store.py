@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import cast
@@ -85,10 +86,16 @@ class LocalNumpyVectorStore:
         ]
 
     def remove_keys_not_in(self, allowed_keys: set[str]) -> int:
+        return self._keep(lambda key: key in allowed_keys)
+
+    def remove_keys(self, keys: set[str]) -> int:
+        return self._keep(lambda key: key not in keys)
+
+    def _keep(self, predicate: Callable[[str], bool]) -> int:
         if not self._keys:
             return 0
 
-        keep_indices = [idx for idx, key in enumerate(self._keys) if key in allowed_keys]
+        keep_indices = [idx for idx, key in enumerate(self._keys) if predicate(key)]
         removed = len(self._keys) - len(keep_indices)
         if removed == 0:
             return 0
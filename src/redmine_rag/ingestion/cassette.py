@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import gzip
+import os
+from collections import deque
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from pathlib import Path
+from time import monotonic
+from typing import Any
+
+import httpx
+import orjson
+
+from redmine_rag.core.config import Settings
+
+CASSETTE_VERSION = 1
+
+# The recorded body is already decoded, so transfer framing must not be replayed with it.
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+class CassetteMissError(httpx.TransportError):
+    """Replay was asked for a request that is not in the cassette."""
+
+
+@dataclass(slots=True, frozen=True)
+class CassetteEntry:
+    method: str
+    path: str
+    query: str
+    status_code: int
+    headers: list[tuple[str, str]]
+    body: bytes
+    elapsed_s: float
+
+    @property
+    def key(self) -> tuple[str, str, str]:
+        return (self.method, self.path, self.query)
+
+    @classmethod
+    def from_exchange(
+        cls, request: httpx.Request, response: httpx.Response, body: bytes, elapsed_s: float
+    ) -> CassetteEntry:
+        return cls(
+            method=request.method,
+            path=request.url.path,
+            query=_canonical_query(request.url),
+            status_code=response.status_code,
+            headers=_replayable_headers(response.headers),
+            body=body,
+            elapsed_s=round(elapsed_s, 6),
+        )
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> CassetteEntry:
+        if "body_b64" in payload:
+            body = base64.b64decode(payload["body_b64"])
+        else:
+            body = str(payload.get("text", "")).encode("utf-8")
+        return cls(
+            method=str(payload["method"]),
+            path=str(payload["path"]),
+            query=str(payload.get("query", "")),
+            status_code=int(payload["status_code"]),
+            headers=[(str(name), str(value)) for name, value in payload.get("headers", [])],
+            body=body,
+            elapsed_s=float(payload.get("elapsed_s", 0.0)),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "method": self.method,
+            "path": self.path,
+            "query": self.query,
+            "status_code": self.status_code,
+            "headers": self.headers,
+            "elapsed_s": self.elapsed_s,
+        }
+        try:
+            payload["text"] = self.body.decode("utf-8")
+        except UnicodeDecodeError:
+            payload["body_b64"] = base64.b64encode(self.body).decode("ascii")
+        return payload
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            self.status_code, headers=self.headers, content=self.body, request=request
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class LatencyProfile:
+    """Delay injected before each replayed response.
+
+    `fixed` waits `fixed_s`; `endpoint` waits the value of the first `fnmatch` pattern
+    matching the request path (falling back to `fixed_s`); `recorded` waits the elapsed
+    time captured while recording. Every delay is multiplied by `scale`.
+    """
+
+    mode: str = "recorded"
+    fixed_s: float = 0.0
+    endpoints: dict[str, float] = field(default_factory=dict)
+    scale: float = 1.0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> LatencyProfile:
+        return cls(
+            mode=settings.redmine_cassette_latency,
+            fixed_s=settings.redmine_cassette_latency_fixed_s,
+            endpoints=dict(settings.redmine_cassette_latency_endpoints),
+            scale=settings.redmine_cassette_latency_scale,
+        )
+
+    def delay_for(self, entry: CassetteEntry) -> float:
+        if self.mode == "fixed":
+            delay = self.fixed_s
+        elif self.mode == "endpoint":
+            delay = next(
+                (
+                    seconds
+                    for pattern, seconds in self.endpoints.items()
+                    if fnmatchcase(entry.path, pattern)
+                ),
+                self.fixed_s,
+            )
+        elif self.mode == "recorded":
+            delay = entry.elapsed_s
+        else:
+            delay = 0.0
+        return max(delay * self.scale, 0.0)
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Pass requests to `inner` and record every exchange into the cassette.
+
+    Each exchange is appended to the file as soon as it completes, so a crashed or
+    interrupted recording keeps what it captured; close rewrites the file in one piece.
+    """
+
+    def __init__(self, path: str | Path, *, inner: httpx.AsyncBaseTransport) -> None:
+        self.path = Path(path)
+        self._inner = inner
+        self._entries: list[CassetteEntry] = []
+
+    @property
+    def entries(self) -> tuple[CassetteEntry, ...]:
+        return tuple(self._entries)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = monotonic()
+        response = await self._inner.handle_async_request(request)
+        body = await response.aread()
+        entry = CassetteEntry.from_exchange(request, response, body, monotonic() - started)
+        self._entries.append(entry)
+        append_cassette_entry(self.path, entry, create=len(self._entries) == 1)
+        return httpx.Response(
+            entry.status_code,
+            headers=entry.headers,
+            content=body,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+        save_cassette(self.path, self._entries)
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Serve responses from a cassette, matched on method, path and sorted query string.
+
+    Repeated identical requests are answered in recorded order; once a key's recordings
+    are used up its last response is repeated, so extra sync cycles keep replaying.
+    """
+
+    def __init__(self, path: str | Path, *, latency: LatencyProfile | None = None) -> None:
+        self.path = Path(path)
+        self.latency = latency or LatencyProfile(mode="none")
+        self._entries: dict[tuple[str, str, str], deque[CassetteEntry]] = {}
+        for entry in load_cassette(self.path):
+            self._entries.setdefault(entry.key, deque()).append(entry)
+        self.hits = 0
+        self.misses = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = (request.method, request.url.path, _canonical_query(request.url))
+        recorded = self._entries.get(key)
+        if not recorded:
+            self.misses += 1
+            raise CassetteMissError(
+                f"No recorded response for {request.method} {request.url.path}"
+                f"{'?' + key[2] if key[2] else ''} in {self.path}",
+                request=request,
+            )
+        entry = recorded.popleft() if len(recorded) > 1 else recorded[0]
+        self.hits += 1
+        delay = self.latency.delay_for(entry)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return entry.to_response(request)
+
+
+def load_cassette(path: str | Path) -> list[CassetteEntry]:
+    raw_lines: list[bytes] = []
+    with gzip.open(path, "rb") as fp:
+        try:
+            for line in fp:
+                raw_lines.append(line)
+        except EOFError:
+            # A recording killed mid-append leaves a truncated last gzip member.
+            pass
+    lines = [line for line in raw_lines if line.endswith(b"\n") and line.strip()]
+    if not lines:
+        return []
+    header = orjson.loads(lines[0])
+    if header.get("version") != CASSETTE_VERSION:
+        raise ValueError(f"Unsupported cassette version in {path}: {header.get('version')}")
+    return [CassetteEntry.from_dict(orjson.loads(line)) for line in lines[1:]]
+
+
+def save_cassette(path: str | Path, entries: list[CassetteEntry]) -> None:
+    """Write gzip-compressed JSON lines (header first) atomically."""
+
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(f"{target.name}.tmp")
+    with gzip.open(tmp_path, "wb") as fp:
+        fp.write(orjson.dumps({"version": CASSETTE_VERSION, "entries": len(entries)}) + b"\n")
+        for entry in entries:
+            fp.write(orjson.dumps(entry.to_dict()) + b"\n")
+    os.replace(tmp_path, target)
+
+
+def append_cassette_entry(path: str | Path, entry: CassetteEntry, *, create: bool) -> None:
+    """Append one entry as its own gzip member; `create` starts the file with a header."""
+
+    target = Path(path)
+    if create:
+        target.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(target, "wb" if create else "ab") as fp:
+        if create:
+            fp.write(orjson.dumps({"version": CASSETTE_VERSION}) + b"\n")
+        fp.write(orjson.dumps(entry.to_dict()) + b"\n")
+
+
+def _canonical_query(url: httpx.URL) -> str:
+    return str(httpx.QueryParams(sorted(url.params.multi_items())))
+
+
+def _replayable_headers(headers: httpx.Headers) -> list[tuple[str, str]]:
+    return [(name, value) for name, value in headers.multi_items() if name not in _DROPPED_HEADERS]
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import logging
+from datetime import UTC, datetime
+from time import monotonic
+from typing import Any
+
+import httpx
+
+from redmine_rag.core.config import get_settings
+from redmine_rag.db.session import get_session_factory
+from redmine_rag.indexing.vector_store import LocalNumpyVectorStore
+from redmine_rag.ingestion.redmine_client import RedmineClient
+from redmine_rag.ingestion.repository import IngestionRepository
+from redmine_rag.ingestion.sync_pipeline import (
+    fetch_each,
+    get_or_create_sync_state,
+    iter_paginated,
+)
+from redmine_rag.services.retrieval_cache_service import mark_retrieval_index_updated
+
+logger = logging.getLogger(__name__)
+
+SWEEP_STATE_KEY = "redmine_deletion_sweep"
+
+
+async def run_deletion_sweep(
+    project_ids: list[int],
+    *,
+    client: RedmineClient | None = None,
+) -> dict[str, Any]:
+    """Tombstone local issues that were deleted in Redmine or left the synced projects.
+
+    Pages through an id-only issue listing, diffs it against local issues and confirms
+    each candidate with a detail probe before removing it together with its journals,
+    attachments, chunks and vectors. Issues created after the sweep started are never
+    candidates, so a concurrent sync cannot race them into deletion.
+    """
+
+    settings = get_settings()
+    effective_project_ids = project_ids or settings.redmine_project_ids
+    started_at = datetime.now(UTC)
+    sweep_started = monotonic()
+
+    summary: dict[str, Any] = {
+        "project_ids": effective_project_ids,
+        "pages": 0,
+        "issues_listed": 0,
+        "issues_local": 0,
+        "candidates": 0,
+        "issues_kept": 0,
+        "probes_failed": 0,
+        "issues_tombstoned": 0,
+        "tombstone_reasons": {},
+        "deleted": {},
+        "vectors_removed": 0,
+        "aborted": None,
+        "duration_s": 0.0,
+        "rate_limit": {},
+        "finished_at": None,
+    }
+
+    logger.info("Starting Redmine deletion sweep", extra={"project_ids": effective_project_ids})
+
+    session_factory = get_session_factory()
+    sweep_client = client or RedmineClient()
+    async with sweep_client, session_factory() as session:
+        repo = IngestionRepository(session)
+        sweep_state = await get_or_create_sync_state(session, key=SWEEP_STATE_KEY)
+        sweep_state.last_sync_at = started_at
+        sweep_state.last_error = None
+        await session.commit()
+
+        try:
+            remote_ids: set[int] = set()
+            async for page in iter_paginated(
+                lambda limit, offset: sweep_client.get_issue_ids(
+                    project_ids=effective_project_ids, limit=limit, offset=offset
+                ),
+                payload_key="issues",
+            ):
+                summary["pages"] += 1
+                remote_ids.update(int(item["id"]) for item in page if item.get("id") is not None)
+            summary["issues_listed"] = len(remote_ids)
+
+            local = await repo.list_issue_projects(
+                project_ids=effective_project_ids, created_before=started_at
+            )
+            summary["issues_local"] = len(local)
+            candidates = sorted(set(local) - remote_ids)
+            summary["candidates"] = len(candidates)
+
+            # An empty or truncated listing (lost permissions, proxy error page) must not
+            # wipe the index; a mass deletion is left for an operator to confirm. A handful
+            # of missing issues is always allowed, or a tiny project could never lose one.
+            if (
+                len(candidates) > settings.sync_deletion_min_count
+                and len(candidates) > len(local) * settings.sync_deletion_max_ratio
+            ):
+                summary["aborted"] = (
+                    f"{len(candidates)} of {len(local)} local issues missing from Redmine "
+                    f"exceeds SYNC_DELETION_MAX_RATIO={settings.sync_deletion_max_ratio}"
+                    f" and SYNC_DELETION_MIN_COUNT={settings.sync_deletion_min_count}"
+                )
+                candidates = []
+
+            doomed: dict[int, tuple[int | None, str]] = {}
+            for issue_id, outcome in await fetch_each(candidates, sweep_client.get_issue):
+                reason = _tombstone_reason(outcome, effective_project_ids)
+                if reason is not None:
+                    doomed[issue_id] = (local.get(issue_id), reason)
+                elif isinstance(outcome, httpx.HTTPError):
+                    summary["probes_failed"] += 1
+                else:
+                    # Listed late or paged past while the listing shifted; still in scope.
+                    summary["issues_kept"] += 1
+
+            result = await repo.tombstone_issues(doomed, deleted_at=started_at)
+            summary["issues_tombstoned"] = result.issues
+            summary["deleted"] = result.to_dict()
+            for _, reason in doomed.values():
+                summary["tombstone_reasons"][reason] = (
+                    summary["tombstone_reasons"].get(reason, 0) + 1
+                )
+            if result.chunks:
+                await mark_retrieval_index_updated(session)
+
+            sweep_state.last_success_at = datetime.now(UTC)
+            sweep_state.last_error = summary["aborted"]
+            await session.commit()
+
+            if result.embedding_keys:
+                vector_store = LocalNumpyVectorStore(
+                    index_path=settings.vector_index_path,
+                    meta_path=settings.vector_meta_path,
+                )
+                summary["vectors_removed"] = vector_store.remove_keys(set(result.embedding_keys))
+                vector_store.save()
+
+            summary["rate_limit"] = sweep_client.rate_limit_snapshot().to_dict()
+            summary["duration_s"] = round(monotonic() - sweep_started, 4)
+            summary["finished_at"] = datetime.now(UTC).isoformat()
+        except Exception as exc:  # noqa: BLE001
+            await session.rollback()
+            sweep_state.last_error = str(exc)
+            await session.commit()
+            logger.exception(
+                "Redmine deletion sweep failed", extra={"project_ids": effective_project_ids}
+            )
+            raise
+
+    logger.info("Finished Redmine deletion sweep", extra=summary)
+    return summary
+
+
+def _tombstone_reason(
+    outcome: dict[str, Any] | httpx.HTTPError, project_ids: list[int]
+) -> str | None:
+    if isinstance(outcome, httpx.HTTPStatusError):
+        if outcome.response.status_code == 404:
+            return "deleted"
+        if outcome.response.status_code == 403:
+            return "not_visible"
+        return None
+    if isinstance(outcome, httpx.HTTPError):
+        return None
+    project = (outcome.get("issue") or {}).get("project") or {}
+    if project_ids and project.get("id") not in project_ids:
+        return "moved"
+    return None
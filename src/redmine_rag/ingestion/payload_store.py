@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import sqlite3
+import zlib
+from hashlib import sha256
+from typing import Any
+
+import orjson
+
+PAYLOAD_CODEC = "zlib"
+_ZLIB_LEVEL = 6
+
+# Raw rows reference `raw_payload.hash`; a blob no row points at is garbage.
+PRUNE_ORPHAN_PAYLOADS_SQL = """
+DELETE FROM raw_payload
+WHERE hash NOT IN (
+  SELECT payload_hash FROM raw_entity WHERE payload_hash IS NOT NULL
+  UNION SELECT payload_hash FROM raw_issue
+  UNION SELECT payload_hash FROM raw_journal
+  UNION SELECT payload_hash FROM raw_wiki
+)
+"""
+
+
+def canonical_payload(payload: Any) -> bytes:
+    """Key-sorted JSON bytes: the unit that is hashed and compressed."""
+
+    return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+
+
+def payload_hash(payload: Any) -> str:
+    """Stable content hash of a Redmine payload, independent of key order."""
+
+    return sha256(canonical_payload(payload)).hexdigest()
+
+
+def compress_payload(data: bytes) -> bytes:
+    return zlib.compress(data, _ZLIB_LEVEL)
+
+
+def decompress_payload(codec: str, data: bytes) -> Any:
+    if codec != PAYLOAD_CODEC:
+        raise ValueError(f"Unsupported raw payload codec: {codec}")
+    return orjson.loads(zlib.decompress(data))
+
+
+def prune_orphan_payloads(conn: sqlite3.Connection) -> int | None:
+    """Delete unreferenced blobs; `None` when the store table does not exist yet."""
+
+    try:
+        deleted = conn.execute(PRUNE_ORPHAN_PAYLOADS_SQL).rowcount
+    except sqlite3.OperationalError:
+        return None
+    conn.commit()
+    return deleted
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from time import monotonic
+from typing import Any
+
+import httpx
+
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+_LATENCY_EWMA_ALPHA = 0.2
+
+
+@dataclass(slots=True, frozen=True)
+class RateLimiterSnapshot:
+    concurrency_limit: float
+    min_concurrency: int
+    max_concurrency: int
+    in_flight: int
+    rate_limit_rps: float
+    latency_target_s: float
+    latency_ewma_ms: float | None
+    requests: int
+    throttled_responses: int
+    slow_responses: int
+    decreases: int
+    retry_after_waits: int
+    wait_s_total: float
+    blocked_for_s: float
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> RateLimiterSnapshot:
+        return cls(
+            concurrency_limit=float(payload["concurrency_limit"]),
+            min_concurrency=int(payload["min_concurrency"]),
+            max_concurrency=int(payload["max_concurrency"]),
+            in_flight=int(payload["in_flight"]),
+            rate_limit_rps=float(payload["rate_limit_rps"]),
+            latency_target_s=float(payload["latency_target_s"]),
+            latency_ewma_ms=(
+                float(payload["latency_ewma_ms"])
+                if payload.get("latency_ewma_ms") is not None
+                else None
+            ),
+            requests=int(payload["requests"]),
+            throttled_responses=int(payload["throttled_responses"]),
+            slow_responses=int(payload["slow_responses"]),
+            decreases=int(payload["decreases"]),
+            retry_after_waits=int(payload["retry_after_waits"]),
+            wait_s_total=float(payload["wait_s_total"]),
+            blocked_for_s=float(payload["blocked_for_s"]),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "concurrency_limit": self.concurrency_limit,
+            "min_concurrency": self.min_concurrency,
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "rate_limit_rps": self.rate_limit_rps,
+            "latency_target_s": self.latency_target_s,
+            "latency_ewma_ms": self.latency_ewma_ms,
+            "requests": self.requests,
+            "throttled_responses": self.throttled_responses,
+            "slow_responses": self.slow_responses,
+            "decreases": self.decreases,
+            "retry_after_waits": self.retry_after_waits,
+            "wait_s_total": self.wait_s_total,
+            "blocked_for_s": self.blocked_for_s,
+        }
+
+
+class AdaptiveRateLimiter:
+    """Token bucket plus AIMD concurrency window for outbound Redmine requests.
+
+    The window grows by ~1 slot per window of fast successes and halves on 429/503 or
+    responses slower than `latency_target_s` (at most once per target interval).
+    `Retry-After` pauses every caller until the server-provided deadline.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate_limit_rps: float,
+        burst: int,
+        min_concurrency: int,
+        max_concurrency: int,
+        latency_target_s: float,
+        retry_after_max_s: float,
+    ) -> None:
+        self._rate_limit_rps = rate_limit_rps
+        self._burst = float(burst)
+        self._min_concurrency = min_concurrency
+        self._max_concurrency = max(min_concurrency, max_concurrency)
+        self._latency_target_s = latency_target_s
+        self._retry_after_max_s = retry_after_max_s
+
+        self._limit = float(self._max_concurrency)
+        self._in_flight = 0
+        self._tokens = self._burst
+        self._tokens_at = monotonic()
+        self._blocked_until = 0.0
+        self._last_decrease_at = float("-inf")
+        self._condition = asyncio.Condition()
+
+        self._latency_ewma_s: float | None = None
+        self._requests = 0
+        self._throttled = 0
+        self._slow = 0
+        self._decreases = 0
+        self._retry_after_waits = 0
+        self._wait_s_total = 0.0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        started = monotonic()
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self._limit))
+            self._in_flight += 1
+        try:
+            await self._wait_for_token()
+            self._wait_s_total += monotonic() - started
+            yield
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+            _publish(self.snapshot())
+
+    def observe(self, response: httpx.Response, *, latency_s: float) -> None:
+        now = monotonic()
+        self._requests += 1
+        self._latency_ewma_s = (
+            latency_s
+            if self._latency_ewma_s is None
+            else (1 - _LATENCY_EWMA_ALPHA) * self._latency_ewma_s + _LATENCY_EWMA_ALPHA * latency_s
+        )
+
+        if response.status_code in THROTTLE_STATUS_CODES:
+            self._throttled += 1
+            retry_after_s = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after_s is not None:
+                self._retry_after_waits += 1
+                deadline = now + min(retry_after_s, self._retry_after_max_s)
+                self._blocked_until = max(self._blocked_until, deadline)
+            self._decrease(now)
+        elif self._latency_target_s > 0 and latency_s > self._latency_target_s:
+            self._slow += 1
+            self._decrease(now)
+        elif response.is_success:
+            self._limit = min(float(self._max_concurrency), self._limit + 1 / self._limit)
+
+    def snapshot(self) -> RateLimiterSnapshot:
+        return RateLimiterSnapshot(
+            concurrency_limit=round(self._limit, 2),
+            min_concurrency=self._min_concurrency,
+            max_concurrency=self._max_concurrency,
+            in_flight=self._in_flight,
+            rate_limit_rps=self._rate_limit_rps,
+            latency_target_s=self._latency_target_s,
+            latency_ewma_ms=(
+                round(self._latency_ewma_s * 1000, 2) if self._latency_ewma_s is not None else None
+            ),
+            requests=self._requests,
+            throttled_responses=self._throttled,
+            slow_responses=self._slow,
+            decreases=self._decreases,
+            retry_after_waits=self._retry_after_waits,
+            wait_s_total=round(self._wait_s_total, 4),
+            blocked_for_s=round(max(0.0, self._blocked_until - monotonic()), 4),
+        )
+
+    def _decrease(self, now: float) -> None:
+        # One congestion signal per interval: a burst of 429s halves the window once.
+        if now - self._last_decrease_at >= max(self._latency_target_s, 1.0):
+            self._limit = max(float(self._min_concurrency), self._limit / 2)
+            self._last_decrease_at = now
+            self._decreases += 1
+
+    async def _wait_for_token(self) -> None:
+        while True:
+            now = monotonic()
+            delay = self._blocked_until - now
+            if delay <= 0 and self._rate_limit_rps > 0:
+                self._tokens = min(
+                    self._burst, self._tokens + (now - self._tokens_at) * self._rate_limit_rps
+                )
+                self._tokens_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self._rate_limit_rps
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse `Retry-After` as delta-seconds or an HTTP date; `None` when absent/invalid."""
+
+    if value is None or not value.strip():
+        return None
+    text = value.strip()
+    if text.isdigit():
+        return float(text)
+    try:
+        deadline = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        return None
+    if deadline.tzinfo is None:
+        deadline = deadline.replace(tzinfo=UTC)
+    return max(0.0, (deadline - datetime.now(UTC)).total_seconds())
+
+
+_LOCK = Lock()
+_LAST_SNAPSHOT: RateLimiterSnapshot | None = None
+
+
+def get_rate_limiter_snapshot() -> RateLimiterSnapshot | None:
+    """Latest limiter state observed in this process, for health checks."""
+
+    with _LOCK:
+        return _LAST_SNAPSHOT
+
+
+def reset_rate_limiter_snapshot() -> None:
+    global _LAST_SNAPSHOT
+    with _LOCK:
+        _LAST_SNAPSHOT = None
+
+
+def _publish(snapshot: RateLimiterSnapshot) -> None:
+    global _LAST_SNAPSHOT
+    with _LOCK:
+        _LAST_SNAPSHOT = snapshot
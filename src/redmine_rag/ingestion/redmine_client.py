@@ -2,17 +2,45 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
+from importlib.util import find_spec
 from ipaddress import ip_address
-from typing import Any
+from time import monotonic
+from types import TracebackType
+from typing import Any, Self
 from urllib.parse import urlparse
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+import orjson
+from tenacity import RetryCallState, retry, stop_after_attempt, wait_exponential
 
 from redmine_rag.core.config import get_settings
+from redmine_rag.ingestion.cassette import LatencyProfile, RecordingTransport, ReplayTransport
+from redmine_rag.ingestion.rate_limiter import (
+    THROTTLE_STATUS_CODES,
+    AdaptiveRateLimiter,
+    RateLimiterSnapshot,
+    parse_retry_after,
+)
 
 logger = logging.getLogger(__name__)
 
+_exponential_wait = wait_exponential(min=1, max=10)
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    exc = retry_state.outcome.exception() if retry_state.outcome is not None else None
+    if (
+        isinstance(exc, httpx.HTTPStatusError)
+        and exc.response.status_code in THROTTLE_STATUS_CODES
+        and parse_retry_after(exc.response.headers.get("Retry-After")) is not None
+    ):
+        # The rate limiter already holds every request until the Retry-After deadline.
+        return 0.0
+    return _exponential_wait(retry_state)
+
+
+_redmine_retry = retry(wait=_retry_wait, stop=stop_after_attempt(3), reraise=True)
+
 
 class RedmineClient:
     def __init__(
@@ -31,12 +59,62 @@ class RedmineClient:
         self._transport = transport
         self._extra_headers = extra_headers or {}
         self._timeout_s = settings.redmine_http_timeout_s
+        self._limits = httpx.Limits(
+            max_connections=settings.redmine_http_max_connections,
+            max_keepalive_connections=settings.redmine_http_max_keepalive_connections,
+            keepalive_expiry=settings.redmine_http_keepalive_expiry_s,
+        )
+        self._http2 = settings.redmine_http2 and _http2_available()
+        if settings.redmine_cassette_mode == "replay":
+            self._transport = ReplayTransport(
+                settings.redmine_cassette_path, latency=LatencyProfile.from_settings(settings)
+            )
+        elif settings.redmine_cassette_mode == "record":
+            self._transport = RecordingTransport(
+                settings.redmine_cassette_path,
+                inner=transport
+                or httpx.AsyncHTTPTransport(
+                    verify=self._verify_ssl, limits=self._limits, http2=self._http2
+                ),
+            )
+        self._client: httpx.AsyncClient | None = None
+        self._rate_limiter = AdaptiveRateLimiter(
+            rate_limit_rps=settings.redmine_rate_limit_rps,
+            burst=settings.redmine_rate_limit_burst,
+            min_concurrency=settings.redmine_adaptive_min_concurrency,
+            max_concurrency=settings.redmine_adaptive_max_concurrency,
+            latency_target_s=settings.redmine_adaptive_latency_target_s,
+            retry_after_max_s=settings.redmine_retry_after_max_s,
+        )
         self._allowed_hosts = {
             host.strip().lower() for host in settings.redmine_allowed_hosts if host.strip()
         }
         self._validate_outbound_base_url()
 
-    @retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(3), reraise=True)
+    async def __aenter__(self) -> Self:
+        self._get_client()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close pooled connections; the next request lazily opens a new pool."""
+
+        client = self._client
+        self._client = None
+        if client is not None:
+            await client.aclose()
+
+    def rate_limit_snapshot(self) -> RateLimiterSnapshot:
+        return self._rate_limiter.snapshot()
+
+    @_redmine_retry
     async def get_issues(
         self,
         updated_since: datetime | None,
@@ -64,31 +142,49 @@ class RedmineClient:
 
         return await self._get_json("/issues.json", params=params)
 
-    @retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(3), reraise=True)
+    @_redmine_retry
+    async def get_issue_ids(
+        self,
+        project_ids: list[int],
+        limit: int = 100,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        """List issues of every status without includes; callers only read `id`."""
+
+        params: dict[str, str | int] = {"limit": limit, "offset": offset, "status_id": "*"}
+        if project_ids:
+            params["project_id"] = ",".join(str(project_id) for project_id in project_ids)
+        return await self._get_json("/issues.json", params=params)
+
+    async def get_issue(self, issue_id: int) -> dict[str, Any]:
+        # Not retried: 404/403 are the answers deletion probes look for.
+        return await self._get_json(f"/issues/{issue_id}.json")
+
+    @_redmine_retry
     async def get_projects(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
         return await self._get_json("/projects.json", params={"limit": limit, "offset": offset})
 
-    @retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(3), reraise=True)
+    @_redmine_retry
     async def get_users(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
         return await self._get_json("/users.json", params={"limit": limit, "offset": offset})
 
-    @retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(3), reraise=True)
+    @_redmine_retry
     async def get_groups(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
         return await self._get_json("/groups.json", params={"limit": limit, "offset": offset})
 
-    @retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(3), reraise=True)
+    @_redmine_retry
     async def get_trackers(self) -> dict[str, Any]:
         return await self._get_json("/trackers.json")
 
-    @retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(3), reraise=True)
+    @_redmine_retry
     async def get_issue_statuses(self) -> dict[str, Any]:
         return await self._get_json("/issue_statuses.json")
 
-    @retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(3), reraise=True)
+    @_redmine_retry
     async def get_issue_priorities(self) -> dict[str, Any]:
         return await self._get_json("/enumerations/issue_priorities.json")
 
-    @retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(3), reraise=True)
+    @_redmine_retry
     async def get_time_entries(
         self,
         updated_since: datetime | None,
@@ -106,7 +202,7 @@ class RedmineClient:
             params["project_id"] = ",".join(str(project_id) for project_id in project_ids)
         return await self._get_json("/time_entries.json", params=params)
 
-    @retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(3), reraise=True)
+    @_redmine_retry
     async def get_news(
         self,
         project_ids: list[int],
@@ -121,7 +217,7 @@ class RedmineClient:
             params["project_id"] = ",".join(str(project_id) for project_id in project_ids)
         return await self._get_json("/news.json", params=params)
 
-    @retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(3), reraise=True)
+    @_redmine_retry
     async def get_documents(
         self,
         project_ids: list[int],
@@ -136,7 +232,7 @@ class RedmineClient:
             params["project_id"] = ",".join(str(project_id) for project_id in project_ids)
         return await self._get_json("/documents.json", params=params)
 
-    @retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(3), reraise=True)
+    @_redmine_retry
     async def get_files(
         self,
         project_ids: list[int],
@@ -151,7 +247,7 @@ class RedmineClient:
             params["project_id"] = ",".join(str(project_id) for project_id in project_ids)
         return await self._get_json("/files.json", params=params)
 
-    @retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(3), reraise=True)
+    @_redmine_retry
     async def get_board_topics(
         self, board_id: int, limit: int = 100, offset: int = 0
     ) -> dict[str, Any]:
@@ -160,27 +256,35 @@ class RedmineClient:
             params={"limit": limit, "offset": offset},
         )
 
-    @retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(3), reraise=True)
+    @_redmine_retry
     async def get_message(self, message_id: int) -> dict[str, Any]:
         return await self._get_json(f"/messages/{message_id}.json")
 
-    @retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(3), reraise=True)
+    @_redmine_retry
     async def get_wiki_page(self, project_identifier: str, title: str) -> dict[str, Any]:
         return await self._get_json(f"/projects/{project_identifier}/wiki/{title}.json")
 
     async def _get_json(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         url = f"{self._base_url}{path}"
-        headers = {"X-Redmine-API-Key": self._api_key, **self._extra_headers}
-
-        async with httpx.AsyncClient(
-            timeout=self._timeout_s,
-            verify=self._verify_ssl,
-            transport=self._transport,
-        ) as client:
-            response = await client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            payload: dict[str, Any] = response.json()
-            return payload
+        async with self._rate_limiter.slot():
+            started = monotonic()
+            response = await self._get_client().get(url, params=params)
+            self._rate_limiter.observe(response, latency_s=monotonic() - started)
+        response.raise_for_status()
+        payload: dict[str, Any] = orjson.loads(response.content)
+        return payload
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout_s,
+                verify=self._verify_ssl,
+                transport=self._transport,
+                limits=self._limits,
+                http2=self._http2,
+                headers={"X-Redmine-API-Key": self._api_key, **self._extra_headers},
+            )
+        return self._client
 
     def _validate_outbound_base_url(self) -> None:
         parsed = urlparse(self._base_url)
@@ -206,6 +310,13 @@ class RedmineClient:
             )
 
 
+def _http2_available() -> bool:
+    if find_spec("h2") is not None:
+        return True
+    logger.warning("REDMINE_HTTP2 requested but 'h2' is not installed; using HTTP/1.1")
+    return False
+
+
 def _is_private_ip(hostname: str) -> bool:
     try:
         ip = ip_address(hostname)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import sqlite3
+from dataclasses import dataclass, field
 from datetime import datetime
+from hashlib import sha256
+from time import perf_counter
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, and_, delete, func, or_, select, tuple_, update
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,10 +15,14 @@ from redmine_rag.db.models import (
     Attachment,
     Board,
     CustomField,
+    DocChunk,
     Document,
+    EntityTombstone,
     Group,
     Issue,
+    IssueMetric,
     IssuePriority,
+    IssueProperty,
     IssueRelation,
     IssueStatus,
     IssueWatcher,
@@ -25,6 +33,7 @@ from redmine_rag.db.models import (
     RawEntity,
     RawIssue,
     RawJournal,
+    RawPayload,
     RawWiki,
     TimeEntry,
     Tracker,
@@ -32,26 +41,128 @@ from redmine_rag.db.models import (
     WikiPage,
     WikiVersion,
 )
+from redmine_rag.ingestion.payload_store import (
+    PAYLOAD_CODEC,
+    canonical_payload,
+    compress_payload,
+    decompress_payload,
+)
+
+# Refreshed on every fetch; a difference here alone is not a content change.
+_VOLATILE_COLUMNS = frozenset({"fetched_at"})
+
+
+# Bound-variable ceiling of the linked SQLite library (999 before 3.32, 32766 after).
+SQLITE_MAX_VARIABLES = sqlite3.connect(":memory:").getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+
+_UPSERT_STATEMENTS: dict[tuple[str, tuple[str, ...]], Any] = {}
+
+
+@dataclass(slots=True)
+class UpsertStats:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated + self.unchanged
+
+    @property
+    def rows_per_s(self) -> float | None:
+        return round(self.total / self.elapsed_s, 1) if self.elapsed_s > 0 else None
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> UpsertStats:
+        return cls(
+            inserted=int(payload.get("inserted", 0)),
+            updated=int(payload.get("updated", 0)),
+            unchanged=int(payload.get("unchanged", 0)),
+            elapsed_s=float(payload.get("elapsed_s", 0.0)),
+        )
+
+    def add(self, other: UpsertStats) -> None:
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.unchanged += other.unchanged
+        self.elapsed_s += other.elapsed_s
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "unchanged": self.unchanged,
+            "elapsed_s": round(self.elapsed_s, 4),
+            "rows_per_s": self.rows_per_s,
+        }
+
+
+@dataclass(slots=True)
+class TombstoneResult:
+    issues: int = 0
+    journals: int = 0
+    attachments: int = 0
+    relations: int = 0
+    watchers: int = 0
+    time_entries_detached: int = 0
+    chunks: int = 0
+    raw_entities: int = 0
+    embedding_keys: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "issues": self.issues,
+            "journals": self.journals,
+            "attachments": self.attachments,
+            "relations": self.relations,
+            "watchers": self.watchers,
+            "time_entries_detached": self.time_entries_detached,
+            "chunks": self.chunks,
+            "raw_entities": self.raw_entities,
+        }
 
 
 class IngestionRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
+        self.upsert_stats: dict[str, UpsertStats] = {}
 
     async def upsert_raw_entities(self, rows: list[dict[str, Any]]) -> int:
+        rows = await self._store_row_payloads(rows)
         return await self._upsert_rows(
             RawEntity,
             rows,
             conflict_columns=("entity_type", "entity_id", "endpoint"),
         )
 
+    async def load_raw_entity_hashes(
+        self,
+        *,
+        entity_type: str,
+        endpoint: str,
+        entity_ids: list[str],
+    ) -> dict[str, str | None]:
+        if not entity_ids:
+            return {}
+        rows = await self._session.execute(
+            select(RawEntity.entity_id, RawEntity.payload_hash).where(
+                RawEntity.entity_type == entity_type,
+                RawEntity.endpoint == endpoint,
+                RawEntity.entity_id.in_(entity_ids),
+            )
+        )
+        return {str(entity_id): hash_value for entity_id, hash_value in rows.all()}
+
     async def upsert_raw_entity(self, row: dict[str, Any]) -> None:
         await self.upsert_raw_entities([row])
 
     async def upsert_raw_issues(self, rows: list[dict[str, Any]]) -> int:
+        rows = await self._store_row_payloads(rows)
         return await self._upsert_rows(RawIssue, rows, conflict_columns=("id",))
 
     async def upsert_raw_journals(self, rows: list[dict[str, Any]]) -> int:
+        rows = await self._store_row_payloads(rows)
         return await self._upsert_rows(RawJournal, rows, conflict_columns=("id",))
 
     async def upsert_raw_wiki(
@@ -63,6 +174,7 @@ class IngestionRepository:
         fetched_at: datetime,
         payload: dict[str, Any],
     ) -> None:
+        (hash_value,) = await self._store_payloads([payload])
         existing = await self._session.scalar(
             select(RawWiki).where(RawWiki.project_id == project_id, RawWiki.title == title)
         )
@@ -73,14 +185,82 @@ class IngestionRepository:
                     title=title,
                     updated_on=updated_on,
                     fetched_at=fetched_at,
-                    payload=payload,
+                    payload_hash=hash_value,
                 )
             )
             return
 
         existing.updated_on = updated_on
         existing.fetched_at = fetched_at
-        existing.payload = payload
+        existing.payload_hash = hash_value
+
+    async def load_raw_payloads(self, hashes: list[str]) -> dict[str, Any]:
+        """Decompress stored payloads by content hash; unknown hashes are omitted."""
+
+        payloads: dict[str, Any] = {}
+        for chunk in _chunks(list(dict.fromkeys(hashes)), SQLITE_MAX_VARIABLES):
+            rows = await self._session.execute(
+                select(RawPayload.hash, RawPayload.codec, RawPayload.data).where(
+                    RawPayload.hash.in_(chunk)
+                )
+            )
+            for hash_value, codec, data in rows.all():
+                payloads[hash_value] = decompress_payload(codec, data)
+        return payloads
+
+    async def _store_row_payloads(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        hashes = await self._store_payloads([row["payload"] for row in rows])
+        return [
+            {**{key: value for key, value in row.items() if key != "payload"}, "payload_hash": h}
+            for row, h in zip(rows, hashes, strict=True)
+        ]
+
+    async def _store_payloads(self, payloads: list[Any]) -> list[str]:
+        """Write each distinct payload once, compressed and keyed by its content hash.
+
+        Only blobs missing from `raw_payload` are compressed; overlap-window refetches of
+        identical content reuse the stored blob and count as `unchanged`.
+        """
+
+        started = perf_counter()
+        hashes: list[str] = []
+        encoded: dict[str, bytes] = {}
+        for payload in payloads:
+            data = canonical_payload(payload)
+            hash_value = sha256(data).hexdigest()
+            hashes.append(hash_value)
+            encoded.setdefault(hash_value, data)
+
+        missing = dict(encoded)
+        for chunk in _chunks(list(encoded), SQLITE_MAX_VARIABLES):
+            for hash_value in await self._session.scalars(
+                select(RawPayload.hash).where(RawPayload.hash.in_(chunk))
+            ):
+                missing.pop(hash_value, None)
+
+        if missing:
+            connection = await self._session.connection()
+            await connection.execute(
+                sqlite_insert(RawPayload).on_conflict_do_nothing(index_elements=["hash"]),
+                [
+                    {
+                        "hash": hash_value,
+                        "codec": PAYLOAD_CODEC,
+                        "size_bytes": len(data),
+                        "data": compress_payload(data),
+                    }
+                    for hash_value, data in missing.items()
+                ],
+            )
+
+        self.upsert_stats.setdefault("raw_payload", UpsertStats()).add(
+            UpsertStats(
+                inserted=len(missing),
+                unchanged=len(payloads) - len(missing),
+                elapsed_s=perf_counter() - started,
+            )
+        )
+        return hashes
 
     async def upsert_projects(self, rows: list[dict[str, Any]]) -> int:
         return await self._upsert_rows(Project, rows, conflict_columns=("id",))
@@ -193,6 +373,136 @@ class IngestionRepository:
             return None
         return int(project_id)
 
+    async def list_issue_projects(
+        self, *, project_ids: list[int], created_before: datetime
+    ) -> dict[int, int]:
+        """Map local issue ids to project ids, limited to issues Redmine created before a cutoff."""
+
+        stmt = select(Issue.id, Issue.project_id).where(Issue.created_on < created_before)
+        if project_ids:
+            stmt = stmt.where(Issue.project_id.in_(project_ids))
+        rows = (await self._session.execute(stmt)).all()
+        return {int(issue_id): int(project_id) for issue_id, project_id in rows}
+
+    async def tombstone_issues(
+        self, issues: dict[int, tuple[int | None, str]], *, deleted_at: datetime
+    ) -> TombstoneResult:
+        """Delete issues with their journals, attachments, links and chunks; record tombstones.
+
+        `issues` maps an issue id to its project id and the tombstone reason. Raw copies
+        (`raw_issue`, `raw_journal` and the issue, journal and attachment rows in
+        `raw_entity`) go too; their payload blobs are left to `prune_orphan_payloads`.
+        Time entries are kept but detached from the issue. Embedding keys of the deleted
+        chunks are returned so the caller can drop their vectors.
+        """
+
+        result = TombstoneResult()
+        if not issues:
+            return result
+
+        connection = await self._session.connection()
+        # Each id list is bound several times per statement (chunk filter + subqueries).
+        for chunk in _chunks(sorted(issues), max(1, SQLITE_MAX_VARIABLES // 4)):
+            journal_ids = select(Journal.id).where(Journal.issue_id.in_(chunk))
+            attachment_filter = or_(
+                Attachment.issue_id.in_(chunk), Attachment.journal_id.in_(journal_ids)
+            )
+            chunk_filter = or_(
+                and_(DocChunk.source_type == "issue", DocChunk.issue_id.in_(chunk)),
+                and_(DocChunk.source_type == "journal", DocChunk.journal_id.in_(journal_ids)),
+                and_(
+                    DocChunk.source_type == "attachment",
+                    DocChunk.attachment_id.in_(select(Attachment.id).where(attachment_filter)),
+                ),
+            )
+            result.embedding_keys.extend(
+                str(key)
+                for key in await self._session.scalars(
+                    select(DocChunk.embedding_key).where(
+                        chunk_filter, DocChunk.embedding_key.is_not(None)
+                    )
+                )
+            )
+            result.chunks += _rowcount(
+                await connection.execute(delete(DocChunk).where(chunk_filter))
+            )
+            result.attachments += _rowcount(
+                await connection.execute(delete(Attachment).where(attachment_filter))
+            )
+            result.relations += _rowcount(
+                await connection.execute(
+                    delete(IssueRelation).where(
+                        or_(
+                            IssueRelation.issue_from_id.in_(chunk),
+                            IssueRelation.issue_to_id.in_(chunk),
+                        )
+                    )
+                )
+            )
+            result.watchers += _rowcount(
+                await connection.execute(
+                    delete(IssueWatcher).where(IssueWatcher.issue_id.in_(chunk))
+                )
+            )
+            await connection.execute(delete(IssueMetric).where(IssueMetric.issue_id.in_(chunk)))
+            await connection.execute(delete(IssueProperty).where(IssueProperty.issue_id.in_(chunk)))
+            result.time_entries_detached += _rowcount(
+                await connection.execute(
+                    update(TimeEntry).where(TimeEntry.issue_id.in_(chunk)).values(issue_id=None)
+                )
+            )
+            # Journal and attachment raw rows are keyed by the issue detail endpoint.
+            result.raw_entities += _rowcount(
+                await connection.execute(
+                    delete(RawEntity).where(
+                        or_(
+                            and_(
+                                RawEntity.entity_type == "issue",
+                                RawEntity.entity_id.in_([str(issue_id) for issue_id in chunk]),
+                            ),
+                            and_(
+                                RawEntity.entity_type.in_(("journal", "attachment")),
+                                RawEntity.endpoint.in_(
+                                    [f"/issues/{issue_id}.json" for issue_id in chunk]
+                                ),
+                            ),
+                        )
+                    )
+                )
+            )
+            await connection.execute(delete(RawJournal).where(RawJournal.issue_id.in_(chunk)))
+            result.journals += _rowcount(
+                await connection.execute(delete(Journal).where(Journal.issue_id.in_(chunk)))
+            )
+            await connection.execute(delete(RawIssue).where(RawIssue.id.in_(chunk)))
+            result.issues += _rowcount(
+                await connection.execute(delete(Issue).where(Issue.id.in_(chunk)))
+            )
+
+        stmt = sqlite_insert(EntityTombstone)
+        await connection.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["entity_type", "entity_id"],
+                set_={
+                    "project_id": stmt.excluded.project_id,
+                    "reason": stmt.excluded.reason,
+                    "deleted_at": stmt.excluded.deleted_at,
+                    "updated_at": func.now(),
+                },
+            ),
+            [
+                {
+                    "entity_type": "issue",
+                    "entity_id": str(issue_id),
+                    "project_id": project_id,
+                    "reason": reason,
+                    "deleted_at": deleted_at,
+                }
+                for issue_id, (project_id, reason) in issues.items()
+            ],
+        )
+        return result
+
     async def _upsert_rows(
         self,
         model: type[Any],
@@ -200,23 +510,102 @@ class IngestionRepository:
         *,
         conflict_columns: tuple[str, ...],
     ) -> int:
+        """Insert new rows and update only rows whose content differs.
+
+        Returns the number of rows processed; the inserted/updated/unchanged split is
+        accumulated per table in `upsert_stats`.
+        """
+
         if not rows:
             return 0
 
-        stmt = sqlite_insert(model).values(rows)
-        set_columns: dict[str, Any] = {}
-        for column in model.__table__.columns:
-            if column.name in conflict_columns or column.name in {"id", "created_at", "updated_at"}:
-                continue
-            set_columns[column.name] = getattr(stmt.excluded, column.name)
-
-        if set_columns:
-            stmt = stmt.on_conflict_do_update(
-                index_elements=list(conflict_columns),
-                set_=set_columns,
+        table = model.__table__
+        stmt = _upsert_statement(model, conflict_columns)
+        key_columns = tuple_(*(table.c[name] for name in conflict_columns))
+        # The key pre-count binds one variable per key column per row; keep each chunk
+        # under the SQLite limit so large pages never fail with "too many SQL variables".
+        chunk_size = max(1, SQLITE_MAX_VARIABLES // max(len(rows[0]), len(conflict_columns)))
+
+        counts = UpsertStats()
+        started = perf_counter()
+        for chunk_start in range(0, len(rows), chunk_size):
+            chunk = rows[chunk_start : chunk_start + chunk_size]
+            keys = {tuple(row[name] for name in conflict_columns) for row in chunk}
+            existing = int(
+                await self._session.scalar(
+                    select(func.count()).select_from(table).where(key_columns.in_(list(keys)))
+                )
+                or 0
             )
-        else:
-            stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
-
-        await self._session.execute(stmt)
+            # Core execution on the session's connection: a list of parameter sets runs one
+            # prepared statement via executemany instead of the ORM bulk-insert path.
+            connection = await self._session.connection()
+            result = await connection.execute(stmt, chunk)
+            # SQLite counts a row as changed only when inserted or when the DO UPDATE WHERE
+            # held; executemany sums the per-row counts.
+            affected = max(int(result.rowcount or 0), 0)
+            inserted = max(len(keys) - existing, 0)
+            updated = max(affected - inserted, 0)
+            counts.add(
+                UpsertStats(
+                    inserted=inserted,
+                    updated=updated,
+                    unchanged=max(len(chunk) - inserted - updated, 0),
+                )
+            )
+        counts.elapsed_s = perf_counter() - started
+        self.upsert_stats.setdefault(table.name, UpsertStats()).add(counts)
         return len(rows)
+
+
+def _chunks[T](items: list[T], size: int) -> list[list[T]]:
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
+
+def _rowcount(result: Any) -> int:
+    return max(int(result.rowcount or 0), 0)
+
+
+def _upsert_statement(model: type[Any], conflict_columns: tuple[str, ...]) -> Any:
+    """Build the conditional upsert once per table; rows are bound at execute time."""
+
+    key = (model.__table__.name, conflict_columns)
+    cached = _UPSERT_STATEMENTS.get(key)
+    if cached is not None:
+        return cached
+
+    table = model.__table__
+    stmt = sqlite_insert(model)
+    set_columns: dict[str, Any] = {}
+    for column in table.columns:
+        if column.name in conflict_columns or column.name in {"id", "created_at", "updated_at"}:
+            continue
+        set_columns[column.name] = getattr(stmt.excluded, column.name)
+
+    changed = _changed_condition(table, stmt, set_columns)
+    if changed is not None:
+        upsert = stmt.on_conflict_do_update(
+            index_elements=list(conflict_columns),
+            set_={**set_columns, "updated_at": func.now()},
+            where=changed,
+        )
+    else:
+        upsert = stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
+    _UPSERT_STATEMENTS[key] = upsert
+    return upsert
+
+
+def _changed_condition(
+    table: Any, stmt: Any, set_columns: dict[str, Any]
+) -> ColumnElement[bool] | None:
+    if not set_columns:
+        return None
+    if "payload_hash" in set_columns:
+        hash_changed: ColumnElement[bool] = table.c.payload_hash.is_distinct_from(
+            stmt.excluded.payload_hash
+        )
+        return hash_changed
+    compared = [name for name in set_columns if name not in _VOLATILE_COLUMNS]
+    if not compared:
+        return None
+    return or_(*(table.c[name].is_distinct_from(stmt.excluded[name]) for name in compared))
@@ -1,23 +1,35 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import AsyncIterator, Awaitable, Callable
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, replace
+from dataclasses import field as dataclass_field
 from datetime import UTC, date, datetime, timedelta
+from hashlib import sha256
+from itertools import islice
+from time import monotonic
 from typing import Any
 
 import httpx
+import orjson
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from redmine_rag.core.config import get_settings
 from redmine_rag.db.models import Project, SyncCursor, SyncState
 from redmine_rag.db.session import get_session_factory
-from redmine_rag.indexing.chunk_indexer import ChunkIndexer
+from redmine_rag.indexing.chunk_indexer import ChunkIndexer, ChunkStats
 from redmine_rag.indexing.embedding_indexer import EmbeddingIndexer
 from redmine_rag.indexing.vector_store import LocalNumpyVectorStore
+from redmine_rag.ingestion.payload_store import payload_hash
 from redmine_rag.ingestion.redmine_client import RedmineClient
-from redmine_rag.ingestion.repository import IngestionRepository
+from redmine_rag.ingestion.repository import IngestionRepository, UpsertStats
+from redmine_rag.ingestion.sync_progress import ProgressSink, SyncCancelledError, SyncProgress
+from redmine_rag.services.reference_cache_service import mark_reference_data_updated
+from redmine_rag.services.retrieval_cache_service import mark_retrieval_index_updated
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +48,131 @@ MODULE_ORDER = (
     "boards",
     "wiki",
 )
+# `MODULE_ORDER` is a topological order of this graph; disabled dependencies count as met.
+MODULE_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    "projects": (),
+    "users": (),
+    "groups": (),
+    "trackers": (),
+    "issue_statuses": (),
+    "issue_priorities": (),
+    "issues": ("projects", "users", "trackers", "issue_statuses", "issue_priorities"),
+    "time_entries": ("projects", "users"),
+    "news": ("projects",),
+    "documents": ("projects",),
+    "files": ("projects",),
+    "boards": ("projects",),
+    "wiki": ("projects",),
+}
+REFERENCE_DATA_MODULES = frozenset({"projects", "trackers", "issue_statuses"})
+# Modules filtered by `project_id`; these split across shards, all others run once.
+PROJECT_SCOPED_MODULES = frozenset({"issues", "time_entries", "news", "documents", "files"})
+_CHECKPOINT_REWIND_ITEMS = 100
+
+SyncHandler = Callable[["SyncContext", dict[str, Any]], Awaitable[None]]
+
+
+@dataclass(slots=True, frozen=True)
+class PageCheckpoint:
+    """Resume point stored in `SyncCursor.cursor_token` after every committed page."""
+
+    updated_since: datetime | None
+    offset: int
+    high_water: datetime | None
+    # Digest of the project group the pages were fetched for; offsets are only
+    # meaningful for the same `project_id` filter.
+    scope: str | None = None
+
+    def encode(self) -> str:
+        return orjson.dumps(
+            {
+                "updated_since": _isoformat_or_none(self.updated_since),
+                "offset": self.offset,
+                "high_water": _isoformat_or_none(self.high_water),
+                "scope": self.scope,
+            }
+        ).decode()
+
+    @classmethod
+    def decode(cls, token: str | None) -> PageCheckpoint | None:
+        if not token:
+            return None
+        try:
+            payload = orjson.loads(token)
+            return cls(
+                updated_since=_parse_datetime(payload.get("updated_since")),
+                offset=max(int(payload["offset"]), 0),
+                high_water=_parse_datetime(payload.get("high_water")),
+                scope=payload.get("scope"),
+            )
+        except (orjson.JSONDecodeError, AttributeError, KeyError, TypeError, ValueError):
+            return None
+
+
+@dataclass(slots=True)
+class CursorGroup:
+    """Projects fetched with one `project_id` filter from a shared resume point.
+
+    Each project keeps its own `SyncCursor`; projects whose cursors are all known are
+    merged into one group fetched from the oldest mark, new projects are backfilled
+    separately, and an interrupted group resumes only with unchanged membership.
+    """
+
+    project_ids: list[int]
+    cursors: list[SyncCursor]
+    updated_since: datetime | None
+    start_offset: int
+    high_water: datetime | None
+    mode: str
+
+    def checkpoint(self, *, offset: int, high_water: datetime | None) -> None:
+        token = PageCheckpoint(
+            updated_since=self.updated_since,
+            offset=offset,
+            high_water=high_water,
+            scope=_scope_digest(self.project_ids),
+        ).encode()
+        for cursor in self.cursors:
+            cursor.cursor_token = token
+
+    def finish(self, *, high_water: datetime | None, fetched_at: datetime) -> None:
+        for cursor in self.cursors:
+            current = _normalize_datetime(cursor.last_seen_updated_on)
+            if high_water is not None and (current is None or high_water > current):
+                cursor.last_seen_updated_on = high_water
+            cursor.cursor_token = None
+            cursor.last_success_at = fetched_at
+            cursor.error_message = None
+
+    def to_dict(self, *, module: str) -> dict[str, Any]:
+        return {
+            "module": module,
+            "project_ids": self.project_ids,
+            "mode": self.mode,
+            "updated_since": _isoformat_or_none(self.updated_since),
+        }
+
+
+@dataclass(slots=True)
+class StageStats:
+    """Throughput of one streaming stage: batches handled, busy time, blocked time."""
+
+    batches: int = 0
+    items: int = 0
+    busy_s: float = 0.0
+    wait_s: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "busy_s": round(self.busy_s, 4),
+            "wait_s": round(self.wait_s, 4),
+            "items_per_s": round(self.items / self.busy_s, 1) if self.busy_s > 0 else None,
+        }
+
+
+IndexBatch = tuple[str, list[int]]
 
 
 @dataclass(slots=True)
@@ -49,6 +186,49 @@ class SyncContext:
     board_ids: list[int]
     wiki_pages: list[str]
     base_url: str
+    write_lock: asyncio.Lock
+    # Committed entity ids flow from the module handlers to the index stage.
+    index_queue: asyncio.Queue[IndexBatch | None] | None
+    stages: dict[str, StageStats]
+    progress: SyncProgress
+
+    @asynccontextmanager
+    async def write(self) -> AsyncIterator[None]:
+        """Run a batch of writes as the single DB writer and commit it.
+
+        Modules share one lock so concurrent sessions never contend for the SQLite
+        write lock; summary counters updated inside the block are serialized too.
+        """
+
+        requested = monotonic()
+        async with self.write_lock:
+            acquired = monotonic()
+            try:
+                yield
+                await self.session.commit()
+            except BaseException:
+                await self.session.rollback()
+                raise
+            finally:
+                stats = self.stages.setdefault("write", StageStats())
+                stats.batches += 1
+                stats.wait_s += acquired - requested
+                stats.busy_s += monotonic() - acquired
+
+    async def enqueue_index(self, source_type: str, ids: list[int]) -> None:
+        """Hand committed entities to the index stage; blocks while its queue is full.
+
+        Must be called outside `write()`: the index stage needs the write lock to drain.
+        """
+
+        if self.index_queue is None or not ids:
+            return
+        requested = monotonic()
+        await self.index_queue.put((source_type, ids))
+        stats = self.stages.setdefault("enqueue", StageStats())
+        stats.batches += 1
+        stats.items += len(ids)
+        stats.wait_s += monotonic() - requested
 
 
 async def run_incremental_sync(
@@ -56,8 +236,14 @@ async def run_incremental_sync(
     *,
     client: RedmineClient | None = None,
     modules_override: list[str] | None = None,
+    on_progress: ProgressSink | None = None,
 ) -> dict[str, Any]:
-    """Run one full incremental sync cycle with deterministic module ordering."""
+    """Run one full incremental sync cycle, executing modules along their dependency DAG.
+
+    `on_progress` receives a progress snapshot every `SYNC_PROGRESS_INTERVAL_S` and once
+    at the end; returning `True` cancels the run at the next page boundary with
+    `SyncCancelledError`. Pages committed before that keep their cursor checkpoints.
+    """
 
     settings = get_settings()
     effective_project_ids = project_ids or settings.redmine_project_ids
@@ -65,11 +251,19 @@ async def run_incremental_sync(
         set(modules_override) if modules_override else set(settings.redmine_modules or MODULE_ORDER)
     )
     fetched_at = datetime.now(UTC)
+    sync_started = monotonic()
 
     summary: dict[str, Any] = {
         "project_ids": effective_project_ids,
         "modules_enabled": sorted(enabled_modules),
         "modules_skipped": [],
+        "items_failed": [],
+        "modules_resumed": [],
+        "cursor_groups": [],
+        "shards": [],
+        "entities_unchanged": 0,
+        "upserts": {},
+        "pages_unchanged": 0,
         "projects_synced": 0,
         "users_synced": 0,
         "groups_synced": 0,
@@ -99,6 +293,14 @@ async def run_incremental_sync(
         "embeddings_processed": 0,
         "vectors_upserted": 0,
         "vectors_removed": 0,
+        "module_timings": {},
+        "modules_wall_s": 0.0,
+        "critical_path": [],
+        "critical_path_s": 0.0,
+        "rate_limit": {},
+        "stages": {},
+        "index_first_batch_s": None,
+        "index_stage_error": None,
         "finished_at": None,
     }
 
@@ -113,9 +315,9 @@ async def run_incremental_sync(
 
     session_factory = get_session_factory()
     sync_client = client or RedmineClient()
-    async with session_factory() as session:
+    async with sync_client, session_factory() as session:
         repo = IngestionRepository(session)
-        sync_state = await _get_or_create_sync_state(session, key="redmine_incremental")
+        sync_state = await get_or_create_sync_state(session, key="redmine_incremental")
         previous_success_at = sync_state.last_success_at
         sync_state.last_sync_at = fetched_at
         sync_state.last_error = None
@@ -131,9 +333,22 @@ async def run_incremental_sync(
             board_ids=settings.redmine_board_ids,
             wiki_pages=settings.redmine_wiki_pages,
             base_url=settings.redmine_base_url.rstrip("/"),
+            write_lock=asyncio.Lock(),
+            index_queue=(
+                asyncio.Queue(maxsize=settings.sync_index_queue_size)
+                if settings.sync_stream_indexing
+                else None
+            ),
+            stages={},
+            progress=SyncProgress(),
         )
+        vector_store = LocalNumpyVectorStore(
+            index_path=settings.vector_index_path,
+            meta_path=settings.vector_meta_path,
+        )
+        streamed = _IndexStageState()
 
-        handlers: dict[str, Callable[[SyncContext, dict[str, Any]], Awaitable[None]]] = {
+        handlers: dict[str, SyncHandler] = {
             "projects": _sync_projects,
             "users": _sync_users,
             "groups": _sync_groups,
@@ -149,64 +364,86 @@ async def run_incremental_sync(
             "wiki": _sync_wiki,
         }
 
+        reporter_task = (
+            asyncio.create_task(
+                _run_progress_reporter(
+                    context, sink=on_progress, interval_s=settings.sync_progress_interval_s
+                ),
+                name="sync:progress",
+            )
+            if on_progress is not None
+            else None
+        )
         try:
-            for module_name in MODULE_ORDER:
-                if module_name not in enabled_modules:
-                    summary["modules_skipped"].append(
-                        {"module": module_name, "reason": "disabled_by_configuration"}
-                    )
-                    continue
-
-                handler = handlers[module_name]
-                try:
-                    logger.info("Running sync module", extra={"sync_module": module_name})
-                    await handler(context, summary)
-                    await session.commit()
-                    logger.info("Sync module finished", extra={"sync_module": module_name})
-                except httpx.HTTPStatusError as exc:
-                    status_code = exc.response.status_code
-                    if status_code in {403, 404, 405, 501}:
-                        await session.rollback()
-                        logger.warning(
-                            "Skipping unsupported module",
-                            extra={
-                                "sync_module": module_name,
-                                "status_code": status_code,
-                                "detail": str(exc),
-                            },
-                        )
-                        summary["modules_skipped"].append(
-                            {
-                                "module": module_name,
-                                "reason": "endpoint_not_available",
-                                "status_code": status_code,
-                            }
-                        )
-                        continue
-                    raise
+            index_task = (
+                asyncio.create_task(
+                    _run_index_stage(
+                        context,
+                        state=streamed,
+                        store=vector_store,
+                        session_factory=session_factory,
+                        embedding_dim=settings.embedding_dim,
+                        flush_interval_s=settings.sync_vector_flush_interval_s,
+                        sync_started=sync_started,
+                    ),
+                    name="sync:index-stage",
+                )
+                if context.index_queue is not None
+                else None
+            )
+            try:
+                await _run_module_graph(
+                    context,
+                    handlers=handlers,
+                    enabled_modules=enabled_modules,
+                    summary=summary,
+                    session_factory=session_factory,
+                    concurrency=settings.sync_module_concurrency,
+                    shards=settings.sync_project_shards,
+                )
+            finally:
+                if index_task is not None and context.index_queue is not None:
+                    await context.index_queue.put(None)
+                    await index_task
+                summary["stages"] = {
+                    name: stats.to_dict() for name, stats in sorted(context.stages.items())
+                }
+                summary["index_first_batch_s"] = streamed.first_batch_s
+                summary["index_stage_error"] = streamed.error
+            summary["rate_limit"] = sync_client.rate_limit_snapshot().to_dict()
 
+            # Catch-up pass for sources the index stage did not see (e.g. wiki pages, or
+            # everything when streaming is disabled or failed); streamed ones are skipped.
             chunk_indexer = ChunkIndexer(
                 session,
                 base_url=context.base_url,
             )
             chunk_since = _cursor_lower_bound(previous_success_at, context.overlap_minutes)
-            chunk_stats = await chunk_indexer.refresh(since=chunk_since)
-            summary["chunk_sources_reindexed"] = chunk_stats.sources_reindexed
-            summary["chunks_updated"] = chunk_stats.chunks_updated
-
-            vector_store = LocalNumpyVectorStore(
-                index_path=settings.vector_index_path,
-                meta_path=settings.vector_meta_path,
+            chunk_stats = await chunk_indexer.refresh(since=chunk_since, skip=streamed.indexed)
+            summary["chunk_sources_reindexed"] = (
+                chunk_stats.sources_reindexed + streamed.chunk_stats.sources_reindexed
             )
+            summary["chunks_updated"] = (
+                chunk_stats.chunks_updated + streamed.chunk_stats.chunks_updated
+            )
+
             embedding_indexer = EmbeddingIndexer(
                 session=session,
                 store=vector_store,
                 embedding_dim=settings.embedding_dim,
             )
-            embedding_stats = await embedding_indexer.refresh(since=chunk_since, full_rebuild=False)
-            summary["embeddings_processed"] = embedding_stats.processed_chunks
-            summary["vectors_upserted"] = embedding_stats.vectors_upserted
+            embedding_stats = await embedding_indexer.refresh(
+                since=chunk_since, full_rebuild=False, skip_keys=streamed.embedded_keys
+            )
+            summary["embeddings_processed"] = embedding_stats.processed_chunks + len(
+                streamed.embedded_keys
+            )
+            summary["vectors_upserted"] = (
+                embedding_stats.vectors_upserted + streamed.vectors_upserted
+            )
             summary["vectors_removed"] = embedding_stats.removed_vectors
+            if chunk_stats.chunks_updated or embedding_stats.vectors_upserted:
+                await mark_retrieval_index_updated(session)
 
             sync_state.last_success_at = datetime.now(UTC)
             sync_state.last_error = None
@@ -216,22 +453,416 @@ async def run_incremental_sync(
             await session.rollback()
             sync_state.last_error = str(exc)
             await session.commit()
-            logger.exception(
-                "Incremental Redmine sync failed", extra={"project_ids": effective_project_ids}
-            )
+            if isinstance(exc, SyncCancelledError):
+                logger.info(
+                    "Incremental Redmine sync cancelled",
+                    extra={"project_ids": effective_project_ids},
+                )
+            else:
+                logger.exception(
+                    "Incremental Redmine sync failed",
+                    extra={"project_ids": effective_project_ids},
+                )
             raise
+        finally:
+            if reporter_task is not None and on_progress is not None:
+                reporter_task.cancel()
+                await asyncio.gather(reporter_task, return_exceptions=True)
+                await _publish_progress(context, on_progress)
 
     logger.info("Finished incremental Redmine sync", extra=summary)
     return summary
 
 
+@dataclass(slots=True)
+class _IndexStageState:
+    indexed: dict[str, set[int]] = dataclass_field(default_factory=dict)
+    embedded_keys: set[str] = dataclass_field(default_factory=set)
+    chunk_stats: ChunkStats = dataclass_field(default_factory=ChunkStats)
+    vectors_upserted: int = 0
+    first_batch_s: float | None = None
+    error: str | None = None
+
+
+async def _run_progress_reporter(
+    context: SyncContext, *, sink: ProgressSink, interval_s: float
+) -> None:
+    while True:
+        await asyncio.sleep(interval_s)
+        await _publish_progress(context, sink)
+
+
+async def _publish_progress(context: SyncContext, sink: ProgressSink) -> None:
+    """Hand a snapshot to `sink` as the single writer; a failed publish never stops the sync.
+
+    The snapshot carries the client's rate limiter state, so processes that do not run
+    the sync (the API health check) can still report Redmine throttling.
+    """
+
+    snapshot = {
+        **context.progress.snapshot(),
+        "rate_limiter": context.client.rate_limit_snapshot().to_dict(),
+    }
+    try:
+        async with context.write_lock:
+            stop = await sink(snapshot)
+    except Exception:  # noqa: BLE001
+        logger.warning("Sync progress publish failed", exc_info=True)
+        return
+    if stop and not context.progress.cancel_requested:
+        logger.info("Sync cancellation requested; stopping at the next page boundary")
+        context.progress.cancel()
+
+
+async def _run_index_stage(
+    context: SyncContext,
+    *,
+    state: _IndexStageState,
+    store: LocalNumpyVectorStore,
+    session_factory: async_sessionmaker[AsyncSession],
+    embedding_dim: int,
+    flush_interval_s: float,
+    sync_started: float,
+) -> None:
+    """Chunk and embed entities as soon as their page is committed.
+
+    Consumes `context.index_queue` until a `None` sentinel. Chunk writes go through the
+    shared writer; embedding runs outside the write lock. The vector file is saved at
+    most every `flush_interval_s`. After a failure the stage only drains the queue so
+    producers never block, and the catch-up pass indexes the remainder.
+    """
+
+    assert context.index_queue is not None
+    queue = context.index_queue
+    chunk_stage = context.stages.setdefault("chunk", StageStats())
+    embed_stage = context.stages.setdefault("embed", StageStats())
+    last_flush = monotonic()
+    async with session_factory() as session:
+        stage_context = replace(context, session=session, repo=IngestionRepository(session))
+        chunk_indexer = ChunkIndexer(session, base_url=context.base_url, track_new_chunks=True)
+        embedding_indexer = EmbeddingIndexer(
+            session=session, store=store, embedding_dim=embedding_dim
+        )
+        while (batch := await queue.get()) is not None:
+            if state.error is not None:
+                continue
+            source_type, ids = batch
+            try:
+                started = monotonic()
+                async with stage_context.write():
+                    stats = await chunk_indexer.refresh_sources(source_type, ids)
+                    if stats.chunks_updated:
+                        await mark_retrieval_index_updated(session)
+                chunked = monotonic()
+                chunk_stage.batches += 1
+                chunk_stage.items += stats.sources_reindexed
+                chunk_stage.busy_s += chunked - started
+                state.indexed.setdefault(source_type, set()).update(ids)
+                state.chunk_stats.sources_reindexed += stats.sources_reindexed
+                state.chunk_stats.chunks_updated += stats.chunks_updated
+                if state.first_batch_s is None:
+                    state.first_batch_s = round(chunked - sync_started, 4)
+
+                new_chunks = chunk_indexer.take_new_chunks()
+                state.vectors_upserted += embedding_indexer.embed_chunks(new_chunks)
+                state.embedded_keys.update(key for key, _ in new_chunks)
+                if monotonic() - last_flush >= flush_interval_s:
+                    await asyncio.to_thread(store.save)
+                    last_flush = monotonic()
+                embed_stage.batches += 1
+                embed_stage.items += len(new_chunks)
+                embed_stage.busy_s += monotonic() - chunked
+            except Exception as exc:  # noqa: BLE001
+                state.error = str(exc)
+                logger.exception("Sync index stage failed; falling back to the catch-up pass")
+
+
+async def _run_module_graph(
+    context: SyncContext,
+    *,
+    handlers: dict[str, SyncHandler],
+    enabled_modules: set[str],
+    summary: dict[str, Any],
+    session_factory: async_sessionmaker[AsyncSession],
+    concurrency: int,
+    shards: int = 1,
+) -> None:
+    """Run enabled modules as a dependency DAG with at most `concurrency` in flight.
+
+    Ready modules start in `MODULE_ORDER` order, so a concurrency of 1 reproduces the
+    serial sync. Project-scoped modules additionally fan out over up to `shards`
+    project partitions. The first failing module cancels the rest and re-raises.
+    """
+
+    for module_name in MODULE_ORDER:
+        if module_name not in enabled_modules:
+            summary["modules_skipped"].append(
+                {"module": module_name, "reason": "disabled_by_configuration"}
+            )
+
+    pending = [module_name for module_name in MODULE_ORDER if module_name in enabled_modules]
+    completed: set[str] = set()
+    durations: dict[str, float] = {}
+    timings: dict[str, dict[str, float]] = {}
+    running: dict[asyncio.Task[None], str] = {}
+    graph_started = monotonic()
+
+    async def _run(module_name: str) -> None:
+        started = monotonic()
+        await _run_module(
+            context,
+            module_name=module_name,
+            handler=handlers[module_name],
+            summary=summary,
+            session_factory=session_factory,
+            shards=shards,
+        )
+        finished = monotonic()
+        durations[module_name] = finished - started
+        timings[module_name] = {
+            "started_s": round(started - graph_started, 4),
+            "duration_s": round(finished - started, 4),
+        }
+
+    try:
+        while pending or running:
+            for module_name in list(pending):
+                if len(running) >= concurrency:
+                    break
+                dependencies = [
+                    item for item in MODULE_DEPENDENCIES[module_name] if item in enabled_modules
+                ]
+                if all(item in completed for item in dependencies):
+                    pending.remove(module_name)
+                    task = asyncio.create_task(_run(module_name), name=f"sync:{module_name}")
+                    running[task] = module_name
+
+            finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                module_name = running.pop(task)
+                task.result()
+                completed.add(module_name)
+    finally:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+        critical_path, critical_path_s = _critical_path(durations)
+        summary["module_timings"] = {
+            module_name: timings[module_name]
+            for module_name in MODULE_ORDER
+            if module_name in timings
+        }
+        summary["modules_wall_s"] = round(monotonic() - graph_started, 4)
+        summary["critical_path"] = critical_path
+        summary["critical_path_s"] = round(critical_path_s, 4)
+
+
+async def _run_module(
+    context: SyncContext,
+    *,
+    module_name: str,
+    handler: SyncHandler,
+    summary: dict[str, Any],
+    session_factory: async_sessionmaker[AsyncSession],
+    shards: int = 1,
+) -> None:
+    partitions = (
+        _partition_projects(context.effective_project_ids, shards)
+        if module_name in PROJECT_SCOPED_MODULES
+        else []
+    )
+    try:
+        context.progress.checkpoint()
+        logger.info("Running sync module", extra={"sync_module": module_name})
+        if len(partitions) > 1:
+            await _run_module_shards(
+                context,
+                module_name=module_name,
+                handler=handler,
+                summary=summary,
+                session_factory=session_factory,
+                partitions=partitions,
+            )
+        else:
+            await _run_handler(
+                context,
+                handler=handler,
+                summary=summary,
+                session_factory=session_factory,
+            )
+    except httpx.HTTPStatusError as exc:
+        status_code = exc.response.status_code
+        if status_code not in {403, 404, 405, 501}:
+            raise
+        logger.warning(
+            "Skipping unsupported module",
+            extra={
+                "sync_module": module_name,
+                "status_code": status_code,
+                "detail": str(exc),
+            },
+        )
+        summary["modules_skipped"].append(
+            {
+                "module": module_name,
+                "reason": "endpoint_not_available",
+                "status_code": status_code,
+            }
+        )
+        context.progress.finish_module(module_name)
+        return
+
+    if module_name in REFERENCE_DATA_MODULES:
+        # Other processes (API, workers) key their reference caches on this generation.
+        async with session_factory() as session, context.write_lock:
+            await mark_reference_data_updated(session)
+            await session.commit()
+    context.progress.finish_module(module_name)
+    logger.info("Sync module finished", extra={"sync_module": module_name})
+
+
+async def _run_handler(
+    context: SyncContext,
+    *,
+    handler: SyncHandler,
+    summary: dict[str, Any],
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_factory() as session:
+        module_context = replace(context, session=session, repo=IngestionRepository(session))
+        try:
+            await handler(module_context, summary)
+            # Commits cursor updates and any other state left pending by the handler.
+            async with module_context.write():
+                pass
+        except BaseException:
+            await session.rollback()
+            raise
+        finally:
+            _merge_upsert_stats(summary, module_context.repo)
+
+
+async def _run_module_shards(
+    context: SyncContext,
+    *,
+    module_name: str,
+    handler: SyncHandler,
+    summary: dict[str, Any],
+    session_factory: async_sessionmaker[AsyncSession],
+    partitions: list[list[int]],
+) -> None:
+    """Run one project-scoped module per project partition and merge the shard summaries.
+
+    Shards fetch concurrently but share the context's write lock, so SQLite still sees a
+    single writer; each shard counts into its own summary until all of them finish.
+    """
+
+    shard_summaries = [_empty_shard_summary(summary) for _ in partitions]
+    durations = [0.0] * len(partitions)
+
+    async def _run_shard(index: int) -> None:
+        started = monotonic()
+        try:
+            await _run_handler(
+                replace(context, effective_project_ids=partitions[index]),
+                handler=handler,
+                summary=shard_summaries[index],
+                session_factory=session_factory,
+            )
+        finally:
+            durations[index] = monotonic() - started
+
+    tasks = [
+        asyncio.create_task(_run_shard(index), name=f"sync:{module_name}:shard-{index}")
+        for index in range(len(partitions))
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for index, shard_summary in enumerate(shard_summaries):
+            _merge_shard_summary(summary, shard_summary)
+            summary["shards"].append(
+                {
+                    "module": module_name,
+                    "shard": index,
+                    "project_ids": partitions[index],
+                    "duration_s": round(durations[index], 4),
+                }
+            )
+
+
+def _partition_projects(project_ids: list[int], shards: int) -> list[list[int]]:
+    ordered = sorted(set(project_ids))
+    count = max(1, min(shards, len(ordered)))
+    return [ordered[index::count] for index in range(count)]
+
+
+def _empty_shard_summary(summary: dict[str, Any]) -> dict[str, Any]:
+    """Zeroed copy of the counters and lists a module handler updates."""
+
+    shard_summary: dict[str, Any] = {"upserts": {}}
+    for key, value in summary.items():
+        if isinstance(value, list):
+            shard_summary[key] = []
+        elif isinstance(value, int) and not isinstance(value, bool):
+            shard_summary[key] = 0
+    return shard_summary
+
+
+def _merge_shard_summary(summary: dict[str, Any], shard_summary: dict[str, Any]) -> None:
+    for key, value in shard_summary.items():
+        if key == "upserts":
+            for table_name, counts in value.items():
+                _add_upsert_stats(summary, table_name, UpsertStats.from_dict(counts))
+        elif isinstance(value, list):
+            summary[key].extend(value)
+        else:
+            summary[key] += value
+
+
+def _merge_upsert_stats(summary: dict[str, Any], repo: IngestionRepository) -> None:
+    for table_name, stats in repo.upsert_stats.items():
+        _add_upsert_stats(summary, table_name, stats)
+
+
+def _add_upsert_stats(summary: dict[str, Any], table_name: str, stats: UpsertStats) -> None:
+    upserts: dict[str, dict[str, Any]] = summary["upserts"]
+    merged = UpsertStats.from_dict(upserts.get(table_name, {}))
+    merged.add(stats)
+    upserts[table_name] = merged.to_dict()
+
+
+def _critical_path(durations: dict[str, float]) -> tuple[list[str], float]:
+    """Longest dependency chain by measured duration, i.e. the sync's lower time bound."""
+
+    best: dict[str, tuple[float, list[str]]] = {}
+    for module_name in MODULE_ORDER:
+        if module_name not in durations:
+            continue
+        prior_s, prior_path = max(
+            (best[item] for item in MODULE_DEPENDENCIES[module_name] if item in best),
+            key=lambda item: item[0],
+            default=(0.0, []),
+        )
+        best[module_name] = (prior_s + durations[module_name], [*prior_path, module_name])
+
+    if not best:
+        return [], 0.0
+    length_s, path = max(best.values(), key=lambda item: item[0])
+    return path, length_s
+
+
 async def _sync_projects(context: SyncContext, summary: dict[str, Any]) -> None:
-    rows: list[dict[str, Any]] = []
-    raw_rows: list[dict[str, Any]] = []
-    async for items in _iter_paginated(
+    async for items in iter_paginated(
         lambda limit, offset: context.client.get_projects(limit=limit, offset=offset),
         payload_key="projects",
+        progress=context.progress,
     ):
+        rows: list[dict[str, Any]] = []
+        raw_rows: list[dict[str, Any]] = []
         for project in items:
             project_id = int(project["id"])
             rows.append(
@@ -260,17 +891,19 @@ async def _sync_projects(context: SyncContext, summary: dict[str, Any]) -> None:
                 }
             )
 
-    summary["projects_synced"] += await context.repo.upsert_projects(rows)
-    summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_rows)
+        async with context.write():
+            summary["projects_synced"] += await context.repo.upsert_projects(rows)
+            summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_rows)
 
 
 async def _sync_users(context: SyncContext, summary: dict[str, Any]) -> None:
-    rows: list[dict[str, Any]] = []
-    raw_rows: list[dict[str, Any]] = []
-    async for items in _iter_paginated(
+    async for items in iter_paginated(
         lambda limit, offset: context.client.get_users(limit=limit, offset=offset),
         payload_key="users",
+        progress=context.progress,
     ):
+        rows: list[dict[str, Any]] = []
+        raw_rows: list[dict[str, Any]] = []
         for user in items:
             user_id = int(user["id"])
             rows.append(
@@ -299,17 +932,19 @@ async def _sync_users(context: SyncContext, summary: dict[str, Any]) -> None:
                 }
             )
 
-    summary["users_synced"] += await context.repo.upsert_users(rows)
-    summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_rows)
+        async with context.write():
+            summary["users_synced"] += await context.repo.upsert_users(rows)
+            summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_rows)
 
 
 async def _sync_groups(context: SyncContext, summary: dict[str, Any]) -> None:
-    rows: list[dict[str, Any]] = []
-    raw_rows: list[dict[str, Any]] = []
-    async for items in _iter_paginated(
+    async for items in iter_paginated(
         lambda limit, offset: context.client.get_groups(limit=limit, offset=offset),
         payload_key="groups",
+        progress=context.progress,
     ):
+        rows: list[dict[str, Any]] = []
+        raw_rows: list[dict[str, Any]] = []
         for group in items:
             group_id = int(group["id"])
             rows.append(
@@ -331,8 +966,9 @@ async def _sync_groups(context: SyncContext, summary: dict[str, Any]) -> None:
                 }
             )
 
-    summary["groups_synced"] += await context.repo.upsert_groups(rows)
-    summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_rows)
+        async with context.write():
+            summary["groups_synced"] += await context.repo.upsert_groups(rows)
+            summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_rows)
 
 
 async def _sync_trackers(context: SyncContext, summary: dict[str, Any]) -> None:
@@ -361,8 +997,9 @@ async def _sync_trackers(context: SyncContext, summary: dict[str, Any]) -> None:
             }
         )
 
-    summary["trackers_synced"] += await context.repo.upsert_trackers(rows)
-    summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_rows)
+    async with context.write():
+        summary["trackers_synced"] += await context.repo.upsert_trackers(rows)
+        summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_rows)
 
 
 async def _sync_issue_statuses(context: SyncContext, summary: dict[str, Any]) -> None:
@@ -391,8 +1028,9 @@ async def _sync_issue_statuses(context: SyncContext, summary: dict[str, Any]) ->
             }
         )
 
-    summary["issue_statuses_synced"] += await context.repo.upsert_issue_statuses(rows)
-    summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_rows)
+    async with context.write():
+        summary["issue_statuses_synced"] += await context.repo.upsert_issue_statuses(rows)
+        summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_rows)
 
 
 async def _sync_issue_priorities(context: SyncContext, summary: dict[str, Any]) -> None:
@@ -422,35 +1060,48 @@ async def _sync_issue_priorities(context: SyncContext, summary: dict[str, Any])
             }
         )
 
-    summary["issue_priorities_synced"] += await context.repo.upsert_issue_priorities(rows)
-    summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_rows)
+    async with context.write():
+        summary["issue_priorities_synced"] += await context.repo.upsert_issue_priorities(rows)
+        summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_rows)
 
 
 async def _sync_issues(context: SyncContext, summary: dict[str, Any]) -> None:
-    scope = _project_scope(context.effective_project_ids)
-    cursor = await _get_or_create_cursor(context.session, entity_type="issues", scope=scope)
-    updated_since = _cursor_lower_bound(cursor.last_seen_updated_on, context.overlap_minutes)
-    max_seen_updated_on = _normalize_datetime(cursor.last_seen_updated_on)
-
-    issue_rows: list[dict[str, Any]] = []
-    custom_field_rows: list[dict[str, Any]] = []
-    journal_rows: list[dict[str, Any]] = []
-    relation_rows: list[dict[str, Any]] = []
-    watcher_rows: list[dict[str, Any]] = []
-    attachment_rows: list[dict[str, Any]] = []
-    raw_issue_rows: list[dict[str, Any]] = []
-    raw_journal_rows: list[dict[str, Any]] = []
-    raw_entity_rows: list[dict[str, Any]] = []
+    async with context.write():
+        groups = await _plan_cursor_groups(
+            context, entity_type="issues", module="issues", summary=summary
+        )
+    for group in groups:
+        await _sync_issue_group(context, group, summary)
+
 
-    async for issues in _iter_paginated(
+async def _sync_issue_group(
+    context: SyncContext, group: CursorGroup, summary: dict[str, Any]
+) -> None:
+    updated_since = group.updated_since
+    start_offset = group.start_offset
+    max_seen_updated_on = group.high_water
+    fetched_offset = start_offset
+
+    async for issues in iter_paginated(
         lambda limit, offset: context.client.get_issues(
             updated_since=updated_since,
-            project_ids=context.effective_project_ids,
+            project_ids=group.project_ids,
             limit=limit,
             offset=offset,
         ),
         payload_key="issues",
+        progress=context.progress,
+        start_offset=start_offset,
     ):
+        issue_rows: list[dict[str, Any]] = []
+        custom_field_rows: list[dict[str, Any]] = []
+        journal_rows: list[dict[str, Any]] = []
+        relation_rows: list[dict[str, Any]] = []
+        watcher_rows: list[dict[str, Any]] = []
+        attachment_rows: list[dict[str, Any]] = []
+        raw_issue_rows: list[dict[str, Any]] = []
+        raw_journal_rows: list[dict[str, Any]] = []
+        raw_entity_rows: list[dict[str, Any]] = []
         for issue in issues:
             issue_id = int(issue["id"])
             project_ref = issue.get("project") or {}
@@ -642,38 +1293,62 @@ async def _sync_issues(context: SyncContext, summary: dict[str, Any]) -> None:
                     }
                 )
 
-    summary["issues_synced"] += await context.repo.upsert_issues(issue_rows)
-    summary["raw_issues_synced"] += await context.repo.upsert_raw_issues(raw_issue_rows)
-    summary["custom_fields_synced"] += await context.repo.upsert_custom_fields(custom_field_rows)
-    summary["journals_synced"] += await context.repo.upsert_journals(journal_rows)
-    summary["raw_journals_synced"] += await context.repo.upsert_raw_journals(raw_journal_rows)
-    summary["relations_synced"] += await context.repo.upsert_issue_relations(relation_rows)
-    summary["watchers_synced"] += await context.repo.upsert_issue_watchers(watcher_rows)
-    summary["attachments_synced"] += await context.repo.upsert_attachments(attachment_rows)
-    summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_entity_rows)
+        fetched_offset += len(issues)
+        async with context.write():
+            summary["issues_synced"] += await context.repo.upsert_issues(issue_rows)
+            summary["raw_issues_synced"] += await context.repo.upsert_raw_issues(raw_issue_rows)
+            summary["custom_fields_synced"] += await context.repo.upsert_custom_fields(
+                custom_field_rows
+            )
+            summary["journals_synced"] += await context.repo.upsert_journals(journal_rows)
+            summary["raw_journals_synced"] += await context.repo.upsert_raw_journals(
+                raw_journal_rows
+            )
+            summary["relations_synced"] += await context.repo.upsert_issue_relations(relation_rows)
+            summary["watchers_synced"] += await context.repo.upsert_issue_watchers(watcher_rows)
+            summary["attachments_synced"] += await context.repo.upsert_attachments(attachment_rows)
+            summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(
+                raw_entity_rows
+            )
+            group.checkpoint(offset=fetched_offset, high_water=max_seen_updated_on)
+        await context.enqueue_index("issue", [row["id"] for row in issue_rows])
+        await context.enqueue_index("journal", [row["id"] for row in journal_rows])
+        await context.enqueue_index("attachment", [row["id"] for row in attachment_rows])
 
-    cursor.last_seen_updated_on = max_seen_updated_on
-    cursor.last_success_at = context.fetched_at
-    cursor.error_message = None
+    async with context.write():
+        group.finish(high_water=max_seen_updated_on, fetched_at=context.fetched_at)
 
 
 async def _sync_time_entries(context: SyncContext, summary: dict[str, Any]) -> None:
-    scope = _project_scope(context.effective_project_ids)
-    cursor = await _get_or_create_cursor(context.session, entity_type="time_entries", scope=scope)
-    updated_since = _cursor_lower_bound(cursor.last_seen_updated_on, context.overlap_minutes)
-    max_seen_updated_on = _normalize_datetime(cursor.last_seen_updated_on)
+    async with context.write():
+        groups = await _plan_cursor_groups(
+            context, entity_type="time_entries", module="time_entries", summary=summary
+        )
+    for group in groups:
+        await _sync_time_entry_group(context, group, summary)
 
-    rows: list[dict[str, Any]] = []
-    raw_rows: list[dict[str, Any]] = []
-    async for entries in _iter_paginated(
+
+async def _sync_time_entry_group(
+    context: SyncContext, group: CursorGroup, summary: dict[str, Any]
+) -> None:
+    updated_since = group.updated_since
+    start_offset = group.start_offset
+    max_seen_updated_on = group.high_water
+    fetched_offset = start_offset
+
+    async for entries in iter_paginated(
         lambda limit, offset: context.client.get_time_entries(
             updated_since=updated_since,
-            project_ids=context.effective_project_ids,
+            project_ids=group.project_ids,
             limit=limit,
             offset=offset,
         ),
         payload_key="time_entries",
+        progress=context.progress,
+        start_offset=start_offset,
     ):
+        rows: list[dict[str, Any]] = []
+        raw_rows: list[dict[str, Any]] = []
         for entry in entries:
             entry_id = int(entry["id"])
             project_id = _to_int_or_none((entry.get("project") or {}).get("id"))
@@ -715,25 +1390,34 @@ async def _sync_time_entries(context: SyncContext, summary: dict[str, Any]) -> N
                 }
             )
 
-    summary["time_entries_synced"] += await context.repo.upsert_time_entries(rows)
-    summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_rows)
+        fetched_offset += len(entries)
+        async with context.write():
+            summary["time_entries_synced"] += await context.repo.upsert_time_entries(rows)
+            summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_rows)
+            group.checkpoint(offset=fetched_offset, high_water=max_seen_updated_on)
+        await context.enqueue_index("time_entry", [row["id"] for row in rows])
 
-    cursor.last_seen_updated_on = max_seen_updated_on
-    cursor.last_success_at = context.fetched_at
-    cursor.error_message = None
+    async with context.write():
+        group.finish(high_water=max_seen_updated_on, fetched_at=context.fetched_at)
 
 
 async def _sync_news(context: SyncContext, summary: dict[str, Any]) -> None:
-    rows: list[dict[str, Any]] = []
-    raw_rows: list[dict[str, Any]] = []
-    async for items in _iter_paginated(
+    async for items in iter_paginated(
         lambda limit, offset: context.client.get_news(
             project_ids=context.effective_project_ids,
             limit=limit,
             offset=offset,
         ),
         payload_key="news",
+        progress=context.progress,
     ):
+        items = await _drop_unchanged(
+            context, items, entity_type="news", endpoint="/news.json", summary=summary
+        )
+        if not items:
+            continue
+        rows: list[dict[str, Any]] = []
+        raw_rows: list[dict[str, Any]] = []
         for item in items:
             news_id = int(item["id"])
             project_id = _to_int_or_none((item.get("project") or {}).get("id"))
@@ -761,21 +1445,29 @@ async def _sync_news(context: SyncContext, summary: dict[str, Any]) -> None:
                 }
             )
 
-    summary["news_synced"] += await context.repo.upsert_news(rows)
-    summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_rows)
+        async with context.write():
+            summary["news_synced"] += await context.repo.upsert_news(rows)
+            summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_rows)
+        await context.enqueue_index("news", [row["id"] for row in rows])
 
 
 async def _sync_documents(context: SyncContext, summary: dict[str, Any]) -> None:
-    rows: list[dict[str, Any]] = []
-    raw_rows: list[dict[str, Any]] = []
-    async for items in _iter_paginated(
+    async for items in iter_paginated(
         lambda limit, offset: context.client.get_documents(
             project_ids=context.effective_project_ids,
             limit=limit,
             offset=offset,
         ),
         payload_key="documents",
+        progress=context.progress,
     ):
+        items = await _drop_unchanged(
+            context, items, entity_type="document", endpoint="/documents.json", summary=summary
+        )
+        if not items:
+            continue
+        rows: list[dict[str, Any]] = []
+        raw_rows: list[dict[str, Any]] = []
         for item in items:
             document_id = int(item["id"])
             project_id = _to_int_or_none((item.get("project") or {}).get("id"))
@@ -803,21 +1495,29 @@ async def _sync_documents(context: SyncContext, summary: dict[str, Any]) -> None
                 }
             )
 
-    summary["documents_synced"] += await context.repo.upsert_documents(rows)
-    summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_rows)
+        async with context.write():
+            summary["documents_synced"] += await context.repo.upsert_documents(rows)
+            summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_rows)
+        await context.enqueue_index("document", [row["id"] for row in rows])
 
 
 async def _sync_files(context: SyncContext, summary: dict[str, Any]) -> None:
-    raw_rows: list[dict[str, Any]] = []
-    attachment_rows: list[dict[str, Any]] = []
-    async for items in _iter_paginated(
+    async for items in iter_paginated(
         lambda limit, offset: context.client.get_files(
             project_ids=context.effective_project_ids,
             limit=limit,
             offset=offset,
         ),
         payload_key="files",
+        progress=context.progress,
     ):
+        items = await _drop_unchanged(
+            context, items, entity_type="file", endpoint="/files.json", summary=summary
+        )
+        if not items:
+            continue
+        raw_rows: list[dict[str, Any]] = []
+        attachment_rows: list[dict[str, Any]] = []
         for item in items:
             file_id = int(item["id"])
             project_id = _to_int_or_none((item.get("project") or {}).get("id"))
@@ -859,9 +1559,11 @@ async def _sync_files(context: SyncContext, summary: dict[str, Any]) -> None:
                 }
             )
 
-    summary["files_synced"] += len(attachment_rows)
-    summary["attachments_synced"] += await context.repo.upsert_attachments(attachment_rows)
-    summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_rows)
+        summary["files_synced"] += len(attachment_rows)
+        async with context.write():
+            summary["attachments_synced"] += await context.repo.upsert_attachments(attachment_rows)
+            summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_rows)
+        await context.enqueue_index("attachment", [row["id"] for row in attachment_rows])
 
 
 async def _sync_boards_and_messages(context: SyncContext, summary: dict[str, Any]) -> None:
@@ -874,10 +1576,6 @@ async def _sync_boards_and_messages(context: SyncContext, summary: dict[str, Any
         summary["modules_skipped"].append({"module": "boards", "reason": "no_project_context"})
         return
 
-    board_rows: list[dict[str, Any]] = []
-    message_rows: list[dict[str, Any]] = []
-    raw_rows: list[dict[str, Any]] = []
-
     for board_id in context.board_ids:
         topics_total = 0
         messages_seen = 0
@@ -894,28 +1592,59 @@ async def _sync_boards_and_messages(context: SyncContext, summary: dict[str, Any
                 offset=offset,
             )
 
-        async for topics in _iter_paginated(
+        async for topics in iter_paginated(
             _fetch_topics,
             payload_key="messages",
+            progress=context.progress,
+            module="boards",
         ):
+            board_rows: list[dict[str, Any]] = []
+            message_rows: list[dict[str, Any]] = []
+            raw_rows: list[dict[str, Any]] = []
             topics_total += len(topics)
-            raw_rows.append(
-                {
-                    "entity_type": "board_topics",
-                    "entity_id": str(board_id),
-                    "endpoint": f"/boards/{board_id}/topics.json",
-                    "project_id": project_id,
-                    "updated_on": None,
-                    "fetched_at": context.fetched_at,
-                    "payload": {"messages": topics},
-                }
+            messages_seen += sum(
+                1 + (_to_int_or_none(topic.get("replies_count")) or 0) for topic in topics
             )
-            for topic in topics:
-                detail_payload = await context.client.get_message(int(topic["id"]))
+            # Only topics whose listing entry changed (new replies, edits) need a detail fetch.
+            topics_endpoint = f"/boards/{board_id}/topics.json"
+            changed_topics = {
+                int(topic["id"]): topic
+                for topic in await _drop_unchanged(
+                    context,
+                    topics,
+                    entity_type="board_topic",
+                    endpoint=topics_endpoint,
+                    summary=summary,
+                )
+            }
+            if not changed_topics:
+                continue
+            details = await fetch_each(list(changed_topics), context.client.get_message)
+            for topic_id, detail_payload in details:
+                if isinstance(detail_payload, httpx.HTTPError):
+                    _record_item_failure(
+                        summary,
+                        module="boards",
+                        reference=f"message:{topic_id}",
+                        exc=detail_payload,
+                    )
+                    continue
+                topic = changed_topics[topic_id]
+                # Recorded only after a successful detail fetch so failures are retried.
+                raw_rows.append(
+                    {
+                        "entity_type": "board_topic",
+                        "entity_id": str(topic_id),
+                        "endpoint": topics_endpoint,
+                        "project_id": project_id,
+                        "updated_on": _parse_datetime(topic.get("updated_on")),
+                        "fetched_at": context.fetched_at,
+                        "payload": topic,
+                    }
+                )
                 message = detail_payload["message"]
                 board_ref = message.get("board") or {"id": board_id, "name": f"Board {board_id}"}
                 replies = list(message.get("replies", []))
-                messages_seen += 1 + len(replies)
 
                 board_rows.append(
                     {
@@ -990,9 +1719,11 @@ async def _sync_boards_and_messages(context: SyncContext, summary: dict[str, Any
                         }
                     )
 
-    summary["boards_synced"] += await context.repo.upsert_boards(board_rows)
-    summary["messages_synced"] += await context.repo.upsert_messages(message_rows)
-    summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_rows)
+            async with context.write():
+                summary["boards_synced"] += await context.repo.upsert_boards(board_rows)
+                summary["messages_synced"] += await context.repo.upsert_messages(message_rows)
+                summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_rows)
+            await context.enqueue_index("message", [row["id"] for row in message_rows])
 
 
 async def _sync_wiki(context: SyncContext, summary: dict[str, Any]) -> None:
@@ -1004,6 +1735,7 @@ async def _sync_wiki(context: SyncContext, summary: dict[str, Any]) -> None:
     raw_entity_rows: list[dict[str, Any]] = []
     raw_wiki_count = 0
 
+    targets: list[tuple[str, str, str, int]] = []
     for token in context.wiki_pages:
         parsed = _parse_wiki_token(token)
         if parsed is None:
@@ -1026,21 +1758,49 @@ async def _sync_wiki(context: SyncContext, summary: dict[str, Any]) -> None:
                 }
             )
             continue
+        targets.append((token, project_ref, title, project_id))
 
-        payload = await context.client.get_wiki_page(project_ref, title)
+    details = await fetch_each(
+        targets,
+        lambda target: context.client.get_wiki_page(target[1], target[2]),
+    )
+    failures = [payload for _, payload in details if isinstance(payload, httpx.HTTPError)]
+    if failures and len(failures) == len(details):
+        # Nothing fetched at all: let the runner classify it (e.g. wiki module disabled).
+        raise failures[0]
+    for (token, project_ref, title, project_id), payload in details:
+        if isinstance(payload, httpx.HTTPError):
+            _record_item_failure(summary, module="wiki", reference=token, exc=payload)
+            continue
         page = payload["wiki_page"]
+        wiki_endpoint = f"/projects/{project_ref}/wiki/{title}.json"
+        wiki_entity_id = f"{project_ref}:{title}"
+        stored = await context.repo.load_raw_entity_hashes(
+            entity_type="wiki_page", endpoint=wiki_endpoint, entity_ids=[wiki_entity_id]
+        )
+        if stored.get(wiki_entity_id) == payload_hash(page):
+            summary["entities_unchanged"] += 1
+            continue
         updated_on = _parse_datetime(page.get("updated_on")) or context.fetched_at
         wiki_url = f"{context.base_url}/projects/{project_ref}/wiki/{title}"
-        page_id = await context.repo.upsert_wiki_page(
-            project_id=project_id,
-            project_identifier=None if project_ref.isdigit() else project_ref,
-            title=title,
-            content=str(page.get("text", "")),
-            version=int(page.get("version", 1)),
-            parent_title=_to_str_or_none((page.get("parent") or {}).get("title")),
-            updated_on=updated_on,
-            url=wiki_url,
-        )
+        async with context.write():
+            page_id = await context.repo.upsert_wiki_page(
+                project_id=project_id,
+                project_identifier=None if project_ref.isdigit() else project_ref,
+                title=title,
+                content=str(page.get("text", "")),
+                version=int(page.get("version", 1)),
+                parent_title=_to_str_or_none((page.get("parent") or {}).get("title")),
+                updated_on=updated_on,
+                url=wiki_url,
+            )
+            await context.repo.upsert_raw_wiki(
+                project_id=project_id,
+                title=title,
+                updated_on=updated_on,
+                fetched_at=context.fetched_at,
+                payload=page,
+            )
         wiki_versions_rows.append(
             {
                 "wiki_page_id": page_id,
@@ -1051,19 +1811,12 @@ async def _sync_wiki(context: SyncContext, summary: dict[str, Any]) -> None:
                 "updated_on": updated_on,
             }
         )
-        await context.repo.upsert_raw_wiki(
-            project_id=project_id,
-            title=title,
-            updated_on=updated_on,
-            fetched_at=context.fetched_at,
-            payload=page,
-        )
         raw_wiki_count += 1
         raw_entity_rows.append(
             {
                 "entity_type": "wiki_page",
-                "entity_id": f"{project_ref}:{title}",
-                "endpoint": f"/projects/{project_ref}/wiki/{title}.json",
+                "entity_id": wiki_entity_id,
+                "endpoint": wiki_endpoint,
                 "project_id": project_id,
                 "updated_on": updated_on,
                 "fetched_at": context.fetched_at,
@@ -1072,34 +1825,334 @@ async def _sync_wiki(context: SyncContext, summary: dict[str, Any]) -> None:
         )
         summary["wiki_pages_synced"] += 1
 
-    summary["wiki_versions_synced"] += await context.repo.upsert_wiki_versions(wiki_versions_rows)
-    summary["raw_wiki_synced"] += raw_wiki_count
-    summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_entity_rows)
+    async with context.write():
+        summary["wiki_versions_synced"] += await context.repo.upsert_wiki_versions(
+            wiki_versions_rows
+        )
+        summary["raw_wiki_synced"] += raw_wiki_count
+        summary["raw_entities_synced"] += await context.repo.upsert_raw_entities(raw_entity_rows)
 
 
-async def _iter_paginated(
-    fetch_page: Callable[[int, int], Awaitable[dict[str, Any]]],
+async def _drop_unchanged(
+    context: SyncContext,
+    items: list[dict[str, Any]],
+    *,
+    entity_type: str,
+    endpoint: str,
+    summary: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """Keep only items whose payload hash differs from the stored `raw_entity` copy.
+
+    Modules without an `updated_on` filter re-list everything; unchanged entities skip
+    their normalized and raw upserts, and a page with no changes is skipped entirely.
+    """
+
+    if not items:
+        return items
+    stored = await context.repo.load_raw_entity_hashes(
+        entity_type=entity_type,
+        endpoint=endpoint,
+        entity_ids=[str(item["id"]) for item in items],
+    )
+    changed = [item for item in items if stored.get(str(item["id"])) != payload_hash(item)]
+    summary["entities_unchanged"] += len(items) - len(changed)
+    if not changed:
+        summary["pages_unchanged"] += 1
+    return changed
+
+
+async def fetch_each[T](
+    items: list[T],
+    fetch: Callable[[T], Awaitable[dict[str, Any]]],
+    *,
+    concurrency: int | None = None,
+) -> list[tuple[T, dict[str, Any] | httpx.HTTPError]]:
+    """Fetch per-item detail payloads with bounded fan-out, returned in input order.
+
+    HTTP errors are returned in place of the payload so one failing item does not abort
+    the module; cancellation and non-HTTP errors still propagate.
+    """
+
+    semaphore = asyncio.Semaphore(
+        concurrency if concurrency is not None else get_settings().sync_detail_concurrency
+    )
+
+    async def _fetch_one(item: T) -> tuple[T, dict[str, Any] | httpx.HTTPError]:
+        async with semaphore:
+            try:
+                return item, await fetch(item)
+            except httpx.HTTPError as exc:
+                return item, exc
+
+    return list(await asyncio.gather(*(_fetch_one(item) for item in items)))
+
+
+def _record_item_failure(
+    summary: dict[str, Any], *, module: str, reference: str, exc: httpx.HTTPError
+) -> None:
+    status_code = exc.response.status_code if isinstance(exc, httpx.HTTPStatusError) else None
+    logger.warning(
+        "Skipping item after fetch failure",
+        extra={
+            "sync_module": module,
+            "reference": reference,
+            "status_code": status_code,
+            "detail": str(exc),
+        },
+    )
+    summary["items_failed"].append(
+        {"module": module, "reference": reference, "status_code": status_code}
+    )
+
+
+async def iter_paginated(
+    fetch_page: Callable[[int, int], Coroutine[Any, Any, dict[str, Any]]],
     *,
     payload_key: str,
     page_size: int = 100,
+    prefetch: int | None = None,
+    start_offset: int = 0,
+    progress: SyncProgress | None = None,
+    module: str | None = None,
 ) -> AsyncIterator[list[dict[str, Any]]]:
-    offset = 0
-    while True:
+    """Yield pages in offset order, fetching up to `prefetch` later pages concurrently.
+
+    The window needs `total_count` from the first response; endpoints without it are
+    paged sequentially until a short or repeated page. `start_offset` resumes mid-listing.
+    With `progress`, each page the caller finished is counted under `module` (default
+    `payload_key`) and a requested cancellation stops the listing before the next page.
+    """
+
+    label = module or payload_key
+
+    def _page_finished(page: list[dict[str, Any]]) -> None:
+        if progress is not None:
+            progress.page_done(label, rows=len(page))
+            progress.checkpoint()
+
+    window = prefetch if prefetch is not None else get_settings().sync_page_prefetch
+    if progress is not None:
+        progress.checkpoint()
+    payload = await fetch_page(page_size, start_offset)
+    items = list(payload.get(payload_key, []))
+    limit = max(int(payload.get("limit", page_size)), 1)
+    if progress is not None:
+        progress.start_listing(
+            label,
+            pages_total=(
+                max(-(-(int(payload["total_count"]) - start_offset) // limit), 1)
+                if "total_count" in payload
+                else None
+            ),
+        )
+    yield items
+    _page_finished(items)
+
+    if "total_count" not in payload:
+        async for page in _iter_sequential_pages(
+            fetch_page,
+            payload_key=payload_key,
+            page_size=page_size,
+            limit=limit,
+            first_page=items,
+            start_offset=start_offset,
+        ):
+            yield page
+            _page_finished(page)
+        return
+
+    offsets = iter(range(start_offset + limit, int(payload["total_count"]), limit))
+    pending: deque[asyncio.Task[dict[str, Any]]] = deque()
+
+    def _fill_window() -> None:
+        for offset in islice(offsets, max(window - len(pending), 0)):
+            pending.append(asyncio.create_task(fetch_page(page_size, offset)))
+
+    _fill_window()
+    try:
+        while pending:
+            payload = await pending.popleft()
+            _fill_window()
+            page = list(payload.get(payload_key, []))
+            yield page
+            _page_finished(page)
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _iter_sequential_pages(
+    fetch_page: Callable[[int, int], Awaitable[dict[str, Any]]],
+    *,
+    payload_key: str,
+    page_size: int,
+    limit: int,
+    first_page: list[dict[str, Any]],
+    start_offset: int = 0,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    previous = first_page
+    offset = start_offset
+    # Endpoints that ignore offset (e.g. non-paginated lists) would repeat the same page.
+    while len(previous) >= limit:
+        offset += limit
         payload = await fetch_page(page_size, offset)
         items = list(payload.get(payload_key, []))
+        if not items or items[:1] == previous[:1]:
+            return
         yield items
+        previous = items
+
+
+async def _plan_cursor_groups(
+    context: SyncContext,
+    *,
+    entity_type: str,
+    module: str,
+    summary: dict[str, Any],
+) -> list[CursorGroup]:
+    """Split the configured projects into fetch groups from their per-project cursors."""
+
+    session = context.session
+    if not context.effective_project_ids:
+        cursor = await _get_or_create_cursor(session, entity_type=entity_type, scope="global")
+        groups = [_resume_group([], [cursor], context=context, module=module, summary=summary)]
+    else:
+        cursors: dict[int, SyncCursor] = {}
+        for project_id in sorted(set(context.effective_project_ids)):
+            cursors[project_id] = await _get_or_create_project_cursor(
+                session, entity_type=entity_type, project_id=project_id
+            )
+
+        groups = []
+        by_token: dict[str, list[int]] = {}
+        for project_id, cursor in cursors.items():
+            if cursor.cursor_token:
+                by_token.setdefault(cursor.cursor_token, []).append(project_id)
+        for token, project_ids in by_token.items():
+            checkpoint = PageCheckpoint.decode(token)
+            if checkpoint is not None and checkpoint.scope == _scope_digest(project_ids):
+                groups.append(
+                    _resume_group(
+                        project_ids,
+                        [cursors[item] for item in project_ids],
+                        context=context,
+                        module=module,
+                        summary=summary,
+                    )
+                )
+                continue
+            # Group membership changed since the interruption: offsets no longer apply.
+            for project_id in project_ids:
+                cursors[project_id].cursor_token = None
+
+        pending = [
+            project_id for project_id, cursor in cursors.items() if cursor.cursor_token is None
+        ]
+        backfill = [item for item in pending if cursors[item].last_seen_updated_on is None]
+        known = [item for item in pending if cursors[item].last_seen_updated_on is not None]
+        if backfill:
+            groups.append(
+                CursorGroup(
+                    project_ids=backfill,
+                    cursors=[cursors[item] for item in backfill],
+                    updated_since=None,
+                    start_offset=0,
+                    high_water=None,
+                    mode="backfill",
+                )
+            )
+        if known:
+            # One request stream from the oldest mark; the cursors converge afterwards.
+            oldest = min(
+                mark
+                for item in known
+                if (mark := _normalize_datetime(cursors[item].last_seen_updated_on)) is not None
+            )
+            groups.append(
+                CursorGroup(
+                    project_ids=known,
+                    cursors=[cursors[item] for item in known],
+                    updated_since=_cursor_lower_bound(oldest, context.overlap_minutes),
+                    start_offset=0,
+                    high_water=oldest,
+                    mode="incremental",
+                )
+            )
+
+    summary["cursor_groups"].extend(group.to_dict(module=module) for group in groups)
+    return groups
 
-        total_count = int(payload.get("total_count", len(items)))
-        limit = int(payload.get("limit", page_size))
-        if total_count == 0:
-            break
 
-        offset += max(limit, 1)
-        if offset >= total_count:
-            break
+def _resume_group(
+    project_ids: list[int],
+    cursors: list[SyncCursor],
+    *,
+    context: SyncContext,
+    module: str,
+    summary: dict[str, Any],
+) -> CursorGroup:
+    resumed_before = len(summary["modules_resumed"])
+    updated_since, start_offset, high_water = _resume_point(
+        cursors[0], context=context, module=module, summary=summary, project_ids=project_ids
+    )
+    if len(summary["modules_resumed"]) > resumed_before:
+        mode = "resumed"
+    elif updated_since is None:
+        mode = "backfill"
+    else:
+        mode = "incremental"
+    return CursorGroup(
+        project_ids=project_ids,
+        cursors=cursors,
+        updated_since=updated_since,
+        start_offset=start_offset,
+        high_water=high_water,
+        mode=mode,
+    )
+
+
+def _resume_point(
+    cursor: SyncCursor,
+    *,
+    context: SyncContext,
+    module: str,
+    summary: dict[str, Any],
+    project_ids: list[int],
+) -> tuple[datetime | None, int, datetime | None]:
+    """Return `(updated_since, start_offset, high_water)` for an incremental module.
+
+    A checkpoint left by a failed run keeps its original `updated_since` filter and
+    resumes one page early, so rows shifted by deletions in the meantime are not skipped.
+    """
 
+    high_water = _normalize_datetime(cursor.last_seen_updated_on)
+    checkpoint = PageCheckpoint.decode(cursor.cursor_token)
+    if checkpoint is None:
+        return _cursor_lower_bound(high_water, context.overlap_minutes), 0, high_water
 
-async def _get_or_create_sync_state(session: AsyncSession, *, key: str) -> SyncState:
+    checkpoint_high_water = _normalize_datetime(checkpoint.high_water)
+    if checkpoint_high_water is not None and (
+        high_water is None or checkpoint_high_water > high_water
+    ):
+        high_water = checkpoint_high_water
+    start_offset = max(checkpoint.offset - _CHECKPOINT_REWIND_ITEMS, 0)
+    summary["modules_resumed"].append(
+        {
+            "module": module,
+            "project_ids": project_ids,
+            "offset": start_offset,
+            "checkpoint_offset": checkpoint.offset,
+        }
+    )
+    logger.info(
+        "Resuming sync module from checkpoint",
+        extra={"sync_module": module, "offset": start_offset},
+    )
+    return checkpoint.updated_since, start_offset, high_water
+
+
+async def get_or_create_sync_state(session: AsyncSession, *, key: str) -> SyncState:
     state = await session.scalar(select(SyncState).where(SyncState.key == key))
     if state is not None:
         return state
@@ -1138,6 +2191,58 @@ async def _get_or_create_cursor(
     return cursor
 
 
+async def _get_or_create_project_cursor(
+    session: AsyncSession,
+    *,
+    entity_type: str,
+    project_id: int,
+) -> SyncCursor:
+    """Per-project cursor, seeded from any older composite or global cursor covering it.
+
+    A composite scope (`"1,2"`) or `"global"` that completed a run fetched every update of
+    this project up to its mark, so the newest such mark is a safe starting point.
+    """
+
+    scope = str(project_id)
+    cursor = await session.scalar(
+        select(SyncCursor).where(
+            SyncCursor.entity_type == entity_type,
+            SyncCursor.project_scope == scope,
+        )
+    )
+    if cursor is not None:
+        return cursor
+
+    seeds = [
+        item
+        for item in await session.scalars(
+            select(SyncCursor).where(
+                SyncCursor.entity_type == entity_type,
+                SyncCursor.last_seen_updated_on.is_not(None),
+            )
+        )
+        if item.project_scope == "global" or scope in item.project_scope.split(",")
+    ]
+    seed = max(
+        seeds,
+        key=lambda item: (
+            _normalize_datetime(item.last_seen_updated_on) or datetime.min.replace(tzinfo=UTC)
+        ),
+        default=None,
+    )
+    cursor = SyncCursor(
+        entity_type=entity_type,
+        project_scope=scope,
+        last_seen_updated_on=seed.last_seen_updated_on if seed is not None else None,
+        last_success_at=seed.last_success_at if seed is not None else None,
+        cursor_token=None,
+        error_message=None,
+    )
+    session.add(cursor)
+    await session.flush()
+    return cursor
+
+
 def _cursor_lower_bound(last_seen: datetime | None, overlap_minutes: int) -> datetime | None:
     if last_seen is None:
         return None
@@ -1153,6 +2258,15 @@ def _project_scope(project_ids: list[int]) -> str:
     return ",".join(str(project_id) for project_id in sorted(project_ids))
 
 
+def _scope_digest(project_ids: list[int]) -> str:
+    # `cursor_token` is bounded, so checkpoints carry a digest rather than the id list.
+    return sha256(_project_scope(project_ids).encode()).hexdigest()[:16]
+
+
+def _isoformat_or_none(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
 def _parse_datetime(value: Any) -> datetime | None:
     if value is None or value == "":
         return None
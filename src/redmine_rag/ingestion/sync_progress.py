@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from time import monotonic
+from typing import Any
+
+# Receives a progress snapshot; returns `True` when the sync should stop.
+ProgressSink = Callable[[dict[str, Any]], Awaitable[bool]]
+
+
+class SyncCancelledError(Exception):
+    """The sync was asked to stop; raised between pages, after the last page committed."""
+
+
+@dataclass(slots=True)
+class ModuleProgress:
+    pages_done: int = 0
+    # `None` once a listing without `total_count` was started.
+    pages_total: int | None = 0
+    rows: int = 0
+    started: float | None = None
+    finished: bool = False
+
+    def to_dict(self, now: float) -> dict[str, Any]:
+        elapsed_s = now - self.started if self.started is not None else 0.0
+        return {
+            "pages_done": self.pages_done,
+            "pages_total": self.pages_total,
+            "rows": self.rows,
+            "rows_per_s": round(self.rows / elapsed_s, 1) if elapsed_s > 0 else None,
+            "eta_s": (
+                0.0 if self.finished else _eta_s(self.pages_done, self.pages_total, elapsed_s)
+            ),
+            "finished": self.finished,
+        }
+
+
+class SyncProgress:
+    """Page-level progress of one sync run, plus its cooperative cancellation flag.
+
+    `iter_paginated` reports the page count of every listing it starts and every page
+    the module finished processing. The ETA extrapolates the page rate over listings
+    started so far, so modules that have not begun are not included. `checkpoint()`
+    raises `SyncCancelledError` once `cancel()` was called; it runs only between pages.
+    """
+
+    def __init__(self) -> None:
+        self._started = monotonic()
+        self._modules: dict[str, ModuleProgress] = {}
+        self._current: str | None = None
+        self._cancel_requested = False
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel_requested
+
+    def cancel(self) -> None:
+        self._cancel_requested = True
+
+    def checkpoint(self) -> None:
+        if self._cancel_requested:
+            raise SyncCancelledError("Sync job cancelled")
+
+    def start_listing(self, module: str, *, pages_total: int | None) -> None:
+        progress = self._module(module)
+        if pages_total is None or progress.pages_total is None:
+            progress.pages_total = None
+        else:
+            progress.pages_total += pages_total
+
+    def page_done(self, module: str, *, rows: int) -> None:
+        progress = self._module(module)
+        progress.pages_done += 1
+        progress.rows += rows
+        if progress.pages_total is not None and progress.pages_done > progress.pages_total:
+            # Sequential listings learn their length only while paging.
+            progress.pages_total = progress.pages_done
+
+    def finish_module(self, module: str) -> None:
+        progress = self._modules.setdefault(module, ModuleProgress())
+        progress.finished = True
+        if progress.pages_total is not None:
+            progress.pages_total = progress.pages_done
+
+    def snapshot(self) -> dict[str, Any]:
+        now = monotonic()
+        elapsed_s = now - self._started
+        pages_done = sum(item.pages_done for item in self._modules.values())
+        known = [
+            item.pages_total for item in self._modules.values() if item.pages_total is not None
+        ]
+        pages_total = sum(known) if len(known) == len(self._modules) else None
+        rows = sum(item.rows for item in self._modules.values())
+        return {
+            "module": self._current,
+            "active_modules": [
+                name
+                for name, item in self._modules.items()
+                if item.started is not None and not item.finished
+            ],
+            "pages_done": pages_done,
+            "pages_total": pages_total,
+            "rows": rows,
+            "rows_per_s": round(rows / elapsed_s, 1) if elapsed_s > 0 else None,
+            "eta_s": _eta_s(pages_done, pages_total, elapsed_s),
+            "elapsed_s": round(elapsed_s, 3),
+            "cancel_requested": self._cancel_requested,
+            "modules": {name: item.to_dict(now) for name, item in self._modules.items()},
+            "updated_at": datetime.now(UTC).isoformat(),
+        }
+
+    def _module(self, module: str) -> ModuleProgress:
+        progress = self._modules.get(module)
+        if progress is None:
+            progress = self._modules[module] = ModuleProgress()
+        if progress.started is None:
+            progress.started = monotonic()
+        self._current = module
+        return progress
+
+
+def _eta_s(pages_done: int, pages_total: int | None, elapsed_s: float) -> float | None:
+    if pages_total is None or pages_done <= 0 or elapsed_s <= 0:
+        return None
+    remaining = max(pages_total - pages_done, 0)
+    return round(remaining * elapsed_s / pages_done, 1)
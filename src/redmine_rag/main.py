@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -11,13 +12,23 @@ from redmine_rag import __version__
 from redmine_rag.api.router import router
 from redmine_rag.core.config import get_settings
 from redmine_rag.core.logging import configure_logging
+from redmine_rag.workers.scheduler import run_periodic_sync_loop
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> AsyncIterator[None]:
     settings = get_settings()
     configure_logging(settings.log_level)
+    scheduler_task = (
+        asyncio.create_task(run_periodic_sync_loop(), name="sync-scheduler")
+        if settings.sync_scheduler_enabled
+        else None
+    )
     yield
+    if scheduler_task is not None:
+        scheduler_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await scheduler_task
 
 
 settings = get_settings()
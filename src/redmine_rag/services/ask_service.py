@@ -35,7 +35,6 @@ from redmine_rag.services.retrieval_service import HybridRetrievalResult, hybrid
 logger = logging.getLogger(__name__)
 
 _TOKEN_PATTERN = re.compile(r"\w+", flags=re.UNICODE)
-_SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+")
 _MIN_CLAIM_CHARS = 24
 _MAX_CLAIMS = 5
 _MAX_CITATIONS_PER_CLAIM = 6
@@ -175,6 +174,8 @@ async def answer_question(payload: AskRequest) -> AskResponse:
             "planner_queries": retrieval.diagnostics.planner_queries,
             "planner_filters_applied": retrieval.diagnostics.planner_filters_applied,
             "planner_error": retrieval.diagnostics.planner_error,
+            "retrieval_cache_status": retrieval.diagnostics.cache_status,
+            "retrieval_cache_hit_ratio": retrieval.diagnostics.cache_hit_ratio,
         },
     )
 
@@ -195,7 +196,6 @@ async def answer_question(payload: AskRequest) -> AskResponse:
 
     deterministic_draft_claims = _build_grounded_claims(
         citations=citations,
-        query=payload.query,
         max_claims=min(payload.top_k, settings.ask_llm_max_claims, _MAX_CLAIMS),
     )
     deterministic_claims = _validate_claims(
@@ -547,14 +547,18 @@ def _parse_ask_llm_payload(raw_response: str) -> tuple[LlmAnswerPayload | None,
 def _build_grounded_claims(
     *,
     citations: list[Citation],
-    query: str,
     max_claims: int,
 ) -> list[GroundedClaim]:
-    query_terms = _evidence_terms(query)
+    """One claim per citation, taken verbatim from its snippet.
+
+    Retrieval already chose the snippet (an FTS5 window or the chunk's best stored
+    sentence), so it is not split into sentences again here.
+    """
+
     claims: list[GroundedClaim] = []
 
     for citation in citations:
-        sentence = _best_sentence(citation.snippet, query_terms)
+        sentence = citation.snippet
         if len(sentence) < _MIN_CLAIM_CHARS:
             continue
         claims.append(
@@ -727,25 +731,6 @@ def _claim_supported_by_snippets(
     return False
 
 
-def _best_sentence(snippet: str, query_terms: set[str]) -> str:
-    candidate_sentences = [
-        sentence.strip().replace("\n", " ")
-        for sentence in _SENTENCE_SPLIT_PATTERN.split(snippet)
-        if sentence.strip()
-    ]
-    if not candidate_sentences:
-        return snippet.strip().replace("\n", " ")
-
-    if not query_terms:
-        return candidate_sentences[0]
-
-    def _score(sentence: str) -> tuple[int, int]:
-        sentence_terms = _evidence_terms(sentence)
-        return (len(query_terms.intersection(sentence_terms)), len(sentence))
-
-    return max(candidate_sentences, key=_score)
-
-
 def _evidence_terms(text: str) -> set[str]:
     return {
         token
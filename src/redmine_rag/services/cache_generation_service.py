@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from redmine_rag.db.models import CacheGeneration
+
+
+async def bump_cache_generation(session: AsyncSession, name: str) -> None:
+    """Advance the named generation in the caller's transaction.
+
+    A single upsert, so concurrent writers in different processes never lose a bump.
+    """
+
+    stmt = sqlite_insert(CacheGeneration).values(name=name, generation=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["name"],
+        set_={"generation": CacheGeneration.generation + 1, "updated_at": func.now()},
+    )
+    await session.execute(stmt)
+
+
+async def load_cache_generation(session: AsyncSession, name: str) -> int:
+    """Current value of the named generation; `0` until it was first bumped."""
+
+    value = await session.scalar(
+        select(CacheGeneration.generation).where(CacheGeneration.name == name)
+    )
+    return int(value or 0)
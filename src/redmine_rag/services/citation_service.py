@@ -7,7 +7,7 @@ from redmine_rag.services.retrieval_service import RetrievedChunk
 def to_citations(chunks: list[RetrievedChunk], snippet_length: int = 220) -> list[Citation]:
     citations: list[Citation] = []
     for idx, chunk in enumerate(chunks, start=1):
-        snippet = chunk.text.strip().replace("\n", " ")
+        snippet = (chunk.snippet or chunk.text).strip().replace("\n", " ")
         if len(snippet) > snippet_length:
             snippet = f"{snippet[: snippet_length - 3]}..."
         citations.append(
@@ -7,6 +7,7 @@ import shutil
 import sqlite3
 import time
 from collections import deque
+from dataclasses import replace
 from datetime import UTC, datetime
 from pathlib import Path
 from threading import Lock
@@ -29,9 +30,17 @@ from redmine_rag.api.schemas import (
 from redmine_rag.core.config import get_settings
 from redmine_rag.db.models import SyncJob, SyncState
 from redmine_rag.db.session import get_session_factory
+from redmine_rag.indexing.fts_index import (
+    FTS_SEGMENT_STATS_SQL,
+    FtsSegmentStats,
+    run_fts_maintenance,
+)
+from redmine_rag.ingestion.payload_store import prune_orphan_payloads
+from redmine_rag.ingestion.rate_limiter import RateLimiterSnapshot, get_rate_limiter_snapshot
 from redmine_rag.services.guardrail_service import guardrail_rejection_counters
 from redmine_rag.services.llm_runtime import is_ollama_provider, probe_llm_runtime
 from redmine_rag.services.llm_telemetry_service import get_llm_telemetry_snapshot
+from redmine_rag.services.retrieval_cache_service import get_retrieval_cache_snapshot
 
 _OPS_RUNS: deque[OpsRunRecord] = deque(maxlen=100)
 _OPS_RUNS_LOCK = Lock()
@@ -92,6 +101,10 @@ async def get_health_status() -> HealthResponse:
                     sync_counts.finished = int(count)
                 elif normalized_status == "failed":
                     sync_counts.failed = int(count)
+                elif normalized_status == "skipped":
+                    sync_counts.skipped = int(count)
+                elif normalized_status == "cancelled":
+                    sync_counts.cancelled = int(count)
 
             sync_state = await session.scalar(
                 select(SyncState).where(SyncState.key == "redmine_incremental")
@@ -251,6 +264,24 @@ async def get_health_status() -> HealthResponse:
         )
     )
 
+    cache_snapshot = get_retrieval_cache_snapshot(
+        enabled=settings.retrieval_cache_enabled,
+        shared=settings.retrieval_cache_shared,
+    )
+    checks.append(
+        HealthCheck(
+            name="retrieval_cache",
+            status="ok",
+            detail=json.dumps(cache_snapshot.to_dict(), ensure_ascii=False),
+        )
+    )
+
+    checks.append(
+        await _fts_index_check(segment_warn_threshold=settings.fts_segment_warn_threshold)
+    )
+
+    checks.append(await _redmine_rate_limit_check())
+
     guardrail_counts = guardrail_rejection_counters()
     guardrail_total = sum(guardrail_counts.values())
     guardrail_detail = ", ".join(
@@ -280,6 +311,79 @@ async def get_health_status() -> HealthResponse:
     )
 
 
+async def _fts_index_check(*, segment_warn_threshold: int) -> HealthCheck:
+    try:
+        session_factory = get_session_factory()
+        async with session_factory() as session:
+            row = (await session.execute(text(FTS_SEGMENT_STATS_SQL))).one()
+    except Exception as exc:  # noqa: BLE001
+        return HealthCheck(name="fts_index", status="warn", detail=f"FTS stats unavailable: {exc}")
+
+    stats = FtsSegmentStats(segments=int(row[0] or 0), data_pages=int(row[1] or 0))
+    detail = {**stats.to_dict(), "segment_warn_threshold": segment_warn_threshold}
+    return HealthCheck(
+        name="fts_index",
+        status="warn" if stats.segments > segment_warn_threshold else "ok",
+        detail=json.dumps(detail, ensure_ascii=False),
+    )
+
+
+async def _redmine_rate_limit_check() -> HealthCheck:
+    snapshot, source = await _load_job_rate_limit_snapshot()
+    if snapshot is None:
+        snapshot, source = get_rate_limiter_snapshot(), {"source": "process"}
+    if snapshot is None:
+        return HealthCheck(
+            name="redmine_rate_limit",
+            status="ok",
+            detail="No Redmine requests observed yet",
+        )
+    # Warn while Redmine asks us to back off or the AIMD window has collapsed to its floor.
+    throttled = snapshot.blocked_for_s > 0 or (
+        snapshot.throttled_responses > 0 and snapshot.concurrency_limit <= snapshot.min_concurrency
+    )
+    return HealthCheck(
+        name="redmine_rate_limit",
+        status="warn" if throttled else "ok",
+        detail=json.dumps({**snapshot.to_dict(), **source}, ensure_ascii=False),
+    )
+
+
+async def _load_job_rate_limit_snapshot() -> tuple[RateLimiterSnapshot | None, dict[str, Any]]:
+    """Limiter state from the most recent sync job progress, written by whichever process
+    ran the sync; `blocked_for_s` is aged by the time since it was written."""
+
+    try:
+        session_factory = get_session_factory()
+        async with session_factory() as session:
+            row = (
+                await session.execute(
+                    select(SyncJob.id, SyncJob.progress)
+                    .where(func.json_extract(SyncJob.progress, "$.rate_limiter").is_not(None))
+                    .order_by(func.json_extract(SyncJob.progress, "$.updated_at").desc())
+                    .limit(1)
+                )
+            ).first()
+    except Exception:  # noqa: BLE001
+        logger.warning("Persisted rate limiter state unavailable", exc_info=True)
+        return None, {}
+    if row is None:
+        return None, {}
+    job_id, progress = row
+    try:
+        snapshot = RateLimiterSnapshot.from_dict(progress["rate_limiter"])
+        observed_at = datetime.fromisoformat(str(progress["updated_at"]))
+    except (KeyError, TypeError, ValueError):
+        return None, {}
+    age_s = max(0.0, (datetime.now(UTC) - observed_at).total_seconds())
+    snapshot = replace(snapshot, blocked_for_s=round(max(0.0, snapshot.blocked_for_s - age_s), 4))
+    return snapshot, {
+        "source": "sync_job",
+        "job_id": job_id,
+        "observed_at": observed_at.isoformat(),
+    }
+
+
 async def get_ops_environment() -> OpsEnvironmentResponse:
     settings = get_settings()
     return OpsEnvironmentResponse(
@@ -466,10 +570,25 @@ def run_sqlite_maintenance() -> dict[str, Any]:
     started = time.perf_counter()
     with sqlite3.connect(db_path) as conn:
         conn.execute("PRAGMA wal_checkpoint(TRUNCATE);")
+        fts_result = run_fts_maintenance(
+            conn,
+            prefix_lengths=settings.fts_prefix_lengths,
+            detail=settings.fts_detail,
+            automerge=settings.fts_automerge,
+            crisismerge=settings.fts_crisismerge,
+            merge_pages=settings.fts_merge_pages,
+            merge_max_steps=settings.fts_merge_max_steps,
+        )
+        payloads_pruned = prune_orphan_payloads(conn)
         conn.execute("VACUUM;")
         conn.execute("ANALYZE;")
     elapsed_ms = int((time.perf_counter() - started) * 1000)
-    return {"database": str(db_path), "elapsed_ms": elapsed_ms}
+    return {
+        "database": str(db_path),
+        "elapsed_ms": elapsed_ms,
+        "fts": fts_result.to_dict() if fts_result is not None else None,
+        "raw_payloads_pruned": payloads_pruned,
+    }
 
 
 def resolve_sqlite_db_path(database_url: str) -> Path:
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from redmine_rag.db.models import IssueStatus, Project, Tracker
+from redmine_rag.services.cache_generation_service import (
+    bump_cache_generation,
+    load_cache_generation,
+)
+
+REFERENCE_DATA_GENERATION = "reference_data"
+
+
+@dataclass(slots=True, frozen=True)
+class ReferenceStatus:
+    name: str
+    is_closed: bool
+
+
+@dataclass(slots=True, frozen=True)
+class ReferenceData:
+    project_ids: frozenset[int]
+    tracker_ids: frozenset[int]
+    statuses: dict[int, ReferenceStatus]
+
+    @property
+    def status_ids(self) -> frozenset[int]:
+        return frozenset(self.statuses)
+
+
+@dataclass(slots=True, frozen=True)
+class ReferenceCacheSnapshot:
+    cached: bool
+    version: int
+    generation: int | None
+    hits: int
+    loads: int
+    invalidations: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "cached": self.cached,
+            "version": self.version,
+            "generation": self.generation,
+            "hits": self.hits,
+            "loads": self.loads,
+            "invalidations": self.invalidations,
+        }
+
+
+@dataclass(slots=True)
+class _CacheState:
+    data: ReferenceData | None
+    database_url: str | None
+    generation: int | None
+    loaded_at: float
+    version: int
+    hits: int
+    loads: int
+    invalidations: int
+
+
+_LOCK = Lock()
+_STATE = _CacheState(
+    data=None,
+    database_url=None,
+    generation=None,
+    loaded_at=0.0,
+    version=0,
+    hits=0,
+    loads=0,
+    invalidations=0,
+)
+
+
+async def get_reference_data(session: AsyncSession, *, ttl_s: float) -> ReferenceData:
+    """Return cached project/tracker/status ids, reloading once they may be stale.
+
+    Entries are keyed on the `reference_data` cache generation, which every sync that
+    touches reference modules bumps, so updates from another process (CLI sync, worker)
+    are seen on the next call. `ttl_s` still bounds the age of an entry; 0 disables caching.
+    """
+
+    database_url = str(session.get_bind().engine.url)
+    generation = await _load_generation(session)
+    with _LOCK:
+        data = _STATE.data
+        if (
+            data is not None
+            and ttl_s > 0
+            and _STATE.database_url == database_url
+            and _STATE.generation == generation
+            and monotonic() - _STATE.loaded_at < ttl_s
+        ):
+            _STATE.hits += 1
+            return data
+        version = _STATE.version
+
+    data = await _load_reference_data(session)
+    if data is None:
+        return ReferenceData(project_ids=frozenset(), tracker_ids=frozenset(), statuses={})
+
+    with _LOCK:
+        _STATE.loads += 1
+        # A concurrent invalidation means this load may predate the sync commit.
+        if _STATE.version == version:
+            _STATE.data = data
+            _STATE.database_url = database_url
+            _STATE.generation = generation
+            _STATE.loaded_at = monotonic()
+    return data
+
+
+async def mark_reference_data_updated(session: AsyncSession) -> None:
+    """Advance the persisted reference generation and drop the local entry."""
+
+    await bump_cache_generation(session, REFERENCE_DATA_GENERATION)
+    invalidate_reference_cache()
+
+
+def invalidate_reference_cache() -> None:
+    with _LOCK:
+        _STATE.data = None
+        _STATE.version += 1
+        _STATE.invalidations += 1
+
+
+def reset_reference_cache() -> None:
+    with _LOCK:
+        _STATE.data = None
+        _STATE.database_url = None
+        _STATE.generation = None
+        _STATE.loaded_at = 0.0
+        _STATE.version = 0
+        _STATE.hits = 0
+        _STATE.loads = 0
+        _STATE.invalidations = 0
+
+
+def get_reference_cache_snapshot() -> ReferenceCacheSnapshot:
+    with _LOCK:
+        return ReferenceCacheSnapshot(
+            cached=_STATE.data is not None,
+            version=_STATE.version,
+            generation=_STATE.generation,
+            hits=_STATE.hits,
+            loads=_STATE.loads,
+            invalidations=_STATE.invalidations,
+        )
+
+
+async def _load_generation(session: AsyncSession) -> int | None:
+    try:
+        return await load_cache_generation(session, REFERENCE_DATA_GENERATION)
+    except OperationalError:
+        # Schema predates cache generations; only the TTL bounds staleness.
+        return None
+
+
+async def _load_reference_data(session: AsyncSession) -> ReferenceData | None:
+    try:
+        project_ids = frozenset(int(item) for item in (await session.scalars(select(Project.id))))
+        tracker_ids = frozenset(int(item) for item in (await session.scalars(select(Tracker.id))))
+        status_rows = (
+            await session.execute(select(IssueStatus.id, IssueStatus.name, IssueStatus.is_closed))
+        ).all()
+    except OperationalError:
+        return None
+
+    statuses = {
+        int(status_id): ReferenceStatus(name=str(name), is_closed=bool(is_closed))
+        for status_id, name, is_closed in status_rows
+    }
+    return ReferenceData(project_ids=project_ids, tracker_ids=tracker_ids, statuses=statuses)
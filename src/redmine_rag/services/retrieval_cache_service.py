@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import sha1
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+import orjson
+from sqlalchemy import delete, select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from redmine_rag.api.schemas import AskFilters
+from redmine_rag.core.config import Settings
+from redmine_rag.db.models import RetrievalCacheEntry
+from redmine_rag.db.session import get_session_factory
+from redmine_rag.services.cache_generation_service import bump_cache_generation
+
+RETRIEVAL_INDEX_GENERATION = "retrieval_index"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class RetrievalCacheSnapshot:
+    enabled: bool
+    shared: bool
+    entries: int
+    max_entries: int
+    hits: int
+    shared_hits: int
+    misses: int
+    stores: int
+    evictions: int
+    invalidations: int
+    hit_ratio: float
+    generation: str | None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "shared": self.shared,
+            "entries": self.entries,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_ratio": self.hit_ratio,
+            "generation": self.generation,
+        }
+
+
+@dataclass(slots=True)
+class _CacheState:
+    entries: OrderedDict[str, object]
+    generation: str | None
+    max_entries: int
+    hits: int
+    shared_hits: int
+    misses: int
+    stores: int
+    evictions: int
+    invalidations: int
+
+
+_LOCK = Lock()
+_STATE = _CacheState(
+    entries=OrderedDict(),
+    generation=None,
+    max_entries=256,
+    hits=0,
+    shared_hits=0,
+    misses=0,
+    stores=0,
+    evictions=0,
+    invalidations=0,
+)
+
+
+def build_retrieval_cache_key(
+    *,
+    query: str,
+    filters: AskFilters,
+    top_k: int,
+    settings: Settings,
+) -> str:
+    """Stable key over normalized query, filters, top_k and ranking-relevant settings."""
+
+    material = {
+        "query": " ".join(query.lower().split()),
+        "project_ids": sorted(set(filters.project_ids)),
+        "tracker_ids": sorted(set(filters.tracker_ids)),
+        "status_ids": sorted(set(filters.status_ids)),
+        "from_date": filters.from_date.isoformat() if filters.from_date is not None else None,
+        "to_date": filters.to_date.isoformat() if filters.to_date is not None else None,
+        "top_k": top_k,
+        "database_url": settings.database_url,
+        "vector_index_path": settings.vector_index_path,
+        "embedding_dim": settings.embedding_dim,
+        "lexical_weight": settings.retrieval_lexical_weight,
+        "vector_weight": settings.retrieval_vector_weight,
+        "rrf_k": settings.retrieval_rrf_k,
+        "candidate_multiplier": settings.retrieval_candidate_multiplier,
+        "planner_enabled": settings.retrieval_planner_enabled,
+        "planner_max_expansions": settings.retrieval_planner_max_expansions,
+        "fts_prefix_lengths": sorted(set(settings.fts_prefix_lengths)),
+    }
+    return sha1(orjson.dumps(material, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+async def load_index_generation(session: AsyncSession, *, index_path: str) -> str | None:
+    """Return an opaque token that changes whenever chunks or embeddings change.
+
+    Combines the `retrieval_index` cache generation bumped after chunk/embedding refreshes,
+    the highest chunk id and the vector index file mtime. `None` disables caching.
+    """
+
+    try:
+        row = (
+            await session.execute(
+                text(
+                    """
+                    SELECT
+                      (SELECT generation FROM cache_generation WHERE name = :name) AS marker,
+                      (SELECT max(id) FROM doc_chunk) AS max_chunk_id
+                    """
+                ),
+                {"name": RETRIEVAL_INDEX_GENERATION},
+            )
+        ).one()
+    except OperationalError:
+        return None
+
+    return f"{row[0]}|{row[1]}|{_file_mtime_ns(index_path)}"
+
+
+async def mark_retrieval_index_updated(session: AsyncSession) -> None:
+    """Advance the persisted index generation and drop local cache entries."""
+
+    await bump_cache_generation(session, RETRIEVAL_INDEX_GENERATION)
+    invalidate_retrieval_cache()
+
+
+def get_cached_retrieval(key: str, *, generation: str, max_entries: int) -> object | None:
+    with _LOCK:
+        _sync_generation(generation, max_entries=max_entries)
+        value = _STATE.entries.get(key)
+        if value is None:
+            _STATE.misses += 1
+            return None
+        _STATE.entries.move_to_end(key)
+        _STATE.hits += 1
+        return value
+
+
+def store_cached_retrieval(
+    key: str,
+    value: object,
+    *,
+    generation: str,
+    max_entries: int,
+) -> None:
+    with _LOCK:
+        _sync_generation(generation, max_entries=max_entries)
+        if _STATE.generation != generation:
+            return
+        _STATE.entries[key] = value
+        _STATE.entries.move_to_end(key)
+        _STATE.stores += 1
+        _evict_overflow()
+
+
+def record_shared_hit(key: str, value: object, *, generation: str, max_entries: int) -> None:
+    with _LOCK:
+        _sync_generation(generation, max_entries=max_entries)
+        # The preceding local lookup already counted a miss; reclassify it.
+        _STATE.misses = max(_STATE.misses - 1, 0)
+        _STATE.hits += 1
+        _STATE.shared_hits += 1
+        _STATE.entries[key] = value
+        _STATE.entries.move_to_end(key)
+        _evict_overflow()
+
+
+def invalidate_retrieval_cache() -> None:
+    with _LOCK:
+        if _STATE.entries:
+            _STATE.invalidations += 1
+        _STATE.entries.clear()
+        _STATE.generation = None
+
+
+def reset_retrieval_cache() -> None:
+    with _LOCK:
+        _STATE.entries.clear()
+        _STATE.generation = None
+        _STATE.hits = 0
+        _STATE.shared_hits = 0
+        _STATE.misses = 0
+        _STATE.stores = 0
+        _STATE.evictions = 0
+        _STATE.invalidations = 0
+
+
+def retrieval_cache_hit_ratio() -> float:
+    with _LOCK:
+        return _hit_ratio()
+
+
+def get_retrieval_cache_snapshot(*, enabled: bool, shared: bool) -> RetrievalCacheSnapshot:
+    with _LOCK:
+        return RetrievalCacheSnapshot(
+            enabled=enabled,
+            shared=shared,
+            entries=len(_STATE.entries),
+            max_entries=_STATE.max_entries,
+            hits=_STATE.hits,
+            shared_hits=_STATE.shared_hits,
+            misses=_STATE.misses,
+            stores=_STATE.stores,
+            evictions=_STATE.evictions,
+            invalidations=_STATE.invalidations,
+            hit_ratio=_hit_ratio(),
+            generation=_STATE.generation,
+        )
+
+
+async def load_shared_retrieval(key: str, *, generation: str) -> dict[str, Any] | None:
+    session_factory = get_session_factory()
+    try:
+        async with session_factory() as session:
+            payload = await session.scalar(
+                select(RetrievalCacheEntry.payload).where(
+                    RetrievalCacheEntry.cache_key == key,
+                    RetrievalCacheEntry.generation == generation,
+                )
+            )
+    except OperationalError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    return payload
+
+
+async def store_shared_retrieval(
+    key: str,
+    payload: dict[str, Any],
+    *,
+    generation: str,
+    max_entries: int,
+) -> None:
+    session_factory = get_session_factory()
+    try:
+        async with session_factory() as session:
+            stmt = sqlite_insert(RetrievalCacheEntry).values(
+                cache_key=key,
+                generation=generation,
+                payload=payload,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["cache_key"],
+                set_={"generation": stmt.excluded.generation, "payload": stmt.excluded.payload},
+            )
+            await session.execute(stmt)
+            await session.execute(
+                delete(RetrievalCacheEntry).where(RetrievalCacheEntry.generation != generation)
+            )
+            keep_keys = (
+                select(RetrievalCacheEntry.cache_key)
+                .order_by(RetrievalCacheEntry.updated_at.desc())
+                .limit(max_entries)
+                .scalar_subquery()
+            )
+            await session.execute(
+                delete(RetrievalCacheEntry).where(RetrievalCacheEntry.cache_key.not_in(keep_keys))
+            )
+            await session.commit()
+    except OperationalError as exc:
+        logger.warning("Shared retrieval cache write failed", extra={"error": str(exc)})
+
+
+def _file_mtime_ns(path: str) -> int:
+    try:
+        return Path(path).stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _sync_generation(generation: str, *, max_entries: int) -> None:
+    _STATE.max_entries = max(1, max_entries)
+    if _STATE.generation == generation:
+        return
+    if _STATE.entries:
+        _STATE.invalidations += 1
+    _STATE.entries.clear()
+    _STATE.generation = generation
+
+
+def _evict_overflow() -> None:
+    while len(_STATE.entries) > _STATE.max_entries:
+        _STATE.entries.popitem(last=False)
+        _STATE.evictions += 1
+
+
+def _hit_ratio() -> float:
+    lookups = _STATE.hits + _STATE.misses
+    if lookups == 0:
+        return 0.0
+    return round(_STATE.hits / lookups, 4)
@@ -2,22 +2,40 @@ from __future__ import annotations
 
 import logging
 import re
-from dataclasses import dataclass
+from collections.abc import Sequence
+from copy import deepcopy
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime
 from math import ceil
+from typing import Any
 
-from sqlalchemy import text
+import orjson
+from sqlalchemy import RowMapping, text
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from redmine_rag.api.schemas import AskFilters
-from redmine_rag.core.config import get_settings
+from redmine_rag.core.config import Settings, get_settings
+from redmine_rag.indexing.chunker import sentence_offsets
 from redmine_rag.indexing.embeddings import deterministic_embed_text
 from redmine_rag.indexing.vector_store import LocalNumpyVectorStore
 from redmine_rag.services.query_planner import build_retrieval_plan
+from redmine_rag.services.reference_cache_service import get_reference_data
+from redmine_rag.services.retrieval_cache_service import (
+    build_retrieval_cache_key,
+    get_cached_retrieval,
+    load_index_generation,
+    load_shared_retrieval,
+    record_shared_hit,
+    retrieval_cache_hit_ratio,
+    store_cached_retrieval,
+    store_shared_retrieval,
+)
 
 logger = logging.getLogger(__name__)
 
+_SNIPPET_TOKENS = 32
+
 
 @dataclass(slots=True)
 class RetrievedChunk:
@@ -31,6 +49,7 @@ class RetrievedChunk:
     vector_rank: int | None = None
     lexical_score: float | None = None
     vector_score: float | None = None
+    snippet: str | None = None
 
 
 @dataclass(slots=True)
@@ -51,6 +70,8 @@ class RetrievalDiagnostics:
     planner_error: str | None = None
     planner_queries: list[str] | None = None
     planner_filters_applied: dict[str, object] | None = None
+    cache_status: str = "disabled"
+    cache_hit_ratio: float | None = None
 
 
 @dataclass(slots=True)
@@ -69,6 +90,7 @@ class _ChunkRecord:
     updated_on: datetime | None
     lexical_score: float | None = None
     vector_score: float | None = None
+    sentence_offsets: list[list[int]] | None = None
 
 
 def fuse_rankings(
@@ -96,6 +118,92 @@ async def hybrid_retrieve(
     top_k: int,
 ) -> HybridRetrievalResult:
     settings = get_settings()
+    if not settings.retrieval_cache_enabled:
+        return await _hybrid_retrieve_uncached(session, query, filters, top_k, settings=settings)
+
+    generation = await load_index_generation(session, index_path=settings.vector_index_path)
+    if generation is None:
+        return await _hybrid_retrieve_uncached(session, query, filters, top_k, settings=settings)
+
+    cache_key = build_retrieval_cache_key(
+        query=query,
+        filters=filters,
+        top_k=top_k,
+        settings=settings,
+    )
+    cached = get_cached_retrieval(
+        cache_key,
+        generation=generation,
+        max_entries=settings.retrieval_cache_max_entries,
+    )
+    if isinstance(cached, HybridRetrievalResult):
+        return _with_cache_status(cached, status="hit")
+
+    if settings.retrieval_cache_shared:
+        shared_payload = await load_shared_retrieval(cache_key, generation=generation)
+        shared_result = _result_from_payload(shared_payload) if shared_payload else None
+        if shared_result is not None:
+            record_shared_hit(
+                cache_key,
+                shared_result,
+                generation=generation,
+                max_entries=settings.retrieval_cache_max_entries,
+            )
+            return _with_cache_status(shared_result, status="shared_hit")
+
+    result = await _hybrid_retrieve_uncached(session, query, filters, top_k, settings=settings)
+    if result.diagnostics.planner_error is None:
+        store_cached_retrieval(
+            cache_key,
+            result,
+            generation=generation,
+            max_entries=settings.retrieval_cache_max_entries,
+        )
+        if settings.retrieval_cache_shared:
+            await store_shared_retrieval(
+                cache_key,
+                _result_to_payload(result),
+                generation=generation,
+                max_entries=settings.retrieval_cache_max_entries,
+            )
+    return _with_cache_status(result, status="miss")
+
+
+def _with_cache_status(result: HybridRetrievalResult, *, status: str) -> HybridRetrievalResult:
+    """Return a private copy; the cached result itself must never reach callers."""
+
+    diagnostics = replace(
+        deepcopy(result.diagnostics),
+        cache_status=status,
+        cache_hit_ratio=retrieval_cache_hit_ratio(),
+    )
+    return HybridRetrievalResult(chunks=deepcopy(result.chunks), diagnostics=diagnostics)
+
+
+def _result_to_payload(result: HybridRetrievalResult) -> dict[str, Any]:
+    return {
+        "chunks": [asdict(chunk) for chunk in result.chunks],
+        "diagnostics": asdict(result.diagnostics),
+    }
+
+
+def _result_from_payload(payload: dict[str, Any]) -> HybridRetrievalResult | None:
+    try:
+        chunks = [RetrievedChunk(**item) for item in payload.get("chunks", [])]
+        diagnostics = RetrievalDiagnostics(**payload["diagnostics"])
+    except (KeyError, TypeError):
+        return None
+    return HybridRetrievalResult(chunks=chunks, diagnostics=diagnostics)
+
+
+async def _hybrid_retrieve_uncached(
+    session: AsyncSession,
+    query: str,
+    filters: AskFilters,
+    top_k: int,
+    *,
+    settings: Settings,
+) -> HybridRetrievalResult:
     candidate_limit = max(top_k * settings.retrieval_candidate_multiplier, top_k)
     planner_queries = [query]
     effective_filters = filters
@@ -126,6 +234,7 @@ async def hybrid_retrieve(
                 session=session,
                 base_filters=filters,
                 suggested_filters=plan.suggested_filters,
+                reference_cache_ttl_s=settings.reference_cache_ttl_s,
             )
             planner_queries = _plan_queries(
                 original_query=query,
@@ -148,17 +257,15 @@ async def hybrid_retrieve(
         )
 
     per_query_limit = max(top_k, ceil(candidate_limit / max(len(planner_queries), 1)))
-    lexical_all: list[_ChunkRecord] = []
+    lexical = await _retrieve_lexical_candidates(
+        session=session,
+        queries=planner_queries,
+        filters=effective_filters,
+        limit=per_query_limit * len(planner_queries),
+        prefix_lengths=settings.fts_prefix_lengths,
+    )
     vector_all: list[_ChunkRecord] = []
     for planner_query in planner_queries:
-        lexical_all.extend(
-            await _retrieve_lexical_candidates(
-                session=session,
-                query=planner_query,
-                filters=effective_filters,
-                limit=per_query_limit,
-            )
-        )
         vector_all.extend(
             await _retrieve_vector_candidates(
                 session=session,
@@ -171,7 +278,6 @@ async def hybrid_retrieve(
             )
         )
 
-    lexical = _dedupe_records(records=lexical_all, score_key="lexical_score")
     vector_records = _dedupe_records(records=vector_all, score_key="vector_score")
 
     lexical_ids = [record.id for record in lexical]
@@ -221,8 +327,20 @@ async def hybrid_retrieve(
         ),
     )
 
+    selected_ids = ranked_ids[:top_k]
+    lexical_snippets = await _load_lexical_snippets(
+        session=session,
+        queries=planner_queries,
+        chunk_ids=[chunk_id for chunk_id in selected_ids if chunk_id in lexical_by_id],
+        enabled=settings.fts_detail == "full",
+        prefix_lengths=settings.fts_prefix_lengths,
+    )
+    snippet_terms = {
+        term for planner_query in planner_queries for term in _query_terms(planner_query)
+    }
+
     chunks: list[RetrievedChunk] = []
-    for chunk_id in ranked_ids[:top_k]:
+    for chunk_id in selected_ids:
         record = lexical_by_id.get(chunk_id) or vector_by_id.get(chunk_id)
         if record is None:
             continue
@@ -241,6 +359,7 @@ async def hybrid_retrieve(
                 vector_rank=vector_rank_map.get(chunk_id),
                 lexical_score=(lexical_by_id.get(chunk_id) or record).lexical_score,
                 vector_score=(vector_by_id.get(chunk_id) or record).vector_score,
+                snippet=lexical_snippets.get(chunk_id) or _sentence_snippet(record, snippet_terms),
             )
         )
 
@@ -320,20 +439,18 @@ async def _apply_planner_filters(
     session: AsyncSession,
     base_filters: AskFilters,
     suggested_filters: AskFilters,
+    reference_cache_ttl_s: float,
 ) -> AskFilters:
-    allowed_projects = await _load_allowed_ids(session, "project")
-    allowed_trackers = await _load_allowed_ids(session, "tracker")
-    allowed_statuses = await _load_allowed_ids(session, "issue_status")
+    reference = await get_reference_data(session, ttl_s=reference_cache_ttl_s)
+    status_ids = reference.status_ids
 
     suggested_project_ids = [
-        item for item in suggested_filters.project_ids if item in allowed_projects
+        item for item in suggested_filters.project_ids if item in reference.project_ids
     ]
     suggested_tracker_ids = [
-        item for item in suggested_filters.tracker_ids if item in allowed_trackers
-    ]
-    suggested_status_ids = [
-        item for item in suggested_filters.status_ids if item in allowed_statuses
+        item for item in suggested_filters.tracker_ids if item in reference.tracker_ids
     ]
+    suggested_status_ids = [item for item in suggested_filters.status_ids if item in status_ids]
 
     return AskFilters(
         project_ids=base_filters.project_ids or suggested_project_ids,
@@ -344,20 +461,6 @@ async def _apply_planner_filters(
     )
 
 
-async def _load_allowed_ids(session: AsyncSession, table_name: str) -> set[int]:
-    try:
-        rows = (await session.execute(text(f"SELECT id FROM {table_name}"))).all()
-    except OperationalError:
-        return set()
-    allowed: set[int] = set()
-    for row in rows:
-        try:
-            allowed.add(int(row[0]))
-        except (TypeError, ValueError):
-            continue
-    return allowed
-
-
 def _filters_to_diagnostics(filters: AskFilters) -> dict[str, object]:
     return {
         "project_ids": list(filters.project_ids),
@@ -371,41 +474,54 @@ def _filters_to_diagnostics(filters: AskFilters) -> dict[str, object]:
 async def _retrieve_lexical_candidates(
     *,
     session: AsyncSession,
-    query: str,
+    queries: list[str],
     filters: AskFilters,
     limit: int,
+    prefix_lengths: list[int] | None = None,
 ) -> list[_ChunkRecord]:
-    terms = [term for term in re.split(r"\W+", query.lower()) if term]
-    if not terms:
-        return []
+    """Run all planner queries as one FTS5 statement, keeping the best BM25 per chunk.
 
-    match_query = " OR ".join(f'"{term.replace('"', '""')}"' for term in terms)
-    where_clauses = ["doc_chunk_fts MATCH :match_query"]
-    params: dict[str, object] = {"match_query": match_query, "limit": limit}
-    _append_filter_clauses(where_clauses=where_clauses, params=params, filters=filters)
-
-    sql = f"""
-    SELECT
-      dc.id,
-      dc.text,
-      dc.url,
-      dc.source_type,
-      dc.source_id,
-      dc.source_updated_on,
-      bm25(doc_chunk_fts) AS rank
-    FROM doc_chunk_fts
-    JOIN doc_chunk AS dc ON dc.id = doc_chunk_fts.rowid
-    LEFT JOIN issue AS i ON i.id = dc.issue_id
-    WHERE {" AND ".join(where_clauses)}
-    ORDER BY rank ASC, dc.id ASC
-    LIMIT :limit
+    If FTS5 rejects the combined statement, each query is retried on its own, so a
+    malformed expansion only loses its own hits instead of every planner query's.
     """
 
-    try:
-        rows = (await session.execute(text(sql), params)).mappings().all()
-    except OperationalError:
+    match_queries: list[str] = []
+    for query in queries:
+        match_query = _build_match_query(query, prefix_lengths=prefix_lengths)
+        if match_query and match_query not in match_queries:
+            match_queries.append(match_query)
+    if not match_queries:
         return []
 
+    try:
+        rows = await _execute_lexical_match(
+            session=session, match_queries=match_queries, filters=filters, limit=limit
+        )
+    except OperationalError as exc:
+        logger.warning(
+            "Combined lexical query failed; retrying planner queries separately",
+            extra={"queries": len(match_queries), "error": str(exc)},
+        )
+        best_rows: dict[int, RowMapping] = {}
+        for match_query in match_queries:
+            try:
+                arm_rows = await _execute_lexical_match(
+                    session=session, match_queries=[match_query], filters=filters, limit=limit
+                )
+            except OperationalError as arm_exc:
+                logger.warning(
+                    "Lexical query rejected by FTS5",
+                    extra={"match_query": match_query, "error": str(arm_exc)},
+                )
+                continue
+            for row in arm_rows:
+                current = best_rows.get(int(row["id"]))
+                if current is None or float(row["rank"] or 0.0) < float(current["rank"] or 0.0):
+                    best_rows[int(row["id"])] = row
+        rows = sorted(
+            best_rows.values(), key=lambda row: (float(row["rank"] or 0.0), int(row["id"]))
+        )[:limit]
+
     output: list[_ChunkRecord] = []
     for row in rows:
         rank = abs(float(row["rank"] or 0.0))
@@ -418,11 +534,62 @@ async def _retrieve_lexical_candidates(
                 source_id=str(row["source_id"]),
                 updated_on=_parse_db_datetime(row.get("source_updated_on")),
                 lexical_score=(1.0 / (1.0 + rank)),
+                sentence_offsets=_parse_sentence_offsets(row.get("sentence_offsets")),
             )
         )
     return output
 
 
+async def _execute_lexical_match(
+    *,
+    session: AsyncSession,
+    match_queries: list[str],
+    filters: AskFilters,
+    limit: int,
+) -> Sequence[RowMapping]:
+    params: dict[str, object] = {"limit": limit}
+    match_arms: list[str] = []
+    for index, match_query in enumerate(match_queries):
+        param_key = f"match_query_{index}"
+        params[param_key] = match_query
+        match_arms.append(
+            "SELECT rowid AS chunk_id, bm25(doc_chunk_fts) AS rank "
+            f"FROM doc_chunk_fts WHERE doc_chunk_fts MATCH :{param_key}"
+        )
+    where_clauses: list[str] = []
+    _append_filter_clauses(where_clauses=where_clauses, params=params, filters=filters)
+    where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+
+    # MATERIALIZED keeps bm25() inside each MATCH arm; a flattened CTE cannot call it.
+    sql = f"""
+    WITH lexical_match AS MATERIALIZED (
+      {" UNION ALL ".join(match_arms)}
+    ),
+    best_match AS (
+      SELECT chunk_id, MIN(rank) AS rank
+      FROM lexical_match
+      GROUP BY chunk_id
+    )
+    SELECT
+      dc.id,
+      dc.text,
+      dc.url,
+      dc.source_type,
+      dc.source_id,
+      dc.source_updated_on,
+      dc.sentence_offsets,
+      best_match.rank AS rank
+    FROM best_match
+    JOIN doc_chunk AS dc ON dc.id = best_match.chunk_id
+    LEFT JOIN issue AS i ON i.id = dc.issue_id
+    {where_sql}
+    ORDER BY rank ASC, dc.id ASC
+    LIMIT :limit
+    """
+
+    return (await session.execute(text(sql), params)).mappings().all()
+
+
 async def _retrieve_vector_candidates(
     *,
     session: AsyncSession,
@@ -465,7 +632,8 @@ async def _retrieve_vector_candidates(
       dc.url,
       dc.source_type,
       dc.source_id,
-      dc.source_updated_on
+      dc.source_updated_on,
+      dc.sentence_offsets
     FROM doc_chunk AS dc
     LEFT JOIN issue AS i ON i.id = dc.issue_id
     WHERE {" AND ".join(where_clauses)}
@@ -492,6 +660,7 @@ async def _retrieve_vector_candidates(
                 source_id=str(row["source_id"]),
                 updated_on=_parse_db_datetime(row.get("source_updated_on")),
                 vector_score=vector_score,
+                sentence_offsets=_parse_sentence_offsets(row.get("sentence_offsets")),
             )
         )
 
@@ -499,6 +668,117 @@ async def _retrieve_vector_candidates(
     return records
 
 
+def _query_terms(query: str) -> list[str]:
+    """Split like the FTS5 `unicode61` tokenizer, which also breaks on `_`.
+
+    A term the tokenizer would split becomes a phrase query, which FTS5 rejects when the
+    table uses `detail=column` or `detail=none`.
+    """
+
+    return [term for term in re.split(r"[\W_]+", query.lower()) if term]
+
+
+def _build_match_query(query: str, *, prefix_lengths: list[int] | None = None) -> str | None:
+    terms = _query_terms(query)
+    if not terms:
+        return None
+    return _or_match_query(terms, prefix_lengths=prefix_lengths)
+
+
+def _or_match_query(terms: list[str], *, prefix_lengths: list[int] | None = None) -> str:
+    """OR the quoted terms; with FTS prefix indexes, terms match as prefixes (`"term"*`).
+
+    Only terms at least as long as the shortest configured prefix become prefix queries:
+    a term whose length equals a configured prefix length is answered from that prefix
+    index, longer ones scan a narrow term range, and shorter ones stay exact so a one- or
+    two-letter term never expands into most of the vocabulary.
+    """
+
+    min_prefix = min(prefix_lengths) if prefix_lengths else None
+    parts = []
+    for term in terms:
+        quoted = f'"{term.replace('"', '""')}"'
+        if min_prefix is not None and len(term) >= min_prefix:
+            quoted += "*"
+        parts.append(quoted)
+    return " OR ".join(parts)
+
+
+async def _load_lexical_snippets(
+    *,
+    session: AsyncSession,
+    queries: list[str],
+    chunk_ids: list[int],
+    enabled: bool,
+    prefix_lengths: list[int] | None = None,
+) -> dict[int, str]:
+    """Ask FTS5 for query-aware snippets of the selected lexical hits (needs `detail=full`)."""
+
+    if not enabled or not chunk_ids:
+        return {}
+    terms = list(dict.fromkeys(term for query in queries for term in _query_terms(query)))
+    if not terms:
+        return {}
+
+    params: dict[str, object] = {
+        "match_query": _or_match_query(terms, prefix_lengths=prefix_lengths),
+        "snippet_tokens": _SNIPPET_TOKENS,
+    }
+    placeholders = []
+    for index, chunk_id in enumerate(chunk_ids):
+        param_key = f"chunk_id_{index}"
+        placeholders.append(f":{param_key}")
+        params[param_key] = chunk_id
+
+    sql = f"""
+    SELECT
+      rowid AS chunk_id,
+      snippet(doc_chunk_fts, 0, '', '', '...', :snippet_tokens) AS snippet
+    FROM doc_chunk_fts
+    WHERE doc_chunk_fts MATCH :match_query
+      AND rowid IN ({", ".join(placeholders)})
+    """
+    try:
+        rows = (await session.execute(text(sql), params)).all()
+    except OperationalError:
+        return {}
+    return {int(row[0]): " ".join(str(row[1]).split()) for row in rows if row[1]}
+
+
+def _sentence_snippet(record: _ChunkRecord, query_terms: set[str]) -> str | None:
+    """Pick the sentence with most query terms using the offsets stored with the chunk."""
+
+    offsets = record.sentence_offsets
+    if offsets is None:
+        offsets = sentence_offsets(record.text)
+    best: str | None = None
+    best_score = -1
+    for start, end in offsets:
+        sentence = record.text[start:end]
+        score = len(query_terms.intersection(_query_terms(sentence)))
+        if score > best_score:
+            best = sentence
+            best_score = score
+    if best is None:
+        return None
+    return " ".join(best.split())
+
+
+def _parse_sentence_offsets(value: object) -> list[list[int]] | None:
+    if isinstance(value, str | bytes):
+        try:
+            value = orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return None
+    if not isinstance(value, list):
+        return None
+    offsets: list[list[int]] = []
+    for item in value:
+        if isinstance(item, list) and len(item) == 2:
+            offsets.append([int(item[0]), int(item[1])])
+    return offsets
+
+
 def _append_filter_clauses(
     *,
     where_clauses: list[str],
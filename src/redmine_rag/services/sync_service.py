@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import UTC, datetime
+import os
+import socket
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
 from uuid import uuid4
 
+import orjson
 from fastapi import BackgroundTasks
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, CursorResult, case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from redmine_rag.api.schemas import (
     SyncJobCounts,
@@ -17,41 +23,206 @@ from redmine_rag.api.schemas import (
 from redmine_rag.core.config import get_settings
 from redmine_rag.db.models import SyncJob
 from redmine_rag.db.session import get_session_factory
-from redmine_rag.ingestion.sync_pipeline import run_incremental_sync
+from redmine_rag.ingestion.sync_pipeline import MODULE_ORDER, run_incremental_sync
+from redmine_rag.ingestion.sync_progress import ProgressSink, SyncCancelledError
+from redmine_rag.workers.locks import SYNC_LOCK_NAME, acquire_lock, release_lock, renew_lock
 
 logger = logging.getLogger(__name__)
 
 
 async def queue_sync_job(payload: SyncRequest, background_tasks: BackgroundTasks) -> SyncResponse:
-    job_id = uuid4().hex
-    session_factory = get_session_factory()
-
-    async with session_factory() as session:
-        session.add(
-            SyncJob(
-                id=job_id,
-                status="queued",
-                payload={
+    settings = get_settings()
+    if settings.sync_job_coalesce:
+        merged = await _coalesce_into_pending_job(
+            project_ids=payload.project_ids or [], modules=payload.modules
+        )
+        if merged is not None:
+            job_id, status = merged
+            logger.info(
+                "Sync request coalesced",
+                extra={
+                    "job_id": job_id,
+                    "job_status": status,
                     "project_ids": payload.project_ids or [],
                     "modules": payload.modules,
                 },
             )
-        )
-        await session.commit()
-
-    background_tasks.add_task(_run_sync_job, job_id)
+            return SyncResponse(
+                job_id=job_id,
+                accepted=True,
+                detail=f"Sync request merged into {status} job",
+                coalesced=True,
+            )
+    job_id = await create_sync_job(
+        {
+            "project_ids": payload.project_ids or [],
+            "modules": payload.modules,
+        }
+    )
+    executor = settings.sync_job_executor
+    if executor == "inline":
+        background_tasks.add_task(run_inline_sync_job, job_id)
     logger.info(
         "Sync job queued",
         extra={
             "job_id": job_id,
             "project_ids": payload.project_ids or [],
             "modules": payload.modules,
+            "executor": executor,
         },
     )
 
     return SyncResponse(job_id=job_id, accepted=True, detail="Sync job queued")
 
 
+async def _coalesce_into_pending_job(
+    *, project_ids: list[int], modules: list[str] | None
+) -> tuple[str, str] | None:
+    """Attach a request to a queued or running job that already covers it.
+
+    Queued jobs are preferred over running ones, since a running job may already be past
+    the pages the new request wants refreshed. Returns `(job_id, status)` of the job the
+    request was merged into and bumps its `coalesced` counter.
+
+    The counter is bumped with a conditional UPDATE that re-checks the job is still
+    pending, so concurrent requests in any process never lose a bump or merge into a job
+    that just finished.
+    """
+
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        pending = (
+            await session.execute(
+                select(SyncJob.id, SyncJob.status, SyncJob.payload)
+                .where(
+                    SyncJob.status.in_(("queued", "running")),
+                    SyncJob.cancel_requested_at.is_(None),
+                )
+                .order_by(
+                    case((SyncJob.status == "queued", 0), else_=1),
+                    SyncJob.created_at,
+                    SyncJob.id,
+                )
+            )
+        ).all()
+        for job_id, status, job_payload in pending:
+            if not _job_covers(job_payload, project_ids=project_ids, modules=modules):
+                continue
+            coalesced = func.coalesce(func.json_extract(SyncJob.payload, "$.coalesced"), 0) + 1
+            result = await session.execute(
+                update(SyncJob)
+                .where(
+                    SyncJob.id == job_id,
+                    SyncJob.status.in_(("queued", "running")),
+                    SyncJob.cancel_requested_at.is_(None),
+                )
+                .values(payload=func.json_set(SyncJob.payload, "$.coalesced", coalesced))
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+            if int(cast(CursorResult[Any], result).rowcount or 0) == 1:
+                return str(job_id), str(status)
+    return None
+
+
+def _job_covers(
+    payload: dict[str, Any], *, project_ids: list[int], modules: list[str] | None
+) -> bool:
+    """Whether a job with `payload` syncs at least the requested projects and modules.
+
+    Empty `project_ids` and `modules=None` mean the configured defaults, which are
+    expanded before comparing; an empty configured project list means every project.
+    """
+
+    settings = get_settings()
+    job_projects = set(payload.get("project_ids") or settings.redmine_project_ids)
+    requested_projects = set(project_ids or settings.redmine_project_ids)
+    if job_projects and (not requested_projects or not requested_projects <= job_projects):
+        return False
+
+    default_modules = settings.redmine_modules or MODULE_ORDER
+    raw_modules = payload.get("modules")
+    job_modules = set(
+        raw_modules if isinstance(raw_modules, list) and raw_modules else default_modules
+    )
+    requested_modules = set(modules or default_modules)
+    return requested_modules <= job_modules
+
+
+async def create_sync_job(
+    payload: dict[str, Any],
+    *,
+    status: str = "queued",
+    lease_owner: str | None = None,
+    lease_ttl_s: float | None = None,
+) -> str:
+    """Store a new job; with `lease_owner` it starts out leased for `lease_ttl_s`."""
+
+    job_id = uuid4().hex
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        now = datetime.now(UTC)
+        terminal = status not in {"queued", "running"}
+        leased = lease_owner is not None and lease_ttl_s is not None
+        session.add(
+            SyncJob(
+                id=job_id,
+                status=status,
+                payload=payload,
+                started_at=now if status != "queued" else None,
+                finished_at=now if terminal else None,
+                lease_owner=lease_owner,
+                lease_expires_at=now + timedelta(seconds=lease_ttl_s or 0) if leased else None,
+                heartbeat_at=now if leased else None,
+            )
+        )
+        await session.commit()
+    return job_id
+
+
+async def fail_abandoned_sync_jobs(session: AsyncSession) -> int:
+    """Fail running jobs whose lease expired before a worker ever claimed them; commits.
+
+    Those rows were started by a scheduler whose process died mid-sync. Workers only
+    reclaim jobs they claimed themselves (`attempts > 0`), so nothing else ends them.
+    """
+
+    now = datetime.now(UTC)
+    result = await session.execute(
+        update(SyncJob)
+        .where(
+            SyncJob.status == "running",
+            SyncJob.attempts == 0,
+            SyncJob.lease_expires_at.is_not(None),
+            SyncJob.lease_expires_at < now,
+        )
+        .values(
+            status="failed",
+            finished_at=now,
+            lease_expires_at=None,
+            error_message="Sync lease expired before the job finished",
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+    failed = int(cast(CursorResult[Any], result).rowcount or 0)
+    if failed:
+        logger.warning("Failed abandoned sync jobs", extra={"jobs": failed})
+    return failed
+
+
+async def update_sync_job_payload(job_id: str, extra: dict[str, Any]) -> None:
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        await session.execute(
+            update(SyncJob)
+            .where(SyncJob.id == job_id)
+            .values(payload=_merged_payload(extra))
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+
+
 async def get_sync_job(job_id: str) -> SyncJobResponse | None:
     session_factory = get_session_factory()
     async with session_factory() as session:
@@ -61,6 +232,34 @@ async def get_sync_job(job_id: str) -> SyncJobResponse | None:
         return _to_sync_job_response(job)
 
 
+async def cancel_sync_job(job_id: str) -> SyncJobResponse | None:
+    """Cancel a queued job, or ask a running one to stop at its next page boundary.
+
+    A running job notices the request the next time it publishes progress
+    (`SYNC_PROGRESS_INTERVAL_S`) and ends as `cancelled`; other states are returned as-is.
+    """
+
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        job = await session.scalar(select(SyncJob).where(SyncJob.id == job_id))
+        if job is None:
+            return None
+        if job.status in {"queued", "running"}:
+            now = datetime.now(UTC)
+            if job.cancel_requested_at is None:
+                job.cancel_requested_at = now
+            if job.status == "queued":
+                job.status = "cancelled"
+                job.finished_at = now
+            await session.commit()
+            await session.refresh(job)
+            logger.info(
+                "Sync job cancellation requested",
+                extra={"job_id": job_id, "job_status": job.status},
+            )
+        return _to_sync_job_response(job)
+
+
 async def list_sync_jobs(
     *,
     limit: int,
@@ -90,6 +289,10 @@ async def list_sync_jobs(
                 counts.finished = int(count)
             elif normalized_status == "failed":
                 counts.failed = int(count)
+            elif normalized_status == "skipped":
+                counts.skipped = int(count)
+            elif normalized_status == "cancelled":
+                counts.cancelled = int(count)
 
         total = int((await session.scalar(select(func.count(SyncJob.id)))) or 0)
         return SyncJobListResponse(
@@ -99,18 +302,27 @@ async def list_sync_jobs(
         )
 
 
-async def _run_sync_job(job_id: str) -> None:
+async def _run_sync_job(job_id: str, *, lease_owner: str | None = None) -> dict[str, Any] | None:
+    """Run a stored job to completion; returns the sync summary, `None` when it failed.
+
+    With `lease_owner` the job was already claimed by a worker (`workers.sync_worker`);
+    its outcome is only written while that worker still holds the lease. Outcomes are
+    written by `_finish_sync_job`, which merges into the stored payload instead of
+    overwriting keys other requests added meanwhile (e.g. `coalesced`).
+    """
+
     session_factory = get_session_factory()
     async with session_factory() as session:
         job = await session.scalar(select(SyncJob).where(SyncJob.id == job_id))
         if job is None:
             logger.error("Sync job not found", extra={"job_id": job_id})
-            return
+            return None
 
-        job.status = "running"
-        job.started_at = datetime.now(UTC)
-        await session.commit()
-        logger.info("Sync job started", extra={"job_id": job_id})
+        if lease_owner is None:
+            job.status = "running"
+            job.started_at = datetime.now(UTC)
+            await session.commit()
+        logger.info("Sync job started", extra={"job_id": job_id, "lease_owner": lease_owner})
 
         try:
             project_ids = list(job.payload.get("project_ids", []))
@@ -118,22 +330,229 @@ async def _run_sync_job(job_id: str) -> None:
             modules = (
                 [str(module) for module in raw_modules] if isinstance(raw_modules, list) else None
             )
-            summary = await run_incremental_sync(project_ids=project_ids, modules_override=modules)
-            job.status = "finished"
-            job.finished_at = datetime.now(UTC)
-            job.payload = {**job.payload, "summary": summary}
-            await session.commit()
+            summary = await run_incremental_sync(
+                project_ids=project_ids,
+                modules_override=modules,
+                on_progress=_job_progress_sink(job_id),
+            )
+            if not await _finish_sync_job(
+                session, job_id, lease_owner, status="finished", payload={"summary": summary}
+            ):
+                return None
             logger.info(
                 "Sync job finished",
                 extra={"job_id": job_id, "project_ids": project_ids},
             )
+            return summary
+        except asyncio.CancelledError:
+            # Shutdown or a lost lease; a row left `running` would block the scheduler.
+            if await _finish_sync_job(
+                session,
+                job_id,
+                lease_owner,
+                status="failed",
+                error_message="Sync interrupted before it finished",
+            ):
+                logger.warning("Sync job interrupted", extra={"job_id": job_id})
+            raise
+        except SyncCancelledError:
+            if not await _finish_sync_job(session, job_id, lease_owner, status="cancelled"):
+                return None
+            logger.info("Sync job cancelled", extra={"job_id": job_id})
+            return None
         except Exception as exc:  # noqa: BLE001
-            job.status = "failed"
-            job.finished_at = datetime.now(UTC)
-            job.error_message = str(exc)
-            job.payload = {**job.payload, "error_type": type(exc).__name__}
-            await session.commit()
+            if not await _finish_sync_job(
+                session,
+                job_id,
+                lease_owner,
+                status="failed",
+                error_message=str(exc),
+                payload={"error_type": type(exc).__name__},
+            ):
+                return None
             logger.exception("Sync job failed", extra={"job_id": job_id})
+            return None
+
+
+async def run_inline_sync_job(job_id: str) -> dict[str, Any] | None:
+    """Run a job queued with `SYNC_JOB_EXECUTOR=inline` in this process.
+
+    Waits for `SYNC_LOCK_NAME`, then leases the queued row like a scheduler run
+    (`attempts` stays 0, so workers never reclaim it) and renews both leases while the
+    sync runs, so the scheduler and workers never start a second sync on top of it.
+    """
+
+    settings = get_settings()
+    owner = f"inline:{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+    ttl_s = settings.sync_worker_lease_ttl_s
+    session_factory = get_session_factory()
+    while True:
+        async with session_factory() as session:
+            status = await session.scalar(select(SyncJob.status).where(SyncJob.id == job_id))
+            if status != "queued":
+                return None
+            if await acquire_lock(session, SYNC_LOCK_NAME, owner=owner, ttl_s=ttl_s):
+                break
+        await asyncio.sleep(settings.sync_worker_poll_interval_s)
+    try:
+        now = datetime.now(UTC)
+        async with session_factory() as session:
+            result = await session.execute(
+                update(SyncJob)
+                .where(SyncJob.id == job_id, SyncJob.status == "queued")
+                .values(
+                    status="running",
+                    started_at=now,
+                    lease_owner=owner,
+                    lease_expires_at=now + timedelta(seconds=ttl_s),
+                    heartbeat_at=now,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+        if int(cast(CursorResult[Any], result).rowcount or 0) != 1:
+            return None
+        return await run_leased_sync_job(job_id, owner=owner, ttl_s=ttl_s, lock_owner=owner)
+    finally:
+        async with session_factory() as session:
+            await release_lock(session, SYNC_LOCK_NAME, owner=owner)
+
+
+async def renew_sync_job_lease(
+    session: AsyncSession, job_id: str, *, owner: str, ttl_s: float
+) -> bool:
+    """Extend a running job's lease; `False` means another worker reclaimed it."""
+
+    now = datetime.now(UTC)
+    result = await session.execute(
+        update(SyncJob)
+        .where(SyncJob.id == job_id, SyncJob.lease_owner == owner, SyncJob.status == "running")
+        .values(heartbeat_at=now, lease_expires_at=now + timedelta(seconds=ttl_s))
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+    return int(cast(CursorResult[Any], result).rowcount or 0) == 1
+
+
+async def run_leased_sync_job(
+    job_id: str, *, owner: str, ttl_s: float, lock_owner: str | None = None
+) -> dict[str, Any] | None:
+    """Run a job leased to `owner`, renewing the lease every third of `ttl_s`.
+
+    With `lock_owner` the `SYNC_LOCK_NAME` lease is renewed by the same heartbeat.
+    Losing either lease cancels the sync, so a reclaimed job never runs twice at once.
+    Returns the sync summary, or `None` when the run failed or was cancelled.
+    """
+
+    run = asyncio.create_task(_run_sync_job(job_id, lease_owner=owner), name=f"sync-job:{job_id}")
+    heartbeat = asyncio.create_task(
+        _renew_job_lease(job_id, owner=owner, ttl_s=ttl_s, lock_owner=lock_owner),
+        name=f"sync-lease:{job_id}",
+    )
+    try:
+        await asyncio.wait({run, heartbeat}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in (run, heartbeat):
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(run, heartbeat, return_exceptions=True)
+    if run.cancelled():
+        logger.warning(
+            "Sync job cancelled after losing its lease",
+            extra={"job_id": job_id, "owner": owner, "lock_owner": lock_owner},
+        )
+        return None
+    return run.result()
+
+
+async def _renew_job_lease(
+    job_id: str, *, owner: str, ttl_s: float, lock_owner: str | None = None
+) -> None:
+    """Renew the job lease (and the sync lock) until one is lost; returning ends the run."""
+
+    session_factory = get_session_factory()
+    while True:
+        await asyncio.sleep(max(ttl_s / 3, 0.1))
+        async with session_factory() as session:
+            if not await renew_sync_job_lease(session, job_id, owner=owner, ttl_s=ttl_s):
+                return
+            if lock_owner is not None and not await renew_lock(
+                session, SYNC_LOCK_NAME, owner=lock_owner, ttl_s=ttl_s
+            ):
+                return
+
+
+def _job_progress_sink(job_id: str) -> ProgressSink:
+    """Write pipeline progress to the job row and report whether a cancel was requested."""
+
+    async def _publish(snapshot: dict[str, Any]) -> bool:
+        session_factory = get_session_factory()
+        async with session_factory() as session:
+            await session.execute(
+                update(SyncJob)
+                .where(SyncJob.id == job_id)
+                .values(progress=snapshot)
+                .execution_options(synchronize_session=False)
+            )
+            cancel_requested_at = await session.scalar(
+                select(SyncJob.cancel_requested_at).where(SyncJob.id == job_id)
+            )
+            await session.commit()
+        return cancel_requested_at is not None
+
+    return _publish
+
+
+async def _finish_sync_job(
+    session: AsyncSession,
+    job_id: str,
+    lease_owner: str | None,
+    *,
+    status: str,
+    error_message: str | None = None,
+    payload: dict[str, Any] | None = None,
+) -> bool:
+    """Record a running job's outcome; commits. `False` means the result was discarded.
+
+    A single conditional UPDATE re-checks that the job is still `running` (and leased to
+    `lease_owner`, when given) and merges `payload` into the stored payload in SQL.
+    """
+
+    conditions: list[ColumnElement[bool]] = [SyncJob.id == job_id, SyncJob.status == "running"]
+    if lease_owner is not None:
+        conditions.append(SyncJob.lease_owner == lease_owner)
+    values: dict[str, Any] = {
+        "status": status,
+        "finished_at": datetime.now(UTC),
+        "lease_expires_at": None,
+    }
+    if error_message is not None:
+        values["error_message"] = error_message
+    if payload:
+        values["payload"] = _merged_payload(payload)
+    result = await session.execute(
+        update(SyncJob)
+        .where(*conditions)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+    if int(cast(CursorResult[Any], result).rowcount or 0) == 1:
+        return True
+    logger.warning(
+        "Sync job lease lost before completion; result discarded",
+        extra={"job_id": job_id, "lease_owner": lease_owner},
+    )
+    return False
+
+
+def _merged_payload(extra: dict[str, Any]) -> ColumnElement[Any]:
+    """SQL expression setting each top-level key of `extra` in the stored payload."""
+
+    merged: ColumnElement[Any] = SyncJob.payload.expression
+    for key, value in extra.items():
+        merged = func.json_set(merged, f"$.{key}", func.json(orjson.dumps(value).decode()))
+    return merged
 
 
 def _to_sync_job_response(job: SyncJob) -> SyncJobResponse:
@@ -144,6 +563,11 @@ def _to_sync_job_response(job: SyncJob) -> SyncJobResponse:
         started_at=job.started_at,
         finished_at=job.finished_at,
         error_message=job.error_message,
+        lease_owner=job.lease_owner,
+        heartbeat_at=job.heartbeat_at,
+        attempts=job.attempts or 0,
+        progress=job.progress,
+        cancel_requested_at=job.cancel_requested_at,
         created_at=job.created_at,
         updated_at=job.updated_at,
     )
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable, Coroutine
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, or_, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from redmine_rag.db.models import SyncLock
+from redmine_rag.db.session import get_session_factory
+
+logger = logging.getLogger(__name__)
+
+SYNC_LOCK_NAME = "redmine_sync"
+
+
+class LockHeldError(RuntimeError):
+    """The named lease is held by another owner."""
+
+
+class LockLostError(RuntimeError):
+    """The named lease was taken over while work ran under it."""
+
+
+async def acquire_lock(session: AsyncSession, name: str, *, owner: str, ttl_s: float) -> bool:
+    """Take the named lease if it is free, expired or already ours; commits.
+
+    A single conditional UPDATE decides ownership, so concurrent processes sharing the
+    database cannot both win.
+    """
+
+    now = datetime.now(UTC)
+    await session.execute(
+        sqlite_insert(SyncLock).values(name=name).on_conflict_do_nothing(index_elements=["name"])
+    )
+    result = await session.execute(
+        update(SyncLock)
+        .where(
+            SyncLock.name == name,
+            or_(
+                SyncLock.owner.is_(None),
+                SyncLock.owner == owner,
+                SyncLock.expires_at.is_(None),
+                SyncLock.expires_at < now,
+            ),
+        )
+        .values(
+            owner=owner,
+            acquired_at=now,
+            heartbeat_at=now,
+            expires_at=now + timedelta(seconds=ttl_s),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+    return int(cast(CursorResult[Any], result).rowcount or 0) == 1
+
+
+async def renew_lock(session: AsyncSession, name: str, *, owner: str, ttl_s: float) -> bool:
+    """Extend our lease; `False` means it expired and was taken over."""
+
+    now = datetime.now(UTC)
+    result = await session.execute(
+        update(SyncLock)
+        .where(SyncLock.name == name, SyncLock.owner == owner)
+        .values(heartbeat_at=now, expires_at=now + timedelta(seconds=ttl_s))
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+    return int(cast(CursorResult[Any], result).rowcount or 0) == 1
+
+
+async def release_lock(session: AsyncSession, name: str, *, owner: str) -> None:
+    await session.execute(
+        update(SyncLock)
+        .where(SyncLock.name == name, SyncLock.owner == owner)
+        .values(owner=None, expires_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+
+
+async def get_lock_owner(session: AsyncSession, name: str) -> str | None:
+    """Current holder of an unexpired lease, if any."""
+
+    row = (
+        await session.execute(
+            select(SyncLock.owner, SyncLock.expires_at).where(SyncLock.name == name)
+        )
+    ).first()
+    if row is None or row.owner is None or row.expires_at is None:
+        return None
+    expires_at = row.expires_at
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=UTC)
+    return str(row.owner) if expires_at >= datetime.now(UTC) else None
+
+
+async def run_under_lock[T](
+    work: Callable[[], Coroutine[Any, Any, T]], *, name: str, owner: str, ttl_s: float
+) -> T:
+    """Run `work()` holding the named lease, renewed every third of `ttl_s`.
+
+    Raises `LockHeldError` when another owner holds the lease. Losing the lease cancels
+    `work` and raises `LockLostError`; the lease is always released afterwards.
+    """
+
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        if not await acquire_lock(session, name, owner=owner, ttl_s=ttl_s):
+            holder = await get_lock_owner(session, name)
+            raise LockHeldError(f"Lock {name!r} is held by {holder}")
+
+    run = asyncio.create_task(work(), name=f"lock-work:{name}")
+    heartbeat = asyncio.create_task(
+        _renew_until_lost(name, owner=owner, ttl_s=ttl_s), name=f"lock-heartbeat:{name}"
+    )
+    try:
+        await asyncio.wait({run, heartbeat}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in (run, heartbeat):
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(run, heartbeat, return_exceptions=True)
+        async with session_factory() as session:
+            await release_lock(session, name, owner=owner)
+    if run.cancelled():
+        raise LockLostError(f"Lock {name!r} was lost while {owner} held it")
+    return run.result()
+
+
+async def _renew_until_lost(name: str, *, owner: str, ttl_s: float) -> None:
+    session_factory = get_session_factory()
+    while True:
+        await asyncio.sleep(max(ttl_s / 3, 0.1))
+        async with session_factory() as session:
+            if not await renew_lock(session, name, owner=owner, ttl_s=ttl_s):
+                logger.warning("Lock lease lost; cancelling", extra={"lock": name, "owner": owner})
+                return
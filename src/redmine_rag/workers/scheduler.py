@@ -2,16 +2,351 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+import random
+import socket
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from threading import Lock
+from time import monotonic
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from redmine_rag.core.config import get_settings
+from redmine_rag.db.models import SyncJob, SyncState
+from redmine_rag.db.session import get_session_factory
+from redmine_rag.ingestion.deletion_sweep import SWEEP_STATE_KEY, run_deletion_sweep
+from redmine_rag.services.sync_service import (
+    create_sync_job,
+    fail_abandoned_sync_jobs,
+    run_leased_sync_job,
+    update_sync_job_payload,
+)
+from redmine_rag.workers.locks import (
+    SYNC_LOCK_NAME,
+    acquire_lock,
+    get_lock_owner,
+    release_lock,
+    renew_lock,
+)
 
 logger = logging.getLogger(__name__)
 
 
-async def run_periodic_sync_loop(interval_seconds: int = 900) -> None:
-    """Simple periodic loop placeholder.
+@dataclass(slots=True, frozen=True)
+class SchedulerSnapshot:
+    owner: str
+    interval_s: float
+    ticks: int
+    runs: int
+    skipped_ticks: int
+    overrun_ticks: int
+    last_outcome: str | None
+    last_job_id: str | None
+    last_changes: int | None
+    next_tick_at: datetime | None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "owner": self.owner,
+            "interval_s": self.interval_s,
+            "ticks": self.ticks,
+            "runs": self.runs,
+            "skipped_ticks": self.skipped_ticks,
+            "overrun_ticks": self.overrun_ticks,
+            "last_outcome": self.last_outcome,
+            "last_job_id": self.last_job_id,
+            "last_changes": self.last_changes,
+            "next_tick_at": self.next_tick_at.isoformat() if self.next_tick_at else None,
+        }
+
+
+class SyncScheduler:
+    """Periodic incremental sync, single-flight across every process sharing the database.
 
-    Replace this with APScheduler/RQ/Celery when workload requires distributed workers.
+    Each tick takes the `sync_lock` lease (renewed by a heartbeat while the sync runs) and
+    runs one `SyncJob`; a tick that finds the lease held or another job running is stored
+    as a `skipped` job instead. The interval halves after a run with at least
+    `busy_changes` inserted/updated rows, grows by half after a run without changes,
+    drifts back to the base otherwise, and is jittered so workers do not align. A run
+    longer than its interval records the ticks it swallowed as a `skipped` overrun job.
     """
 
-    while True:
-        logger.info("Periodic sync tick", extra={"interval_seconds": interval_seconds})
-        await asyncio.sleep(interval_seconds)
+    def __init__(self, *, owner: str | None = None, rng: random.Random | None = None) -> None:
+        settings = get_settings()
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._base_s = settings.sync_scheduler_interval_s
+        self._min_s = min(settings.sync_scheduler_min_interval_s, self._base_s)
+        self._max_s = max(settings.sync_scheduler_max_interval_s, self._base_s)
+        self._jitter = settings.sync_scheduler_jitter
+        self._busy_changes = settings.sync_scheduler_busy_changes
+        self._lock_ttl_s = settings.sync_scheduler_lock_ttl_s
+        self._sweep_interval_s = settings.sync_deletion_sweep_interval_s
+        self._rng = rng or random.Random()
+        self.interval_s = self._base_s
+        self._ticks = 0
+        self._runs = 0
+        self._skipped = 0
+        self._overrun = 0
+        self._last_outcome: str | None = None
+        self._last_job_id: str | None = None
+        self._last_changes: int | None = None
+
+    def adapt(self, changes: int | None) -> float:
+        """Next base interval after a run that changed `changes` rows (`None`: failed)."""
+
+        if changes is None:
+            return self.interval_s
+        if changes >= self._busy_changes:
+            self.interval_s = max(self._min_s, self.interval_s / 2)
+        elif changes == 0:
+            self.interval_s = min(self._max_s, self.interval_s * 1.5)
+        else:
+            self.interval_s = (self.interval_s + self._base_s) / 2
+        return self.interval_s
+
+    def jittered(self, interval_s: float) -> float:
+        if self._jitter <= 0:
+            return interval_s
+        return interval_s * self._rng.uniform(1 - self._jitter, 1 + self._jitter)
+
+    async def tick(self) -> dict[str, Any]:
+        started = monotonic()
+        scheduled_interval_s = self.interval_s
+        self._ticks += 1
+
+        session_factory = get_session_factory()
+        async with session_factory() as session:
+            await fail_abandoned_sync_jobs(session)
+            skip_reason: str | None = None
+            holder = await get_lock_owner(session, SYNC_LOCK_NAME)
+            if holder is not None and holder != self.owner:
+                skip_reason = "lock_held"
+            elif await _running_jobs(session):
+                skip_reason = "sync_running"
+            elif not await acquire_lock(
+                session, SYNC_LOCK_NAME, owner=self.owner, ttl_s=self._lock_ttl_s
+            ):
+                skip_reason = "lock_held"
+                holder = await get_lock_owner(session, SYNC_LOCK_NAME)
+        if skip_reason is not None:
+            return await self._record_skip(skip_reason, holder=holder)
+
+        heartbeat = asyncio.create_task(self._heartbeat(), name="sync-scheduler:heartbeat")
+        work: asyncio.Task[tuple[dict[str, Any] | None, dict[str, Any] | None]] | None = None
+        job_id = ""
+        try:
+            job_id = await create_sync_job(
+                {
+                    "project_ids": [],
+                    "modules": None,
+                    "trigger": "scheduler",
+                    "scheduler_owner": self.owner,
+                },
+                # Created as running and leased so `redmine-rag worker` never claims it,
+                # while a crashed scheduler's row still expires.
+                status="running",
+                lease_owner=self.owner,
+                lease_ttl_s=self._lock_ttl_s,
+            )
+            work = asyncio.create_task(self._run_locked(job_id), name="sync-scheduler:run")
+            await asyncio.wait({work, heartbeat}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            tasks = [task for task in (work, heartbeat) if task is not None]
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            async with session_factory() as session:
+                await release_lock(session, SYNC_LOCK_NAME, owner=self.owner)
+
+        summary: dict[str, Any] | None = None
+        sweep: dict[str, Any] | None = None
+        if work is not None and not work.cancelled():
+            summary, sweep = work.result()
+
+        duration_s = monotonic() - started
+        changes = _count_changes(summary) if summary is not None else None
+        next_interval_s = self.adapt(changes)
+        overrun_ticks = int(duration_s // scheduled_interval_s) if scheduled_interval_s > 0 else 0
+        scheduler_info: dict[str, Any] = {
+            "interval_s": round(scheduled_interval_s, 3),
+            "duration_s": round(duration_s, 3),
+            "changes": changes,
+            "next_interval_s": round(next_interval_s, 3),
+            "overrun_ticks": overrun_ticks,
+        }
+        if sweep is not None:
+            scheduler_info["deletion_sweep"] = sweep
+        await update_sync_job_payload(job_id, {"scheduler": scheduler_info})
+        if overrun_ticks:
+            self._overrun += overrun_ticks
+            await create_sync_job(
+                {
+                    "trigger": "scheduler",
+                    "reason": "overrun",
+                    "missed_ticks": overrun_ticks,
+                    "job_id": job_id,
+                    "duration_s": round(duration_s, 3),
+                    "interval_s": round(scheduled_interval_s, 3),
+                },
+                status="skipped",
+            )
+            logger.warning(
+                "Scheduled sync overran its interval",
+                extra={"job_id": job_id, "missed_ticks": overrun_ticks},
+            )
+
+        self._runs += 1
+        self._last_outcome = "finished" if summary is not None else "failed"
+        self._last_job_id = job_id
+        self._last_changes = changes
+        return {"outcome": self._last_outcome, "job_id": job_id, **scheduler_info}
+
+    async def run_forever(self) -> None:
+        logger.info(
+            "Sync scheduler started", extra={"owner": self.owner, "interval_s": self.interval_s}
+        )
+        while True:
+            tick_started = monotonic()
+            try:
+                await self.tick()
+            except Exception:  # noqa: BLE001
+                self._last_outcome = "error"
+                logger.exception("Sync scheduler tick failed")
+            delay_s = max(0.0, self.jittered(self.interval_s) - (monotonic() - tick_started))
+            _publish(self.snapshot(next_tick_at=datetime.now(UTC) + timedelta(seconds=delay_s)))
+            await asyncio.sleep(delay_s)
+
+    def snapshot(self, *, next_tick_at: datetime | None = None) -> SchedulerSnapshot:
+        return SchedulerSnapshot(
+            owner=self.owner,
+            interval_s=round(self.interval_s, 3),
+            ticks=self._ticks,
+            runs=self._runs,
+            skipped_ticks=self._skipped,
+            overrun_ticks=self._overrun,
+            last_outcome=self._last_outcome,
+            last_job_id=self._last_job_id,
+            last_changes=self._last_changes,
+            next_tick_at=next_tick_at,
+        )
+
+    async def _record_skip(self, reason: str, *, holder: str | None) -> dict[str, Any]:
+        self._skipped += 1
+        self._last_outcome = f"skipped:{reason}"
+        job_id = await create_sync_job(
+            {
+                "trigger": "scheduler",
+                "reason": reason,
+                "scheduler_owner": self.owner,
+                "lock_owner": holder,
+            },
+            status="skipped",
+        )
+        logger.info("Scheduled sync tick skipped", extra={"reason": reason, "lock_owner": holder})
+        return {"outcome": "skipped", "reason": reason, "job_id": job_id}
+
+    async def _run_locked(self, job_id: str) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+        """The work done under the sync lock: the leased sync job, then the due sweep."""
+
+        summary = await run_leased_sync_job(job_id, owner=self.owner, ttl_s=self._lock_ttl_s)
+        sweep = await self._maybe_sweep() if summary is not None else None
+        return summary, sweep
+
+    async def _heartbeat(self) -> None:
+        """Renew the sync lock; returning on a lost lease cancels the locked work."""
+
+        session_factory = get_session_factory()
+        while True:
+            await asyncio.sleep(max(self._lock_ttl_s / 3, 0.1))
+            async with session_factory() as session:
+                if not await renew_lock(
+                    session, SYNC_LOCK_NAME, owner=self.owner, ttl_s=self._lock_ttl_s
+                ):
+                    logger.warning(
+                        "Sync lock lease lost; cancelling the scheduled run",
+                        extra={"owner": self.owner},
+                    )
+                    return
+
+    async def _maybe_sweep(self) -> dict[str, Any] | None:
+        """Run the deletion sweep, still under the lock, once its own interval has elapsed."""
+
+        if self._sweep_interval_s <= 0:
+            return None
+        session_factory = get_session_factory()
+        async with session_factory() as session:
+            last_sweep_at = await session.scalar(
+                select(SyncState.last_success_at).where(SyncState.key == SWEEP_STATE_KEY)
+            )
+        if last_sweep_at is not None:
+            if last_sweep_at.tzinfo is None:
+                last_sweep_at = last_sweep_at.replace(tzinfo=UTC)
+            if datetime.now(UTC) - last_sweep_at < timedelta(seconds=self._sweep_interval_s):
+                return None
+        try:
+            summary = await run_deletion_sweep(project_ids=[])
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Scheduled deletion sweep failed")
+            return {"error": str(exc)}
+        return {
+            "issues_tombstoned": summary["issues_tombstoned"],
+            "aborted": summary["aborted"],
+        }
+
+
+async def run_periodic_sync_loop(scheduler: SyncScheduler | None = None) -> None:
+    """Entry point for the FastAPI lifespan task and the `sync scheduler` CLI worker."""
+
+    await (scheduler or SyncScheduler()).run_forever()
+
+
+async def _running_jobs(session: AsyncSession) -> int:
+    """Running jobs whose lease is still live; rows of crashed processes do not count."""
+
+    return int(
+        await session.scalar(
+            select(func.count())
+            .select_from(SyncJob)
+            .where(
+                SyncJob.status == "running",
+                SyncJob.lease_expires_at.is_not(None),
+                SyncJob.lease_expires_at >= datetime.now(UTC),
+            )
+        )
+        or 0
+    )
+
+
+def _count_changes(summary: dict[str, Any]) -> int:
+    return sum(
+        int(counts.get("inserted", 0)) + int(counts.get("updated", 0))
+        for counts in (summary.get("upserts") or {}).values()
+    )
+
+
+_LOCK = Lock()
+_LAST_SNAPSHOT: SchedulerSnapshot | None = None
+
+
+def get_scheduler_snapshot() -> SchedulerSnapshot | None:
+    """Latest scheduler state in this process, for health checks."""
+
+    with _LOCK:
+        return _LAST_SNAPSHOT
+
+
+def reset_scheduler_snapshot() -> None:
+    global _LAST_SNAPSHOT
+    with _LOCK:
+        _LAST_SNAPSHOT = None
+
+
+def _publish(snapshot: SchedulerSnapshot) -> None:
+    global _LAST_SNAPSHOT
+    with _LOCK:
+        _LAST_SNAPSHOT = snapshot
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+from contextlib import suppress
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
+from uuid import uuid4
+
+from sqlalchemy import ColumnElement, CursorResult, and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from redmine_rag.core.config import get_settings
+from redmine_rag.db.models import SyncJob
+from redmine_rag.db.session import get_session_factory
+from redmine_rag.services.sync_service import fail_abandoned_sync_jobs, run_leased_sync_job
+from redmine_rag.workers.locks import SYNC_LOCK_NAME, acquire_lock, release_lock
+
+logger = logging.getLogger(__name__)
+
+_CLAIM_CANDIDATES = 8
+
+
+def _claimable(now: datetime) -> ColumnElement[bool]:
+    """Queued jobs, plus running jobs whose worker lease expired (crashed or stuck worker).
+
+    Scheduler runs are leased but never claimed (`attempts == 0`); they are not retried
+    here but failed by `fail_abandoned_sync_jobs`.
+    """
+
+    return or_(
+        SyncJob.status == "queued",
+        and_(
+            SyncJob.status == "running",
+            SyncJob.attempts > 0,
+            SyncJob.lease_expires_at.is_not(None),
+            SyncJob.lease_expires_at < now,
+        ),
+    )
+
+
+async def claim_sync_job(
+    session: AsyncSession, *, owner: str, ttl_s: float, max_attempts: int
+) -> str | None:
+    """Atomically lease the oldest claimable job to `owner`; commits.
+
+    Each candidate is taken with a conditional UPDATE that re-checks claimability, so
+    concurrent workers sharing the database never both win the same row. Expired leases
+    that already used `max_attempts` are failed instead of reclaimed, and expired leases
+    of jobs asked to cancel end as `cancelled`.
+    """
+
+    await fail_abandoned_sync_jobs(session)
+    now = datetime.now(UTC)
+    await session.execute(
+        update(SyncJob)
+        .where(
+            SyncJob.status == "running",
+            SyncJob.lease_expires_at.is_not(None),
+            SyncJob.lease_expires_at < now,
+            SyncJob.cancel_requested_at.is_not(None),
+        )
+        .values(status="cancelled", finished_at=now, lease_expires_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    exhausted = await session.execute(
+        update(SyncJob)
+        .where(
+            SyncJob.status == "running",
+            SyncJob.lease_expires_at.is_not(None),
+            SyncJob.lease_expires_at < now,
+            SyncJob.attempts > 0,
+            SyncJob.attempts >= max_attempts,
+        )
+        .values(
+            status="failed",
+            finished_at=now,
+            lease_expires_at=None,
+            error_message=f"Worker lease expired after {max_attempts} attempts",
+        )
+        .execution_options(synchronize_session=False)
+    )
+    exhausted_count = int(cast(CursorResult[Any], exhausted).rowcount or 0)
+    if exhausted_count:
+        logger.warning(
+            "Failed sync jobs with exhausted worker leases", extra={"jobs": exhausted_count}
+        )
+
+    candidates = (
+        await session.scalars(
+            select(SyncJob.id)
+            .where(_claimable(now))
+            .order_by(SyncJob.created_at, SyncJob.id)
+            .limit(_CLAIM_CANDIDATES)
+        )
+    ).all()
+    for job_id in candidates:
+        result = await session.execute(
+            update(SyncJob)
+            .where(SyncJob.id == job_id, _claimable(now))
+            .values(
+                status="running",
+                started_at=now,
+                lease_owner=owner,
+                lease_expires_at=now + timedelta(seconds=ttl_s),
+                heartbeat_at=now,
+                attempts=SyncJob.attempts + 1,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if int(cast(CursorResult[Any], result).rowcount or 0) == 1:
+            await session.commit()
+            return str(job_id)
+    await session.commit()
+    return None
+
+
+class SyncWorker:
+    """Out-of-process executor for queued `SyncJob` rows.
+
+    Takes the `SYNC_LOCK_NAME` lease, claims a job, heartbeats both leases every third of
+    `SYNC_WORKER_LEASE_TTL_S` while the sync runs, and polls when the queue is empty or
+    the lock is held. Any number of workers and schedulers may share the database but at
+    most one sync runs at a time, so extra workers are standbys; a job whose worker stops
+    heartbeating is picked up again once its lease expires.
+    """
+
+    def __init__(self, *, owner: str | None = None) -> None:
+        settings = get_settings()
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._lease_ttl_s = settings.sync_worker_lease_ttl_s
+        self._poll_interval_s = settings.sync_worker_poll_interval_s
+        self._max_attempts = settings.sync_worker_max_attempts
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        """Stop claiming new jobs; jobs already running finish first."""
+
+        self._stopping.set()
+
+    async def run_forever(self) -> None:
+        logger.info("Sync worker started", extra={"owner": self.owner})
+        while not self._stopping.is_set():
+            try:
+                job_id = await self.run_once()
+            except Exception:  # noqa: BLE001
+                logger.exception("Sync worker run failed", extra={"owner": self.owner})
+                job_id = None
+            if job_id is None:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self._poll_interval_s)
+
+    async def run_once(self) -> str | None:
+        """Claim and run at most one job under the sync lock; returns its id.
+
+        Returns `None` without claiming when the queue is empty or another scheduler or
+        worker holds the lock. Each run takes the lock under its own owner, so a run never
+        renews a lease left behind by an earlier one.
+        """
+
+        session_factory = get_session_factory()
+        async with session_factory() as session:
+            has_work = await session.scalar(
+                select(SyncJob.id).where(_claimable(datetime.now(UTC))).limit(1)
+            )
+            if has_work is None:
+                return None
+            lock_owner = f"{self.owner}:{uuid4().hex[:8]}"
+            if not await acquire_lock(
+                session, SYNC_LOCK_NAME, owner=lock_owner, ttl_s=self._lease_ttl_s
+            ):
+                return None
+        try:
+            async with session_factory() as session:
+                job_id = await claim_sync_job(
+                    session,
+                    owner=self.owner,
+                    ttl_s=self._lease_ttl_s,
+                    max_attempts=self._max_attempts,
+                )
+            if job_id is None:
+                return None
+            await self._run_claimed(job_id, lock_owner=lock_owner)
+            return job_id
+        finally:
+            async with session_factory() as session:
+                await release_lock(session, SYNC_LOCK_NAME, owner=lock_owner)
+
+    async def _run_claimed(self, job_id: str, *, lock_owner: str) -> None:
+        await run_leased_sync_job(
+            job_id, owner=self.owner, ttl_s=self._lease_ttl_s, lock_owner=lock_owner
+        )
+
+
+async def run_sync_worker() -> None:
+    """Entry point for `redmine-rag worker`."""
+
+    await SyncWorker().run_forever()
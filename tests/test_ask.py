@@ -164,6 +164,35 @@ def test_ask_enforces_claim_citations(monkeypatch: pytest.MonkeyPatch) -> None:
             assert int(marker) in {citation["id"] for citation in payload["citations"]}
 
 
+def test_ask_claims_reuse_retrieval_snippets(monkeypatch: pytest.MonkeyPatch) -> None:
+    snippet = "Rollback of the OAuth callback fix restored Safari logins."
+
+    async def _fake_hybrid_retrieve(*_args, **_kwargs) -> HybridRetrievalResult:
+        return _mock_result(
+            [
+                RetrievedChunk(
+                    id=103,
+                    text=f"Triage started on Monday. {snippet} Follow-up is tracked separately.",
+                    url="http://x/issues/103",
+                    source_type="issue",
+                    source_id="103",
+                    score=0.9,
+                    snippet=snippet,
+                )
+            ]
+        )
+
+    monkeypatch.setattr(ask_service, "hybrid_retrieve", _fake_hybrid_retrieve)
+    client = TestClient(app)
+
+    response = client.post("/v1/ask", json={"query": "OAuth callback rollback", "top_k": 5})
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["citations"][0]["snippet"] == snippet
+    assert f"1. {snippet} [1]" in payload["answer_markdown"].splitlines()
+
+
 def test_ask_rejects_unsupported_claims(monkeypatch: pytest.MonkeyPatch) -> None:
     async def _fake_hybrid_retrieve(*_args, **_kwargs) -> HybridRetrievalResult:
         return _mock_result(
@@ -1,6 +1,6 @@
 import pytest
 
-from redmine_rag.indexing.chunker import chunk_text
+from redmine_rag.indexing.chunker import chunk_text, sentence_offsets
 
 
 def test_chunk_text_splits_long_text() -> None:
@@ -28,3 +28,17 @@ def test_chunk_text_handles_blank_and_invalid_args() -> None:
 
     with pytest.raises(ValueError, match="overlap_chars"):
         chunk_text("abc", overlap_chars=-1)
+
+
+def test_sentence_offsets_split_on_terminal_punctuation() -> None:
+    text = "  First one. Second one!\nThird v1.2 stays?  Tail"
+
+    offsets = sentence_offsets(text)
+
+    assert [text[start:end] for start, end in offsets] == [
+        "First one.",
+        "Second one!",
+        "Third v1.2 stays?",
+        "Tail",
+    ]
+    assert sentence_offsets("   ") == []
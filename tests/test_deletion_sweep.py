@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+import pytest
+from sqlalchemy import func, select
+
+from redmine_rag.core.config import get_settings
+from redmine_rag.db.base import Base
+from redmine_rag.db.models import DocChunk, EntityTombstone, Issue, Journal, RawEntity
+from redmine_rag.db.session import get_engine, get_session_factory
+from redmine_rag.indexing.chunk_indexer import ChunkIndexer
+from redmine_rag.indexing.embedding_indexer import EmbeddingIndexer
+from redmine_rag.indexing.vector_store import LocalNumpyVectorStore
+from redmine_rag.ingestion.deletion_sweep import _tombstone_reason, run_deletion_sweep
+from redmine_rag.ingestion.redmine_client import RedmineClient
+from redmine_rag.ingestion.sync_pipeline import run_incremental_sync
+from redmine_rag.mock_redmine.app import app as mock_redmine_app
+
+GHOST_ISSUE_ID = 990001
+
+
+@pytest.fixture
+async def isolated_sweep_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'sweep_test.db'}")
+    monkeypatch.setenv("REDMINE_BASE_URL", "http://testserver")
+    monkeypatch.setenv("REDMINE_API_KEY", "mock-api-key")
+    monkeypatch.setenv("REDMINE_ALLOWED_HOSTS", "testserver,127.0.0.1,localhost")
+    monkeypatch.setenv("REDMINE_PROJECT_IDS", "1")
+    monkeypatch.setenv("REDMINE_MODULES", "projects,users,trackers,issue_statuses,issues")
+    monkeypatch.setenv("VECTOR_INDEX_PATH", str(tmp_path / "chunks.index"))
+    monkeypatch.setenv("VECTOR_META_PATH", str(tmp_path / "chunks.meta.json"))
+
+    get_settings.cache_clear()
+    get_engine.cache_clear()
+    get_session_factory.cache_clear()
+
+    engine = get_engine()
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    yield
+
+    await engine.dispose()
+    get_settings.cache_clear()
+    get_engine.cache_clear()
+    get_session_factory.cache_clear()
+
+
+def _client() -> RedmineClient:
+    return RedmineClient(
+        base_url="http://testserver",
+        api_key="mock-api-key",
+        verify_ssl=False,
+        transport=httpx.ASGITransport(app=mock_redmine_app),
+        extra_headers={"X-Mock-Role": "admin"},
+    )
+
+
+def _vector_store() -> LocalNumpyVectorStore:
+    settings = get_settings()
+    return LocalNumpyVectorStore(
+        index_path=settings.vector_index_path, meta_path=settings.vector_meta_path
+    )
+
+
+async def _add_ghost_issue() -> set[str]:
+    """Index an issue that exists locally but not in the mock Redmine."""
+
+    created_on = datetime(2026, 1, 5, 9, 0, tzinfo=UTC)
+    settings = get_settings()
+    async with get_session_factory()() as session:
+        session.add(
+            Issue(
+                id=GHOST_ISSUE_ID,
+                project_id=1,
+                subject="Ghost issue deleted upstream",
+                description="This issue was removed in Redmine.",
+                created_on=created_on,
+                updated_on=created_on,
+            )
+        )
+        session.add(
+            Journal(
+                id=GHOST_ISSUE_ID,
+                issue_id=GHOST_ISSUE_ID,
+                notes="Last note before deletion.",
+                created_on=created_on,
+            )
+        )
+        session.add_all(
+            RawEntity(
+                entity_type=entity_type,
+                entity_id=str(GHOST_ISSUE_ID),
+                endpoint=endpoint,
+                project_id=1,
+                fetched_at=created_on,
+                payload_hash=f"{index:064x}",
+            )
+            for index, (entity_type, endpoint) in enumerate(
+                [("issue", "/issues.json"), ("journal", f"/issues/{GHOST_ISSUE_ID}.json")]
+            )
+        )
+        await session.flush()
+        indexer = ChunkIndexer(session, base_url=settings.redmine_base_url)
+        await indexer.refresh_sources("issue", [GHOST_ISSUE_ID])
+        await indexer.refresh_sources("journal", [GHOST_ISSUE_ID])
+        store = _vector_store()
+        await EmbeddingIndexer(session, store, embedding_dim=settings.embedding_dim).refresh(
+            since=None
+        )
+        store.save()
+        keys = set(
+            (
+                await session.scalars(
+                    select(DocChunk.embedding_key).where(DocChunk.issue_id == GHOST_ISSUE_ID)
+                )
+            ).all()
+        )
+        await session.commit()
+    return keys
+
+
+@pytest.mark.asyncio
+async def test_deletion_sweep_tombstones_issues_missing_from_redmine(
+    isolated_sweep_env: None,
+) -> None:
+    client = _client()
+    await run_incremental_sync(project_ids=[1], client=client)
+    ghost_keys = await _add_ghost_issue()
+    assert len(ghost_keys) >= 2
+    assert ghost_keys <= set(_vector_store().keys)
+
+    summary = await run_deletion_sweep(project_ids=[1], client=client)
+
+    assert summary["aborted"] is None
+    assert summary["candidates"] == 1
+    assert summary["issues_listed"] == summary["issues_local"] - 1
+    assert summary["issues_tombstoned"] == 1
+    assert summary["tombstone_reasons"] == {"deleted": 1}
+    assert summary["deleted"]["journals"] == 1
+    assert summary["deleted"]["chunks"] == len(ghost_keys)
+    assert summary["deleted"]["raw_entities"] == 2
+    assert summary["vectors_removed"] == len(ghost_keys)
+    assert not ghost_keys & set(_vector_store().keys)
+
+    async with get_session_factory()() as session:
+        assert await session.get(Issue, GHOST_ISSUE_ID) is None
+        assert await session.get(Journal, GHOST_ISSUE_ID) is None
+        remaining_chunks = await session.scalar(
+            select(func.count()).select_from(DocChunk).where(DocChunk.embedding_key.in_(ghost_keys))
+        )
+        tombstone = await session.get(EntityTombstone, ("issue", str(GHOST_ISSUE_ID)))
+        remaining_raw = await session.scalar(
+            select(func.count())
+            .select_from(RawEntity)
+            .where(RawEntity.entity_id == str(GHOST_ISSUE_ID))
+        )
+        other_raw = await session.scalar(select(func.count()).select_from(RawEntity))
+    assert remaining_chunks == 0
+    assert remaining_raw == 0
+    assert other_raw
+    assert tombstone is not None
+    assert tombstone.reason == "deleted"
+    assert tombstone.project_id == 1
+
+    second = await run_deletion_sweep(project_ids=[1], client=client)
+    assert second["candidates"] == 0
+    assert second["issues_tombstoned"] == 0
+
+
+@pytest.mark.asyncio
+async def test_deletion_sweep_aborts_mass_deletion(
+    isolated_sweep_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = _client()
+    await run_incremental_sync(project_ids=[1], client=client)
+    await _add_ghost_issue()
+    monkeypatch.setenv("SYNC_DELETION_MAX_RATIO", "0")
+    get_settings.cache_clear()
+
+    monkeypatch.setenv("SYNC_DELETION_MIN_COUNT", "0")
+    get_settings.cache_clear()
+
+    summary = await run_deletion_sweep(project_ids=[1], client=client)
+
+    assert summary["aborted"] is not None
+    assert summary["candidates"] == 1
+    assert summary["issues_tombstoned"] == 0
+    async with get_session_factory()() as session:
+        assert await session.get(Issue, GHOST_ISSUE_ID) is not None
+
+
+@pytest.mark.asyncio
+async def test_deletion_sweep_ratio_guard_ignores_small_deletions(
+    isolated_sweep_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = _client()
+    await run_incremental_sync(project_ids=[1], client=client)
+    await _add_ghost_issue()
+    monkeypatch.setenv("SYNC_DELETION_MAX_RATIO", "0")
+    monkeypatch.setenv("SYNC_DELETION_MIN_COUNT", "1")
+    get_settings.cache_clear()
+
+    summary = await run_deletion_sweep(project_ids=[1], client=client)
+
+    assert summary["aborted"] is None
+    assert summary["issues_tombstoned"] == 1
+
+
+def test_tombstone_reason_classifies_probe_outcomes() -> None:
+    request = httpx.Request("GET", "http://testserver/issues/1.json")
+
+    def _status_error(status_code: int) -> httpx.HTTPStatusError:
+        response = httpx.Response(status_code, request=request)
+        return httpx.HTTPStatusError("error", request=request, response=response)
+
+    assert _tombstone_reason(_status_error(404), [1]) == "deleted"
+    assert _tombstone_reason(_status_error(403), [1]) == "not_visible"
+    assert _tombstone_reason(_status_error(500), [1]) is None
+    assert _tombstone_reason(httpx.ConnectError("down", request=request), [1]) is None
+    assert _tombstone_reason({"issue": {"project": {"id": 2}}}, [1]) == "moved"
+    assert _tombstone_reason({"issue": {"project": {"id": 1}}}, [1]) is None
+    assert _tombstone_reason({"issue": {"project": {"id": 2}}}, []) is None
@@ -1,9 +1,37 @@
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
 from fastapi.testclient import TestClient
 
+from redmine_rag.core.config import get_settings
+from redmine_rag.db.base import Base
+from redmine_rag.db.models import SyncJob
+from redmine_rag.db.session import get_engine, get_session_factory
+from redmine_rag.ingestion.rate_limiter import RateLimiterSnapshot
 from redmine_rag.main import app
+from redmine_rag.services import ops_service
+
+
+@pytest.fixture
+def isolated_health_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'health.db'}")
+    monkeypatch.setenv("VECTOR_INDEX_PATH", str(tmp_path / "chunks.index"))
+    monkeypatch.setenv("VECTOR_META_PATH", str(tmp_path / "chunks.meta.json"))
+
+    get_settings.cache_clear()
+    get_engine.cache_clear()
+    get_session_factory.cache_clear()
+
+    yield
 
+    get_settings.cache_clear()
+    get_engine.cache_clear()
+    get_session_factory.cache_clear()
 
-def test_health_endpoint() -> None:
+
+def test_health_endpoint(isolated_health_env: None) -> None:
     client = TestClient(app)
 
     response = client.get("/healthz")
@@ -14,3 +42,54 @@ def test_health_endpoint() -> None:
     assert payload["app"] == "redmine-rag"
     assert "checks" in payload
     assert "sync_jobs" in payload
+    assert any(check["name"] == "retrieval_cache" for check in payload["checks"])
+    assert any(check["name"] == "fts_index" for check in payload["checks"])
+    assert any(check["name"] == "redmine_rate_limit" for check in payload["checks"])
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_check_reads_snapshot_persisted_by_sync_job(
+    isolated_health_env: None,
+) -> None:
+    engine = get_engine()
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    snapshot = RateLimiterSnapshot(
+        concurrency_limit=1.0,
+        min_concurrency=1,
+        max_concurrency=8,
+        in_flight=1,
+        rate_limit_rps=0.0,
+        latency_target_s=1.0,
+        latency_ewma_ms=120.0,
+        requests=40,
+        throttled_responses=3,
+        slow_responses=0,
+        decreases=3,
+        retry_after_waits=1,
+        wait_s_total=5.0,
+        blocked_for_s=3600.0,
+    )
+    async with get_session_factory()() as session:
+        session.add(
+            SyncJob(
+                id="job-worker",
+                status="running",
+                payload={},
+                progress={
+                    "updated_at": datetime.now(UTC).isoformat(),
+                    "rate_limiter": snapshot.to_dict(),
+                },
+            )
+        )
+        await session.commit()
+
+    check = await ops_service._redmine_rate_limit_check()
+
+    assert check.status == "warn"
+    detail = json.loads(check.detail)
+    assert detail["source"] == "sync_job"
+    assert detail["job_id"] == "job-worker"
+    assert detail["throttled_responses"] == 3
+    assert 0 < detail["blocked_for_s"] <= 3600.0
+    await engine.dispose()
@@ -8,8 +8,9 @@ from sqlalchemy import func, select
 
 from redmine_rag.core.config import get_settings
 from redmine_rag.db.base import Base
-from redmine_rag.db.models import Issue, Project, RawEntity
+from redmine_rag.db.models import Issue, Project, RawEntity, RawIssue, RawPayload, Tracker
 from redmine_rag.db.session import get_engine, get_session_factory
+from redmine_rag.ingestion import repository as repository_module
 from redmine_rag.ingestion.repository import IngestionRepository
 
 
@@ -68,10 +69,11 @@ async def test_raw_entity_upsert_is_idempotent(isolated_db: None) -> None:
     async with session_factory() as session:
         count = await session.scalar(select(func.count()).select_from(RawEntity))
         row = await session.scalar(select(RawEntity))
+        assert row is not None
+        payloads = await IngestionRepository(session).load_raw_payloads([row.payload_hash])
 
     assert count == 1
-    assert row is not None
-    assert row.payload["subject"] == "after"
+    assert payloads[row.payload_hash]["subject"] == "after"
 
 
 @pytest.mark.asyncio
@@ -173,3 +175,118 @@ async def test_issue_upsert_updates_existing_row(isolated_db: None) -> None:
     assert issue_row is not None
     assert issue_row.subject == "Updated subject"
     assert issue_row.status == "In Progress"
+
+
+@pytest.mark.asyncio
+async def test_upsert_skips_unchanged_rows_and_reports_counts(isolated_db: None) -> None:
+    session_factory = get_session_factory()
+
+    def _tracker(tracker_id: int, name: str) -> dict[str, object]:
+        return {"id": tracker_id, "name": name, "default_status_id": None, "description": None}
+
+    def _raw(entity_id: str, subject: str) -> dict[str, object]:
+        return {
+            "entity_type": "news",
+            "entity_id": entity_id,
+            "endpoint": "/news.json",
+            "project_id": 1,
+            "updated_on": None,
+            "fetched_at": datetime.now(UTC),
+            "payload": {"title": subject},
+        }
+
+    async with session_factory() as session:
+        repo = IngestionRepository(session)
+        await repo.upsert_trackers([_tracker(1, "Bug"), _tracker(2, "Feature")])
+        await repo.upsert_raw_entities([_raw("1", "a"), _raw("2", "b")])
+        await session.commit()
+        first_updated_at = await session.scalar(select(RawEntity.updated_at))
+
+        processed = await repo.upsert_trackers(
+            [_tracker(1, "Bug"), _tracker(2, "Feature request"), _tracker(3, "Support")]
+        )
+        # fetched_at alone differs, so the raw rows count as unchanged.
+        await repo.upsert_raw_entities([_raw("1", "a"), _raw("2", "b")])
+        await session.commit()
+        second_updated_at = await session.scalar(select(RawEntity.updated_at))
+
+    assert processed == 3
+    tracker_stats = repo.upsert_stats["tracker"]
+    assert (tracker_stats.inserted, tracker_stats.updated, tracker_stats.unchanged) == (3, 1, 1)
+    raw_stats = repo.upsert_stats["raw_entity"]
+    assert (raw_stats.inserted, raw_stats.updated, raw_stats.unchanged) == (2, 0, 2)
+    assert second_updated_at == first_updated_at
+
+
+@pytest.mark.asyncio
+async def test_upsert_chunks_rows_under_sqlite_variable_limit(
+    isolated_db: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Four columns per tracker row -> two rows per executemany chunk.
+    monkeypatch.setattr(repository_module, "SQLITE_MAX_VARIABLES", 8)
+    session_factory = get_session_factory()
+    rows = [
+        {"id": item, "name": f"T{item}", "default_status_id": None, "description": None}
+        for item in range(1, 6)
+    ]
+
+    async with session_factory() as session:
+        repo = IngestionRepository(session)
+        await repo.upsert_trackers(rows[:3])
+        await repo.upsert_trackers([*rows[:2], {**rows[2], "name": "Renamed"}, *rows[3:]])
+        await session.commit()
+        names = (await session.scalars(select(Tracker.name).order_by(Tracker.id))).all()
+
+    stats = repo.upsert_stats["tracker"]
+    assert names == ["T1", "T2", "Renamed", "T4", "T5"]
+    assert (stats.inserted, stats.updated, stats.unchanged) == (5, 1, 2)
+    assert stats.to_dict()["rows_per_s"] is not None
+
+
+@pytest.mark.asyncio
+async def test_raw_payloads_are_stored_once_per_content_hash(isolated_db: None) -> None:
+    fetched_at = datetime.now(UTC)
+    session_factory = get_session_factory()
+    issue_payload = {"id": 7, "subject": "Login fails", "journals": [{"id": 1}]}
+
+    async with session_factory() as session:
+        repo = IngestionRepository(session)
+        await repo.upsert_raw_issues(
+            [
+                {
+                    "id": 7,
+                    "project_id": 1,
+                    "updated_on": fetched_at,
+                    "fetched_at": fetched_at,
+                    "payload": issue_payload,
+                }
+            ]
+        )
+        # Same content with different key order, as an overlap-window refetch returns it.
+        await repo.upsert_raw_entities(
+            [
+                {
+                    "entity_type": "issue",
+                    "entity_id": "7",
+                    "endpoint": "/issues.json",
+                    "project_id": 1,
+                    "updated_on": fetched_at,
+                    "fetched_at": fetched_at,
+                    "payload": dict(reversed(list(issue_payload.items()))),
+                }
+            ]
+        )
+        await session.commit()
+
+        blobs = (await session.scalars(select(RawPayload))).all()
+        issue_hash = await session.scalar(select(RawIssue.payload_hash))
+        entity_hash = await session.scalar(select(RawEntity.payload_hash))
+        assert issue_hash is not None
+        payloads = await repo.load_raw_payloads([issue_hash])
+
+    assert len(blobs) == 1
+    assert blobs[0].codec == "zlib"
+    assert issue_hash == entity_hash
+    assert payloads[issue_hash] == issue_payload
+    stats = repo.upsert_stats["raw_payload"]
+    assert (stats.inserted, stats.unchanged) == (1, 1)
@@ -120,6 +120,53 @@ def test_sqlite_maintenance_runs(isolated_ops_env: dict[str, Path]) -> None:
     summary = run_sqlite_maintenance()
     assert summary["database"].endswith("ops.db")
     assert summary["elapsed_ms"] >= 0
+    assert summary["fts"] is None
+
+
+def test_sqlite_maintenance_applies_fts_options_and_merges_segments(
+    isolated_ops_env: dict[str, Path],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    db_path = isolated_ops_env["db_path"]
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE doc_chunk (id INTEGER PRIMARY KEY, text TEXT)")
+        conn.execute(
+            "CREATE VIRTUAL TABLE doc_chunk_fts "
+            "USING fts5(text, content='doc_chunk', content_rowid='id')"
+        )
+        conn.execute("INSERT INTO doc_chunk_fts(doc_chunk_fts, rank) VALUES('automerge', 0)")
+        conn.commit()
+        for index in range(12):
+            conn.execute(
+                "INSERT INTO doc_chunk (id, text) VALUES (?, ?)",
+                (index, f"login timeout incident {index}"),
+            )
+            conn.execute(
+                "INSERT INTO doc_chunk_fts (rowid, text) VALUES (?, ?)",
+                (index, f"login timeout incident {index}"),
+            )
+            conn.commit()
+
+    summary = run_sqlite_maintenance()
+    assert summary["fts"]["rebuilt"] is False
+    assert summary["fts"]["segments_before"] > 1
+    assert summary["fts"]["segments_after"] == 1
+
+    monkeypatch.setenv("FTS_PREFIX_LENGTHS", "2,3")
+    get_settings.cache_clear()
+    summary = run_sqlite_maintenance()
+    assert summary["fts"]["rebuilt"] is True
+
+    with sqlite3.connect(db_path) as conn:
+        create_sql = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'doc_chunk_fts'"
+        ).fetchone()[0]
+        hits = conn.execute(
+            "SELECT count(*) FROM doc_chunk_fts WHERE doc_chunk_fts MATCH 'tim*'"
+        ).fetchone()[0]
+    assert "prefix='2 3'" in create_sql
+    assert hits == 12
+    assert run_sqlite_maintenance()["fts"]["rebuilt"] is False
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+from time import monotonic
+
+import httpx
+import orjson
+import pytest
+from sqlalchemy import func, select
+
+from redmine_rag.core.config import get_settings
+from redmine_rag.db.base import Base
+from redmine_rag.db.models import Issue
+from redmine_rag.db.session import get_engine, get_session_factory
+from redmine_rag.ingestion.cassette import (
+    CassetteEntry,
+    CassetteMissError,
+    LatencyProfile,
+    RecordingTransport,
+    ReplayTransport,
+    load_cassette,
+    save_cassette,
+)
+from redmine_rag.ingestion.redmine_client import RedmineClient
+from redmine_rag.ingestion.sync_pipeline import run_incremental_sync
+from redmine_rag.mock_redmine.app import app as mock_redmine_app
+
+
+@pytest.fixture
+def cassette_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    cassette_path = tmp_path / "redmine.jsonl.gz"
+    monkeypatch.setenv("REDMINE_CASSETTE_PATH", str(cassette_path))
+    monkeypatch.setenv("REDMINE_CASSETTE_LATENCY", "none")
+    get_settings.cache_clear()
+    yield cassette_path
+    get_settings.cache_clear()
+
+
+def _set_mode(monkeypatch: pytest.MonkeyPatch, mode: str) -> None:
+    monkeypatch.setenv("REDMINE_CASSETTE_MODE", mode)
+    get_settings.cache_clear()
+
+
+def _client(transport: httpx.AsyncBaseTransport | None = None) -> RedmineClient:
+    return RedmineClient(
+        base_url="http://testserver",
+        api_key="mock-api-key",
+        verify_ssl=False,
+        transport=transport,
+        extra_headers={"X-Mock-Role": "admin"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_cassette_records_and_replays_redmine_responses(
+    cassette_env: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _set_mode(monkeypatch, "record")
+    async with _client(httpx.ASGITransport(app=mock_redmine_app)) as client:
+        trackers = await client.get_trackers()
+        issues = await client.get_issues(updated_since=None, project_ids=[1], limit=5)
+
+    with gzip.open(cassette_env, "rb") as fp:
+        header = orjson.loads(fp.readline())
+    assert header == {"version": 1, "entries": 2}
+    entries = load_cassette(cassette_env)
+    assert [entry.path for entry in entries] == ["/trackers.json", "/issues.json"]
+    assert "project_id=1" in entries[1].query
+
+    _set_mode(monkeypatch, "replay")
+    async with _client() as client:
+        assert isinstance(client._transport, ReplayTransport)
+        assert await client.get_trackers() == trackers
+        # Query parameter order does not matter for matching.
+        assert await client.get_issues(updated_since=None, project_ids=[1], limit=5) == issues
+        with pytest.raises(CassetteMissError):
+            await client.get_issue_statuses()
+
+
+@pytest.mark.asyncio
+async def test_replayed_sync_matches_recorded_sync(
+    cassette_env: Path, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("REDMINE_BASE_URL", "http://testserver")
+    monkeypatch.setenv("REDMINE_API_KEY", "mock-api-key")
+    monkeypatch.setenv("REDMINE_ALLOWED_HOSTS", "testserver,127.0.0.1,localhost")
+    monkeypatch.setenv("REDMINE_MODULES", "projects,users,trackers,issue_statuses,issues")
+    monkeypatch.setenv("VECTOR_INDEX_PATH", str(tmp_path / "chunks.index"))
+    monkeypatch.setenv("VECTOR_META_PATH", str(tmp_path / "chunks.meta.json"))
+
+    async def _sync_into(db_name: str, mode: str) -> tuple[dict, int]:
+        monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / db_name}")
+        _set_mode(monkeypatch, mode)
+        get_engine.cache_clear()
+        get_session_factory.cache_clear()
+        engine = get_engine()
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        summary = await run_incremental_sync(
+            project_ids=[1], client=_client(httpx.ASGITransport(app=mock_redmine_app))
+        )
+        async with get_session_factory()() as session:
+            issue_count = int(await session.scalar(select(func.count()).select_from(Issue)) or 0)
+        await engine.dispose()
+        get_engine.cache_clear()
+        get_session_factory.cache_clear()
+        return summary, issue_count
+
+    recorded, recorded_issues = await _sync_into("recorded.db", "record")
+    replayed, replayed_issues = await _sync_into("replayed.db", "replay")
+
+    assert recorded_issues > 0
+    assert replayed_issues == recorded_issues
+    assert replayed["issues_synced"] == recorded["issues_synced"]
+    assert replayed["journals_synced"] == recorded["journals_synced"]
+    assert replayed["rate_limit"]["requests"] == recorded["rate_limit"]["requests"]
+
+
+@pytest.mark.asyncio
+async def test_recording_keeps_exchanges_before_close_and_repeated_headers(
+    tmp_path: Path,
+) -> None:
+    cassette_path = tmp_path / "partial.jsonl.gz"
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers=[
+                ("Link", '<http://x/issues.json?offset=25>; rel="next"'),
+                ("Link", '<http://x/issues.json?offset=0>; rel="first"'),
+            ],
+            json={"path": request.url.path},
+        )
+
+    recorder = RecordingTransport(cassette_path, inner=httpx.MockTransport(_handler))
+    async with httpx.AsyncClient(transport=recorder, base_url="http://testserver") as client:
+        await client.get("/trackers.json")
+        await client.get("/issues.json", params={"offset": 0})
+        # Nothing closed yet: an interrupted recording must still be replayable.
+        entries = load_cassette(cassette_path)
+        assert [entry.path for entry in entries] == ["/trackers.json", "/issues.json"]
+
+        with gzip.open(cassette_path, "ab") as fp:
+            fp.write(b'{"method": "GET", "pa')
+        truncated = cassette_path.read_bytes()
+        cassette_path.write_bytes(truncated[:-4])
+        assert len(load_cassette(cassette_path)) == 2
+
+    links = [value for name, value in load_cassette(cassette_path)[1].headers if name == "link"]
+    assert len(links) == 2
+    replay = ReplayTransport(cassette_path)
+    async with httpx.AsyncClient(transport=replay, base_url="http://testserver") as client:
+        response = await client.get("/issues.json", params={"offset": 0})
+    assert response.headers.get_list("link") == links
+
+
+@pytest.mark.asyncio
+async def test_replay_injects_configured_latency(tmp_path: Path) -> None:
+    request = httpx.Request("GET", "http://testserver/trackers.json")
+    entry = CassetteEntry.from_exchange(
+        request,
+        httpx.Response(200, json={"trackers": []}),
+        body=b'{"trackers":[]}',
+        elapsed_s=0.2,
+    )
+    cassette_path = tmp_path / "latency.jsonl.gz"
+    save_cassette(cassette_path, [entry])
+
+    transport = ReplayTransport(cassette_path, latency=LatencyProfile(mode="fixed", fixed_s=0.05))
+    started = monotonic()
+    response = await transport.handle_async_request(request)
+    assert monotonic() - started >= 0.05
+    assert response.json() == {"trackers": []}
+    assert transport.hits == 1
+
+    assert LatencyProfile(mode="recorded", scale=0.5).delay_for(entry) == pytest.approx(0.1)
+    assert LatencyProfile(mode="none").delay_for(entry) == 0.0
+    endpoint_profile = LatencyProfile(
+        mode="endpoint", fixed_s=0.01, endpoints={"/issues/*.json": 0.3, "/trackers.json": 0.02}
+    )
+    assert endpoint_profile.delay_for(entry) == 0.02
+    issue_entry = CassetteEntry.from_exchange(
+        httpx.Request("GET", "http://testserver/issues/7.json"),
+        httpx.Response(200),
+        body=b"{}",
+        elapsed_s=0.0,
+    )
+    assert endpoint_profile.delay_for(issue_entry) == 0.3
+
+
+def test_cassette_latency_endpoint_setting_parses_patterns(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("REDMINE_CASSETTE_LATENCY_ENDPOINTS", "/issues.json=0.4, /issues/*.json=0.1")
+    get_settings.cache_clear()
+    try:
+        assert get_settings().redmine_cassette_latency_endpoints == {
+            "/issues.json": 0.4,
+            "/issues/*.json": 0.1,
+        }
+    finally:
+        get_settings.cache_clear()
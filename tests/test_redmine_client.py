@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import httpx
+import orjson
+import pytest
+
+from redmine_rag.core.config import get_settings
+from redmine_rag.ingestion.rate_limiter import (
+    AdaptiveRateLimiter,
+    get_rate_limiter_snapshot,
+    parse_retry_after,
+)
+from redmine_rag.ingestion.redmine_client import RedmineClient
+
+
+@pytest.fixture
+def reset_settings_cache():
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_redmine_client_reuses_pooled_client_within_context(
+    reset_settings_cache: None,
+) -> None:
+    seen_keys: list[str | None] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen_keys.append(request.headers.get("X-Redmine-API-Key"))
+        return httpx.Response(
+            200,
+            content=orjson.dumps({"trackers": [{"id": 1, "name": "Bug"}]}),
+            headers={"Content-Type": "application/json"},
+        )
+
+    client = RedmineClient(
+        base_url="http://testserver",
+        api_key="mock-api-key",
+        transport=httpx.MockTransport(_handler),
+    )
+
+    async with client:
+        pooled = client._client
+        first = await client.get_trackers()
+        second = await client.get_issue_statuses()
+        assert client._client is pooled
+
+    assert pooled is not None
+    assert pooled.is_closed
+    assert client._client is None
+    assert first == {"trackers": [{"id": 1, "name": "Bug"}]}
+    assert second == first
+    assert seen_keys == ["mock-api-key", "mock-api-key"]
+
+    # A closed client lazily opens a new pool on the next request.
+    await client.get_trackers()
+    assert client._client is not None
+    assert client._client is not pooled
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_redmine_client_honours_retry_after_and_shrinks_window(
+    reset_settings_cache: None,
+) -> None:
+    attempts = 0
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(
+            200,
+            content=orjson.dumps({"trackers": []}),
+            headers={"Content-Type": "application/json"},
+        )
+
+    async with RedmineClient(
+        base_url="http://testserver",
+        api_key="mock-api-key",
+        transport=httpx.MockTransport(_handler),
+    ) as client:
+        payload = await client.get_trackers()
+        snapshot = client.rate_limit_snapshot()
+
+    assert payload == {"trackers": []}
+    assert attempts == 2
+    assert snapshot.requests == 2
+    assert snapshot.throttled_responses == 1
+    assert snapshot.retry_after_waits == 1
+    assert snapshot.decreases == 1
+    assert snapshot.concurrency_limit < snapshot.max_concurrency
+    assert get_rate_limiter_snapshot() == snapshot
+
+
+@pytest.mark.asyncio
+async def test_adaptive_rate_limiter_aimd_window() -> None:
+    limiter = AdaptiveRateLimiter(
+        rate_limit_rps=0,
+        burst=1,
+        min_concurrency=1,
+        max_concurrency=8,
+        latency_target_s=0.5,
+        retry_after_max_s=60,
+    )
+    limiter.observe(httpx.Response(200), latency_s=2.0)
+    assert limiter.snapshot().concurrency_limit == 4
+    # A second congestion signal inside the same interval does not halve again.
+    limiter.observe(httpx.Response(503), latency_s=0.1)
+    assert limiter.snapshot().concurrency_limit == 4
+    for _ in range(4):
+        limiter.observe(httpx.Response(200), latency_s=0.1)
+    assert 4.9 < limiter.snapshot().concurrency_limit <= 5
+
+    limiter.observe(httpx.Response(429, headers={"Retry-After": "3600"}), latency_s=0.1)
+    assert 59 < limiter.snapshot().blocked_for_s <= 60
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates() -> None:
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from redmine_rag.core.config import get_settings
+from redmine_rag.db.base import Base
+from redmine_rag.db.models import IssueStatus, Project, Tracker
+from redmine_rag.db.session import get_engine, get_session_factory
+from redmine_rag.services.cache_generation_service import bump_cache_generation
+from redmine_rag.services.reference_cache_service import (
+    REFERENCE_DATA_GENERATION,
+    get_reference_cache_snapshot,
+    get_reference_data,
+    invalidate_reference_cache,
+    reset_reference_cache,
+)
+
+
+@pytest.fixture
+async def isolated_reference_db(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    db_path = tmp_path / "reference_test.db"
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{db_path}")
+
+    get_settings.cache_clear()
+    get_engine.cache_clear()
+    get_session_factory.cache_clear()
+    reset_reference_cache()
+
+    engine = get_engine()
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    yield
+
+    reset_reference_cache()
+    await engine.dispose()
+    get_settings.cache_clear()
+    get_engine.cache_clear()
+    get_session_factory.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_reference_data_is_cached_until_invalidated(isolated_reference_db: None) -> None:
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        session.add(Project(id=1, identifier="platform-core", name="Platform"))
+        session.add(Tracker(id=1, name="Bug"))
+        session.add(IssueStatus(id=5, name="Closed", is_closed=True, is_default=False))
+        await session.commit()
+
+    async with session_factory() as session:
+        first = await get_reference_data(session, ttl_s=300)
+        session.add(Project(id=2, identifier="mobile", name="Mobile"))
+        await session.commit()
+        second = await get_reference_data(session, ttl_s=300)
+
+    assert first.project_ids == frozenset({1})
+    assert first.tracker_ids == frozenset({1})
+    assert first.statuses[5].is_closed is True
+    assert second is first
+    assert get_reference_cache_snapshot().hits == 1
+
+    invalidate_reference_cache()
+    async with session_factory() as session:
+        refreshed = await get_reference_data(session, ttl_s=300)
+
+    assert refreshed.project_ids == frozenset({1, 2})
+    snapshot = get_reference_cache_snapshot()
+    assert snapshot.loads == 2
+    assert snapshot.invalidations == 1
+
+
+@pytest.mark.asyncio
+async def test_reference_data_zero_ttl_always_reloads(isolated_reference_db: None) -> None:
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        await get_reference_data(session, ttl_s=0)
+        await get_reference_data(session, ttl_s=0)
+
+    snapshot = get_reference_cache_snapshot()
+    assert snapshot.loads == 2
+    assert snapshot.hits == 0
+
+
+@pytest.mark.asyncio
+async def test_reference_data_reloads_after_generation_bump_from_another_process(
+    isolated_reference_db: None,
+) -> None:
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        session.add(Tracker(id=1, name="Bug"))
+        await session.commit()
+        first = await get_reference_data(session, ttl_s=300)
+
+    # A sync in another process commits new rows and bumps the generation; the local
+    # cache never sees an in-process invalidation.
+    async with session_factory() as session:
+        session.add(Tracker(id=2, name="Feature"))
+        await bump_cache_generation(session, REFERENCE_DATA_GENERATION)
+        await session.commit()
+
+    async with session_factory() as session:
+        refreshed = await get_reference_data(session, ttl_s=300)
+        cached = await get_reference_data(session, ttl_s=300)
+
+    assert first.tracker_ids == frozenset({1})
+    assert refreshed.tracker_ids == frozenset({1, 2})
+    assert cached is refreshed
+    snapshot = get_reference_cache_snapshot()
+    assert snapshot.loads == 2
+    assert snapshot.hits == 1
+    assert snapshot.invalidations == 0
+    assert snapshot.generation == 1
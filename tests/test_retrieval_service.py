@@ -4,16 +4,22 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import pytest
-from sqlalchemy import text
+from sqlalchemy import event, func, select, text
 
 from redmine_rag.api.schemas import AskFilters
 from redmine_rag.core.config import get_settings
 from redmine_rag.db.base import Base
-from redmine_rag.db.models import DocChunk, Issue
+from redmine_rag.db.models import CacheGeneration, DocChunk, Issue, SyncState
 from redmine_rag.db.session import get_engine, get_session_factory
 from redmine_rag.indexing.embedding_indexer import refresh_embeddings
 from redmine_rag.services import retrieval_service
 from redmine_rag.services.query_planner import RetrievalPlan, RetrievalPlanDiagnostics
+from redmine_rag.services.retrieval_cache_service import (
+    get_retrieval_cache_snapshot,
+    load_index_generation,
+    mark_retrieval_index_updated,
+    reset_retrieval_cache,
+)
 from redmine_rag.services.retrieval_service import fuse_rankings, hybrid_retrieve
 
 
@@ -237,6 +243,276 @@ async def test_hybrid_retrieve_applies_issue_filters(isolated_retrieval_db: None
     assert filtered.diagnostics.mode == "lexical_only"
 
 
+@pytest.mark.asyncio
+async def test_lexical_candidates_merge_planner_queries_in_one_statement(
+    isolated_retrieval_db: None,
+) -> None:
+    now = datetime.now(UTC)
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        session.add_all(
+            [
+                DocChunk(
+                    source_type="issue",
+                    source_id="301",
+                    project_id=1,
+                    issue_id=301,
+                    chunk_index=0,
+                    text="Login timeout after OAuth callback",
+                    url="http://x/issues/301",
+                    source_created_on=now,
+                    source_updated_on=now,
+                    source_metadata={},
+                    embedding_key="k301-0",
+                ),
+                DocChunk(
+                    source_type="issue",
+                    source_id="302",
+                    project_id=2,
+                    issue_id=302,
+                    chunk_index=0,
+                    text="Token refresh fails during SSO login",
+                    url="http://x/issues/302",
+                    source_created_on=now,
+                    source_updated_on=now,
+                    source_metadata={},
+                    embedding_key="k302-0",
+                ),
+            ]
+        )
+        await session.commit()
+
+    async with session_factory() as session:
+        statements: list[str] = []
+        connection = await session.connection()
+        sync_engine = connection.engine.sync_engine
+
+        def _capture(*args: object) -> None:
+            statement = args[2]
+            if isinstance(statement, str) and "doc_chunk_fts" in statement:
+                statements.append(statement)
+
+        event.listen(sync_engine, "before_cursor_execute", _capture)
+        try:
+            records = await retrieval_service._retrieve_lexical_candidates(
+                session=session,
+                queries=["oauth timeout", "token refresh", "login", "oauth timeout"],
+                filters=AskFilters(),
+                limit=10,
+            )
+            filtered = await retrieval_service._retrieve_lexical_candidates(
+                session=session,
+                queries=["oauth timeout", "token refresh"],
+                filters=AskFilters(project_ids=[2]),
+                limit=10,
+            )
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", _capture)
+
+    assert sorted(record.source_id for record in records) == ["301", "302"]
+    assert len({record.id for record in records}) == len(records)
+    assert [record.source_id for record in filtered] == ["302"]
+    assert len(statements) == 2
+    assert statements[0].count("MATCH") == 3
+
+
+@pytest.mark.asyncio
+async def test_lexical_candidates_keep_other_queries_when_one_is_rejected(
+    isolated_retrieval_db: None,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    now = datetime.now(UTC)
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        session.add(
+            DocChunk(
+                source_type="issue",
+                source_id="305",
+                project_id=1,
+                issue_id=305,
+                chunk_index=0,
+                text="Login timeout after OAuth callback",
+                url="http://x/issues/305",
+                source_created_on=now,
+                source_updated_on=now,
+                source_metadata={},
+                embedding_key="k305-0",
+            )
+        )
+        await session.commit()
+
+    build_match_query = retrieval_service._build_match_query
+
+    def _with_broken_arm(query: str, *, prefix_lengths: list[int] | None = None) -> str | None:
+        if query == "broken":
+            return '"unterminated'
+        return build_match_query(query, prefix_lengths=prefix_lengths)
+
+    monkeypatch.setattr(retrieval_service, "_build_match_query", _with_broken_arm)
+    async with session_factory() as session:
+        with caplog.at_level("WARNING", logger=retrieval_service.__name__):
+            records = await retrieval_service._retrieve_lexical_candidates(
+                session=session,
+                queries=["oauth timeout", "broken", "login"],
+                filters=AskFilters(),
+                limit=10,
+            )
+
+    assert [record.source_id for record in records] == ["305"]
+    assert "Lexical query rejected by FTS5" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_lexical_query_uses_prefix_matching_with_prefix_indexes(
+    isolated_retrieval_db: None,
+) -> None:
+    now = datetime.now(UTC)
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        session.add(
+            DocChunk(
+                source_type="issue",
+                source_id="311",
+                project_id=1,
+                issue_id=311,
+                chunk_index=0,
+                text="Deployment of the webhooks service stalled",
+                url="http://x/issues/311",
+                source_created_on=now,
+                source_updated_on=now,
+                source_metadata={},
+                embedding_key="prefix-311",
+            )
+        )
+        await session.commit()
+
+    async with session_factory() as session:
+        exact = await retrieval_service._retrieve_lexical_candidates(
+            session=session, queries=["deploy webhook"], filters=AskFilters(), limit=10
+        )
+        prefixed = await retrieval_service._retrieve_lexical_candidates(
+            session=session,
+            queries=["deploy webhook"],
+            filters=AskFilters(),
+            limit=10,
+            prefix_lengths=[3, 6],
+        )
+
+    assert exact == []
+    assert [record.source_id for record in prefixed] == ["311"]
+    assert (
+        retrieval_service._build_match_query("deploy of x", prefix_lengths=[3, 6])
+        == '"deploy"* OR "of" OR "x"'
+    )
+    assert retrieval_service._build_match_query("deploy") == '"deploy"'
+
+
+@pytest.mark.asyncio
+async def test_lexical_query_splits_terms_like_the_tokenizer(isolated_retrieval_db: None) -> None:
+    now = datetime.now(UTC)
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        await session.execute(text("DROP TABLE doc_chunk_fts"))
+        await session.execute(
+            text(
+                "CREATE VIRTUAL TABLE doc_chunk_fts USING fts5("
+                "text, content='doc_chunk', content_rowid='id', detail=column)"
+            )
+        )
+        session.add(
+            DocChunk(
+                source_type="issue",
+                source_id="321",
+                project_id=1,
+                issue_id=321,
+                chunk_index=0,
+                text="Tune retry_backoff for the webhook client",
+                url="http://x/issues/321",
+                source_created_on=now,
+                source_updated_on=now,
+                source_metadata={},
+                embedding_key="detail-321",
+            )
+        )
+        await session.commit()
+
+    async with session_factory() as session:
+        records = await retrieval_service._retrieve_lexical_candidates(
+            session=session, queries=["retry_backoff"], filters=AskFilters(), limit=10
+        )
+
+    assert [record.source_id for record in records] == ["321"]
+    assert retrieval_service._build_match_query("retry_backoff") == '"retry" OR "backoff"'
+
+
+@pytest.mark.asyncio
+async def test_hybrid_retrieve_returns_query_aware_snippets(isolated_retrieval_db: None) -> None:
+    now = datetime.now(UTC)
+    filler = " ".join(f"Routine maintenance note number {index}." for index in range(40))
+    lexical_text = f"{filler} The OAuth callback timeout affects Safari users. {filler}"
+    vector_text = "Release checklist was updated. Token rotation failed during deploy."
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        session.add_all(
+            [
+                DocChunk(
+                    source_type="issue",
+                    source_id="601",
+                    project_id=1,
+                    issue_id=601,
+                    chunk_index=0,
+                    text=lexical_text,
+                    url="http://x/issues/601",
+                    source_created_on=now,
+                    source_updated_on=now,
+                    source_metadata={},
+                    embedding_key="snip-601",
+                ),
+                DocChunk(
+                    source_type="issue",
+                    source_id="602",
+                    project_id=1,
+                    issue_id=602,
+                    chunk_index=0,
+                    text=vector_text,
+                    url="http://x/issues/602",
+                    source_created_on=now,
+                    source_updated_on=now,
+                    source_metadata={},
+                    sentence_offsets=[[0, 30], [31, len(vector_text)]],
+                    embedding_key="snip-602",
+                ),
+            ]
+        )
+        await session.commit()
+
+    async with session_factory() as session:
+        result = await hybrid_retrieve(
+            session,
+            query="oauth timeout",
+            filters=AskFilters(),
+            top_k=5,
+        )
+
+    lexical_chunk = next(item for item in result.chunks if item.source_id == "601")
+    assert lexical_chunk.snippet is not None
+    assert "OAuth callback timeout" in lexical_chunk.snippet
+    assert len(lexical_chunk.snippet) < len(lexical_text)
+
+    vector_record = retrieval_service._ChunkRecord(
+        id=602,
+        text=vector_text,
+        url="http://x/issues/602",
+        source_type="issue",
+        source_id="602",
+        updated_on=now,
+        sentence_offsets=[[0, 30], [31, len(vector_text)]],
+    )
+    snippet = retrieval_service._sentence_snippet(vector_record, {"token", "rotation"})
+    assert snippet == "Token rotation failed during deploy."
+
+
 def test_fuse_rankings_weighted_rrf() -> None:
     scores = fuse_rankings(
         lexical_ids=[10, 11, 12],
@@ -438,3 +714,147 @@ async def test_hybrid_retrieve_falls_back_when_planner_fails(
     assert retrieval.diagnostics.planner_queries == ["callback timeout"]
 
     get_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_hybrid_retrieve_caches_until_index_generation_advances(
+    isolated_retrieval_db: None,
+) -> None:
+    reset_retrieval_cache()
+    now = datetime.now(UTC)
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        session.add(
+            DocChunk(
+                source_type="issue",
+                source_id="601",
+                project_id=1,
+                issue_id=601,
+                chunk_index=0,
+                text="webhook retry storm after deploy",
+                url="http://x/issues/601",
+                source_created_on=now,
+                source_updated_on=now,
+                source_metadata={},
+                embedding_key="cache-601",
+            )
+        )
+        await session.commit()
+
+    async with session_factory() as session:
+        first = await hybrid_retrieve(
+            session, query="Webhook  retry", filters=AskFilters(), top_k=5
+        )
+        second = await hybrid_retrieve(
+            session, query="webhook retry", filters=AskFilters(), top_k=5
+        )
+
+    assert first.diagnostics.cache_status == "miss"
+    assert second.diagnostics.cache_status == "hit"
+    assert [item.id for item in first.chunks] == [item.id for item in second.chunks]
+
+    # Callers own the returned chunks; mutating them must not leak into the cache.
+    second.chunks[0].text = "mutated by caller"
+    async with session_factory() as session:
+        repeat = await hybrid_retrieve(
+            session, query="webhook retry", filters=AskFilters(), top_k=5
+        )
+    assert repeat.diagnostics.cache_status == "hit"
+    assert repeat.chunks[0].text == "webhook retry storm after deploy"
+
+    async with session_factory() as session:
+        session.add(
+            DocChunk(
+                source_type="issue",
+                source_id="602",
+                project_id=1,
+                issue_id=602,
+                chunk_index=0,
+                text="webhook retry budget tuning",
+                url="http://x/issues/602",
+                source_created_on=now,
+                source_updated_on=now,
+                source_metadata={},
+                embedding_key="cache-602",
+            )
+        )
+        await session.commit()
+
+    async with session_factory() as session:
+        third = await hybrid_retrieve(session, query="webhook retry", filters=AskFilters(), top_k=5)
+
+    assert third.diagnostics.cache_status == "miss"
+    assert {item.source_id for item in third.chunks} == {"601", "602"}
+    snapshot = get_retrieval_cache_snapshot(enabled=True, shared=False)
+    assert snapshot.hits == 2
+    assert snapshot.misses == 2
+    assert snapshot.invalidations == 1
+    reset_retrieval_cache()
+
+
+@pytest.mark.asyncio
+async def test_index_generation_uses_dedicated_marker(isolated_retrieval_db: None) -> None:
+    settings = get_settings()
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        before = await load_index_generation(session, index_path=settings.vector_index_path)
+        await mark_retrieval_index_updated(session)
+        await mark_retrieval_index_updated(session)
+        await session.commit()
+
+    async with session_factory() as session:
+        after = await load_index_generation(session, index_path=settings.vector_index_path)
+        marker = await session.scalar(
+            select(CacheGeneration.generation).where(CacheGeneration.name == "retrieval_index")
+        )
+        sync_states = await session.scalar(select(func.count()).select_from(SyncState))
+
+    assert before != after
+    assert marker == 2
+    assert sync_states == 0
+
+
+@pytest.mark.asyncio
+async def test_hybrid_retrieve_shared_cache_serves_other_workers(
+    isolated_retrieval_db: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("RETRIEVAL_CACHE_SHARED", "true")
+    get_settings.cache_clear()
+    reset_retrieval_cache()
+    now = datetime.now(UTC)
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        session.add(
+            DocChunk(
+                source_type="wiki",
+                source_id="1:Escalations",
+                project_id=1,
+                chunk_index=0,
+                text="escalation matrix for priority incidents",
+                url="http://x/wiki/Escalations",
+                source_created_on=now,
+                source_updated_on=now,
+                source_metadata={},
+                embedding_key="cache-wiki-1",
+            )
+        )
+        await session.commit()
+
+    async with session_factory() as session:
+        first = await hybrid_retrieve(
+            session, query="escalation matrix", filters=AskFilters(), top_k=3
+        )
+    # Simulate another worker process with a cold in-memory cache.
+    reset_retrieval_cache()
+    async with session_factory() as session:
+        second = await hybrid_retrieve(
+            session, query="escalation matrix", filters=AskFilters(), top_k=3
+        )
+
+    assert first.diagnostics.cache_status == "miss"
+    assert second.diagnostics.cache_status == "shared_hit"
+    assert [item.id for item in second.chunks] == [item.id for item in first.chunks]
+    assert second.chunks[0].text == "escalation matrix for priority incidents"
+    reset_retrieval_cache()
+    get_settings.cache_clear()
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import select, update
+
+from redmine_rag.core.config import get_settings
+from redmine_rag.db.base import Base
+from redmine_rag.db.models import SyncJob, SyncLock
+from redmine_rag.db.session import get_engine, get_session_factory
+from redmine_rag.services import sync_service
+from redmine_rag.workers.locks import (
+    SYNC_LOCK_NAME,
+    LockHeldError,
+    LockLostError,
+    acquire_lock,
+    get_lock_owner,
+    release_lock,
+    renew_lock,
+    run_under_lock,
+)
+from redmine_rag.workers.scheduler import SyncScheduler
+
+
+@pytest.fixture
+async def isolated_scheduler_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'scheduler.db'}")
+    monkeypatch.setenv("SYNC_SCHEDULER_INTERVAL_S", "600")
+    monkeypatch.setenv("SYNC_SCHEDULER_MIN_INTERVAL_S", "60")
+    monkeypatch.setenv("SYNC_SCHEDULER_MAX_INTERVAL_S", "1800")
+    monkeypatch.setenv("SYNC_SCHEDULER_BUSY_CHANGES", "50")
+    monkeypatch.setenv("SYNC_DELETION_SWEEP_INTERVAL_S", "0")
+
+    get_settings.cache_clear()
+    get_engine.cache_clear()
+    get_session_factory.cache_clear()
+
+    engine = get_engine()
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    yield
+
+    await engine.dispose()
+    get_settings.cache_clear()
+    get_engine.cache_clear()
+    get_session_factory.cache_clear()
+
+
+def _fake_sync(changes: int, *, delay_s: float = 0.0):
+    async def _run(*, project_ids: list[int], modules_override: list[str] | None, **_kwargs):
+        if delay_s:
+            await asyncio.sleep(delay_s)
+        return {"upserts": {"issue": {"inserted": changes, "updated": 0}}}
+
+    return _run
+
+
+async def _jobs() -> list[SyncJob]:
+    async with get_session_factory()() as session:
+        return list(
+            (await session.scalars(select(SyncJob).order_by(SyncJob.created_at, SyncJob.id))).all()
+        )
+
+
+@pytest.mark.asyncio
+async def test_scheduler_interval_adapts_to_change_volume(isolated_scheduler_env: None) -> None:
+    scheduler = SyncScheduler(owner="test")
+
+    assert scheduler.adapt(None) == 600
+    assert scheduler.adapt(500) == 300
+    assert scheduler.adapt(500) == 150
+    assert scheduler.adapt(500) == 75
+    assert scheduler.adapt(500) == 60
+    assert scheduler.adapt(10) == 330
+    assert scheduler.adapt(0) == 495
+    for _ in range(10):
+        scheduler.adapt(0)
+    assert scheduler.interval_s == 1800
+    jittered = [scheduler.jittered(1000) for _ in range(50)]
+    assert all(900 <= value <= 1100 for value in jittered)
+
+
+@pytest.mark.asyncio
+async def test_sync_lock_is_exclusive_until_released_or_expired(
+    isolated_scheduler_env: None,
+) -> None:
+    async with get_session_factory()() as session:
+        assert await acquire_lock(session, SYNC_LOCK_NAME, owner="a", ttl_s=60)
+        assert not await acquire_lock(session, SYNC_LOCK_NAME, owner="b", ttl_s=60)
+        assert await renew_lock(session, SYNC_LOCK_NAME, owner="a", ttl_s=60)
+        assert not await renew_lock(session, SYNC_LOCK_NAME, owner="b", ttl_s=60)
+        assert await get_lock_owner(session, SYNC_LOCK_NAME) == "a"
+
+        await session.execute(
+            update(SyncLock)
+            .where(SyncLock.name == SYNC_LOCK_NAME)
+            .values(expires_at=datetime.now(UTC) - timedelta(seconds=1))
+        )
+        await session.commit()
+        assert await get_lock_owner(session, SYNC_LOCK_NAME) is None
+        assert await acquire_lock(session, SYNC_LOCK_NAME, owner="b", ttl_s=60)
+        assert not await renew_lock(session, SYNC_LOCK_NAME, owner="a", ttl_s=60)
+
+        await release_lock(session, SYNC_LOCK_NAME, owner="b")
+        assert await get_lock_owner(session, SYNC_LOCK_NAME) is None
+
+
+@pytest.mark.asyncio
+async def test_scheduler_tick_runs_sync_and_records_adaptation(
+    isolated_scheduler_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(sync_service, "run_incremental_sync", _fake_sync(120))
+    scheduler = SyncScheduler(owner="test")
+
+    result = await scheduler.tick()
+
+    assert result["outcome"] == "finished"
+    assert result["changes"] == 120
+    assert result["next_interval_s"] == 300
+    (job,) = await _jobs()
+    assert job.status == "finished"
+    assert job.payload["trigger"] == "scheduler"
+    assert job.payload["scheduler"]["changes"] == 120
+    assert job.payload["scheduler"]["overrun_ticks"] == 0
+    async with get_session_factory()() as session:
+        assert await get_lock_owner(session, SYNC_LOCK_NAME) is None
+
+
+@pytest.mark.asyncio
+async def test_scheduler_tick_skips_while_lock_is_held(
+    isolated_scheduler_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[int] = []
+
+    async def _never(*, project_ids: list[int], modules_override: list[str] | None, **_kwargs):
+        calls.append(1)
+        return {}
+
+    monkeypatch.setattr(sync_service, "run_incremental_sync", _never)
+    async with get_session_factory()() as session:
+        assert await acquire_lock(session, SYNC_LOCK_NAME, owner="other-host", ttl_s=60)
+
+    result = await SyncScheduler(owner="test").tick()
+
+    assert result["outcome"] == "skipped"
+    assert result["reason"] == "lock_held"
+    assert calls == []
+    (job,) = await _jobs()
+    assert job.status == "skipped"
+    assert job.payload["lock_owner"] == "other-host"
+    assert job.finished_at is not None
+
+
+@pytest.mark.asyncio
+async def test_scheduler_records_overrun_as_skipped_ticks(
+    isolated_scheduler_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("SYNC_SCHEDULER_INTERVAL_S", "0.05")
+    get_settings.cache_clear()
+    monkeypatch.setattr(sync_service, "run_incremental_sync", _fake_sync(5, delay_s=0.12))
+
+    result = await SyncScheduler(owner="test").tick()
+
+    assert result["outcome"] == "finished"
+    assert result["overrun_ticks"] >= 2
+    statuses = {job.status: job for job in await _jobs()}
+    assert set(statuses) == {"finished", "skipped"}
+    overrun = statuses["skipped"]
+    assert overrun.payload["reason"] == "overrun"
+    assert overrun.payload["missed_ticks"] == result["overrun_ticks"]
+    assert overrun.payload["job_id"] == result["job_id"]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_fails_abandoned_runs_instead_of_skipping_forever(
+    isolated_scheduler_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(sync_service, "run_incremental_sync", _fake_sync(3))
+    async with get_session_factory()() as session:
+        session.add(
+            SyncJob(
+                id="job-crashed",
+                status="running",
+                payload={"trigger": "scheduler"},
+                lease_owner="dead-host",
+                lease_expires_at=datetime.now(UTC) - timedelta(seconds=5),
+            )
+        )
+        await session.commit()
+
+    result = await SyncScheduler(owner="test").tick()
+
+    assert result["outcome"] == "finished"
+    jobs = {job.id: job for job in await _jobs()}
+    assert jobs["job-crashed"].status == "failed"
+    assert jobs["job-crashed"].error_message is not None
+    assert jobs[result["job_id"]].status == "finished"
+    assert jobs[result["job_id"]].lease_expires_at is None
+
+
+@pytest.mark.asyncio
+async def test_cancelled_tick_marks_job_failed_and_releases_lock(
+    isolated_scheduler_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    started = asyncio.Event()
+
+    async def _slow(*, project_ids: list[int], modules_override: list[str] | None, **_kwargs):
+        started.set()
+        await asyncio.sleep(30)
+        return {}
+
+    monkeypatch.setattr(sync_service, "run_incremental_sync", _slow)
+    tick = asyncio.create_task(SyncScheduler(owner="test").tick())
+    await asyncio.wait_for(started.wait(), timeout=5)
+    tick.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await tick
+
+    (job,) = await _jobs()
+    assert job.status == "failed"
+    assert job.error_message == "Sync interrupted before it finished"
+    async with get_session_factory()() as session:
+        assert await get_lock_owner(session, SYNC_LOCK_NAME) is None
+
+
+@pytest.mark.asyncio
+async def test_losing_the_sync_lock_cancels_the_scheduled_run(
+    isolated_scheduler_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("SYNC_SCHEDULER_LOCK_TTL_S", "0.3")
+    get_settings.cache_clear()
+
+    async def _stolen(*, project_ids: list[int], modules_override: list[str] | None, **_kwargs):
+        async with get_session_factory()() as session:
+            await session.execute(
+                update(SyncLock).where(SyncLock.name == SYNC_LOCK_NAME).values(owner="other-host")
+            )
+            await session.commit()
+        await asyncio.sleep(30)
+        return {}
+
+    monkeypatch.setattr(sync_service, "run_incremental_sync", _stolen)
+
+    result = await asyncio.wait_for(SyncScheduler(owner="test").tick(), timeout=5)
+
+    assert result["outcome"] == "failed"
+    (job,) = await _jobs()
+    assert job.status == "failed"
+    assert job.error_message == "Sync interrupted before it finished"
+
+
+@pytest.mark.asyncio
+async def test_scheduler_skips_while_inline_job_runs(
+    isolated_scheduler_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ticks: list[dict[str, object]] = []
+
+    async def _sync_with_tick(
+        *, project_ids: list[int], modules_override: list[str] | None, **_kwargs
+    ):
+        ticks.append(await SyncScheduler(owner="test").tick())
+        return {}
+
+    monkeypatch.setattr(sync_service, "run_incremental_sync", _sync_with_tick)
+    async with get_session_factory()() as session:
+        session.add(SyncJob(id="job-inline", status="queued", payload={}))
+        await session.commit()
+
+    assert await sync_service.run_inline_sync_job("job-inline") == {}
+
+    assert [(tick["outcome"], tick["reason"]) for tick in ticks] == [("skipped", "lock_held")]
+    jobs = {job.id: job for job in await _jobs()}
+    assert jobs["job-inline"].status == "finished"
+    assert jobs["job-inline"].lease_owner is not None
+    assert jobs["job-inline"].lease_owner.startswith("inline:")
+    async with get_session_factory()() as session:
+        assert await get_lock_owner(session, SYNC_LOCK_NAME) is None
+
+
+@pytest.mark.asyncio
+async def test_run_under_lock_refuses_held_lock_and_cancels_on_loss(
+    isolated_scheduler_env: None,
+) -> None:
+    async def _steal_and_wait() -> str:
+        async with get_session_factory()() as session:
+            await session.execute(
+                update(SyncLock).where(SyncLock.name == SYNC_LOCK_NAME).values(owner="other-host")
+            )
+            await session.commit()
+        await asyncio.sleep(30)
+        return "done"
+
+    async def _work() -> str:
+        return "done"
+
+    assert await run_under_lock(_work, name=SYNC_LOCK_NAME, owner="cli", ttl_s=60) == "done"
+    with pytest.raises(LockLostError):
+        await asyncio.wait_for(
+            run_under_lock(_steal_and_wait, name=SYNC_LOCK_NAME, owner="cli", ttl_s=0.3),
+            timeout=5,
+        )
+    with pytest.raises(LockHeldError):
+        await run_under_lock(_work, name=SYNC_LOCK_NAME, owner="cli", ttl_s=60)
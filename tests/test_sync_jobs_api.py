@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 from pathlib import Path
 
 import httpx
 import pytest
+from fastapi import BackgroundTasks
 from fastapi.testclient import TestClient
 from sqlalchemy import select
 
+from redmine_rag.api.schemas import SyncRequest
 from redmine_rag.db.base import Base
 from redmine_rag.db.models import SyncJob
 from redmine_rag.db.session import get_engine, get_session_factory
+from redmine_rag.ingestion.sync_progress import SyncCancelledError
 from redmine_rag.main import app
 from redmine_rag.services import sync_service
 
@@ -141,7 +145,9 @@ async def test_sync_job_passes_module_override_to_pipeline(
 ) -> None:
     captured: dict[str, object] = {}
 
-    async def _fake_incremental_sync(*, project_ids: list[int], modules_override: list[str] | None):
+    async def _fake_incremental_sync(
+        *, project_ids: list[int], modules_override: list[str] | None, **_kwargs
+    ):
         captured["project_ids"] = project_ids
         captured["modules_override"] = modules_override
         return {"issues_synced": 1, "modules_enabled": modules_override or []}
@@ -171,3 +177,164 @@ async def test_sync_job_passes_module_override_to_pipeline(
     assert row.status == "finished"
     assert row.payload["modules"] == ["issues", "news"]
     assert "summary" in row.payload
+
+
+def test_duplicate_sync_requests_coalesce_into_pending_job(
+    isolated_sync_jobs_env: None,
+) -> None:
+    client = TestClient(app)
+    body = {"project_ids": [1, 2], "modules": ["issues", "news"]}
+
+    responses = [client.post("/v1/sync/redmine", json=body).json() for _ in range(5)]
+
+    job_id = responses[0]["job_id"]
+    assert responses[0]["coalesced"] is False
+    assert {response["job_id"] for response in responses} == {job_id}
+    assert all(response["coalesced"] for response in responses[1:])
+
+    subset = client.post("/v1/sync/redmine", json={"project_ids": [2], "modules": ["news"]})
+    assert subset.json()["job_id"] == job_id
+    wider = client.post("/v1/sync/redmine", json={"project_ids": [3], "modules": ["news"]})
+    assert wider.json()["job_id"] != job_id
+    defaults = client.post("/v1/sync/redmine", json={"project_ids": [1]})
+    assert defaults.json()["coalesced"] is False
+
+    listing = client.get("/v1/sync/jobs", params={"limit": 10}).json()
+    assert listing["counts"]["queued"] == 3
+    detail = client.get(f"/v1/sync/jobs/{job_id}").json()
+    assert detail["payload"]["coalesced"] == 5
+
+
+@pytest.mark.asyncio
+async def test_coalescing_prefers_queued_job_over_running_job(
+    isolated_sync_jobs_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("REDMINE_PROJECT_IDS", "1,2")
+    from redmine_rag.core.config import get_settings
+
+    get_settings.cache_clear()
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        session.add(
+            SyncJob(
+                id="job-running-all",
+                status="running",
+                payload={"project_ids": [], "modules": None},
+                started_at=datetime.now(UTC),
+            )
+        )
+        await session.commit()
+
+    first = await sync_service.queue_sync_job(
+        SyncRequest(project_ids=[2], modules=["issues"]), BackgroundTasks()
+    )
+    assert first.job_id == "job-running-all"
+    assert first.detail == "Sync request merged into running job"
+
+    async with session_factory() as session:
+        session.add(SyncJob(id="job-queued-all", status="queued", payload={"project_ids": [1, 2]}))
+        await session.commit()
+    second = await sync_service.queue_sync_job(SyncRequest(), BackgroundTasks())
+    assert second.job_id == "job-queued-all"
+
+    third = await sync_service.queue_sync_job(SyncRequest(project_ids=[5]), BackgroundTasks())
+    assert third.coalesced is False
+
+    monkeypatch.setenv("SYNC_JOB_COALESCE", "false")
+    get_settings.cache_clear()
+    fourth = await sync_service.queue_sync_job(SyncRequest(project_ids=[1]), BackgroundTasks())
+    assert fourth.coalesced is False
+
+
+@pytest.mark.asyncio
+async def test_coalesced_count_survives_inline_job_completion(
+    isolated_sync_jobs_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def _sync_while_requests_arrive(
+        *, project_ids: list[int], modules_override: list[str] | None, **_kwargs
+    ):
+        merged = await asyncio.gather(
+            *(
+                sync_service.queue_sync_job(SyncRequest(project_ids=[1]), BackgroundTasks())
+                for _ in range(3)
+            )
+        )
+        assert {response.job_id for response in merged} == {"job-inline"}
+        return {"issues_synced": 4}
+
+    monkeypatch.setattr(sync_service, "run_incremental_sync", _sync_while_requests_arrive)
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        session.add(SyncJob(id="job-inline", status="queued", payload={"project_ids": [1]}))
+        await session.commit()
+
+    assert await sync_service._run_sync_job("job-inline") == {"issues_synced": 4}
+
+    async with session_factory() as session:
+        row = await session.scalar(select(SyncJob).where(SyncJob.id == "job-inline"))
+    assert row is not None
+    assert row.status == "finished"
+    assert row.payload["coalesced"] == 3
+    assert row.payload["summary"] == {"issues_synced": 4}
+    assert row.payload["project_ids"] == [1]
+
+
+def test_sync_job_cancel_endpoint(isolated_sync_jobs_env: None) -> None:
+    import asyncio
+
+    asyncio.run(_seed_sync_jobs())
+    client = TestClient(app)
+
+    queued = client.post("/v1/sync/jobs/job-queued/cancel")
+    assert queued.status_code == 200
+    assert queued.json()["status"] == "cancelled"
+    assert queued.json()["finished_at"] is not None
+
+    running = client.post("/v1/sync/jobs/job-running/cancel")
+    assert running.status_code == 200
+    assert running.json()["status"] == "running"
+    assert running.json()["cancel_requested_at"] is not None
+
+    assert client.post("/v1/sync/jobs/job-finished/cancel").status_code == 409
+    assert client.post("/v1/sync/jobs/does-not-exist/cancel").status_code == 404
+
+    cancelled = client.get("/v1/sync/jobs", params={"status": "cancelled"}).json()
+    assert [item["id"] for item in cancelled["items"]] == ["job-queued"]
+    assert cancelled["counts"]["cancelled"] == 1
+    # A job that is being cancelled no longer absorbs new requests.
+    merged = client.post("/v1/sync/redmine", json={"project_ids": [2]}).json()
+    assert merged["job_id"] != "job-running"
+
+
+@pytest.mark.asyncio
+async def test_sync_job_records_progress_and_stops_on_cancel(
+    isolated_sync_jobs_env: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def _fake_incremental_sync(
+        *, project_ids: list[int], modules_override: list[str] | None, on_progress
+    ):
+        assert await on_progress({"module": "issues", "pages_done": 1}) is False
+        await sync_service.cancel_sync_job("job-cancel-test")
+        if await on_progress({"module": "issues", "pages_done": 2}):
+            raise SyncCancelledError("Sync job cancelled")
+        return {"issues_synced": 1}
+
+    monkeypatch.setattr(sync_service, "run_incremental_sync", _fake_incremental_sync)
+
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        session.add(SyncJob(id="job-cancel-test", status="queued", payload={"project_ids": [1]}))
+        await session.commit()
+
+    assert await sync_service._run_sync_job("job-cancel-test") is None
+
+    async with session_factory() as session:
+        row = await session.scalar(select(SyncJob).where(SyncJob.id == "job-cancel-test"))
+
+    assert row is not None
+    assert row.status == "cancelled"
+    assert row.finished_at is not None
+    assert row.cancel_requested_at is not None
+    assert row.progress == {"module": "issues", "pages_done": 2}
+    assert "summary" not in row.payload
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 import httpx
 import pytest
@@ -18,18 +21,32 @@ from redmine_rag.db.models import (
     SyncCursor,
     SyncState,
     TimeEntry,
+    Tracker,
     WikiPage,
 )
 from redmine_rag.db.session import get_engine, get_session_factory
+from redmine_rag.indexing.vector_store import LocalNumpyVectorStore
+from redmine_rag.ingestion import sync_pipeline
 from redmine_rag.ingestion.redmine_client import RedmineClient
-from redmine_rag.ingestion.sync_pipeline import run_incremental_sync
+from redmine_rag.ingestion.repository import IngestionRepository
+from redmine_rag.ingestion.sync_pipeline import (
+    PageCheckpoint,
+    SyncContext,
+    fetch_each,
+    iter_paginated,
+    run_incremental_sync,
+)
+from redmine_rag.ingestion.sync_progress import SyncCancelledError, SyncProgress
 from redmine_rag.mock_redmine.app import app as mock_redmine_app
+from redmine_rag.services.reference_cache_service import get_reference_cache_snapshot
 
 
 @pytest.fixture
 async def isolated_sync_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
     db_path = tmp_path / "sync_test.db"
     monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{db_path}")
+    monkeypatch.setenv("VECTOR_INDEX_PATH", str(tmp_path / "chunks.index"))
+    monkeypatch.setenv("VECTOR_META_PATH", str(tmp_path / "chunks.meta.json"))
     monkeypatch.setenv("REDMINE_BASE_URL", "http://testserver")
     monkeypatch.setenv("REDMINE_API_KEY", "mock-api-key")
     monkeypatch.setenv("REDMINE_ALLOWED_HOSTS", "testserver,127.0.0.1,localhost")
@@ -77,7 +94,9 @@ async def test_incremental_sync_ingests_mock_redmine_without_duplication(
         extra_headers={"X-Mock-Role": "admin"},
     )
 
+    invalidations_before = get_reference_cache_snapshot().invalidations
     first_summary = await run_incremental_sync(project_ids=[1], client=client)
+    assert get_reference_cache_snapshot().invalidations == invalidations_before + 3
 
     assert first_summary["projects_synced"] >= 1
     assert first_summary["issues_synced"] >= 120
@@ -138,6 +157,20 @@ async def test_incremental_sync_ingests_mock_redmine_without_duplication(
 
     second_summary = await run_incremental_sync(project_ids=[1], client=client)
     assert second_summary["issues_synced"] >= 0
+    # Listing-only modules detect unchanged payloads via raw_entity hashes.
+    assert first_summary["news_synced"] > 0
+    assert second_summary["news_synced"] == 0
+    assert second_summary["documents_synced"] == 0
+    assert second_summary["files_synced"] == 0
+    assert second_summary["messages_synced"] == 0
+    assert second_summary["wiki_pages_synced"] == 0
+    assert second_summary["pages_unchanged"] > 0
+    assert second_summary["entities_unchanged"] >= 2
+    assert first_summary["upserts"]["issue"]["inserted"] == issue_count
+    # Rows re-fetched through the overlap window are identical and must not be rewritten.
+    for counts in second_summary["upserts"].values():
+        assert counts["inserted"] == 0
+        assert counts["updated"] == 0
 
     async with session_factory() as session:
         issue_count_after = await session.scalar(select(func.count()).select_from(Issue))
@@ -153,3 +186,552 @@ async def test_incremental_sync_ingests_mock_redmine_without_duplication(
     assert raw_journal_count_after == raw_journal_count
     assert wiki_count_after == wiki_count
     assert chunk_count_after == chunk_count
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_streams_pages_into_index_stage(
+    isolated_sync_env: None, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("SYNC_INDEX_QUEUE_SIZE", "1")
+    monkeypatch.setenv("SYNC_VECTOR_FLUSH_INTERVAL_S", "0")
+    get_settings.cache_clear()
+    client = RedmineClient(
+        base_url="http://testserver",
+        api_key="mock-api-key",
+        verify_ssl=False,
+        transport=httpx.ASGITransport(app=mock_redmine_app),
+        extra_headers={"X-Mock-Role": "admin"},
+    )
+
+    summary = await run_incremental_sync(project_ids=[1], client=client)
+
+    assert summary["index_stage_error"] is None
+    assert summary["index_first_batch_s"] is not None
+    stages = summary["stages"]
+    assert stages["write"]["batches"] > 0
+    assert stages["enqueue"]["items"] > 0
+    assert stages["chunk"]["batches"] == stages["enqueue"]["batches"]
+    assert stages["embed"]["items"] > 0
+
+    store = LocalNumpyVectorStore(
+        index_path=str(tmp_path / "chunks.index"),
+        meta_path=str(tmp_path / "chunks.meta.json"),
+    )
+    async with get_session_factory()() as session:
+        chunk_keys = set((await session.scalars(select(DocChunk.embedding_key))).all())
+    # Streamed chunks plus the catch-up pass (wiki pages) cover every chunk exactly once.
+    assert set(store.keys) == chunk_keys
+    assert summary["vectors_upserted"] == len(chunk_keys)
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_flushes_upserts_per_page(
+    isolated_sync_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    batch_sizes: dict[str, list[int]] = {"issues": [], "time_entries": []}
+    original_issues = IngestionRepository.upsert_issues
+    original_time_entries = IngestionRepository.upsert_time_entries
+
+    async def _record_issues(self: IngestionRepository, rows: list[dict[str, object]]) -> int:
+        batch_sizes["issues"].append(len(rows))
+        return await original_issues(self, rows)
+
+    async def _record_time_entries(self: IngestionRepository, rows: list[dict[str, object]]) -> int:
+        batch_sizes["time_entries"].append(len(rows))
+        return await original_time_entries(self, rows)
+
+    monkeypatch.setattr(IngestionRepository, "upsert_issues", _record_issues)
+    monkeypatch.setattr(IngestionRepository, "upsert_time_entries", _record_time_entries)
+
+    client = RedmineClient(
+        base_url="http://testserver",
+        api_key="mock-api-key",
+        verify_ssl=False,
+        transport=httpx.ASGITransport(app=mock_redmine_app),
+        extra_headers={"X-Mock-Role": "admin"},
+    )
+    summary = await run_incremental_sync(project_ids=[1], client=client)
+
+    assert len(batch_sizes["issues"]) >= 2
+    assert max(batch_sizes["issues"]) <= 100
+    assert sum(batch_sizes["issues"]) == summary["issues_synced"]
+    assert len(batch_sizes["time_entries"]) >= 3
+    assert max(batch_sizes["time_entries"]) <= 100
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_runs_independent_modules_concurrently(
+    isolated_sync_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(
+        "REDMINE_MODULES", "projects,users,groups,trackers,issue_statuses,issue_priorities,issues"
+    )
+    monkeypatch.setenv("SYNC_MODULE_CONCURRENCY", "3")
+    get_settings.cache_clear()
+
+    events: list[tuple[str, str]] = []
+    in_flight = 0
+    max_in_flight = 0
+
+    def _fake_handler(module_name: str):
+        async def _handler(context: SyncContext, summary: dict[str, object]) -> None:
+            nonlocal in_flight, max_in_flight
+            events.append(("start", module_name))
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            async with context.write():
+                await context.repo.upsert_trackers([{"id": len(events), "name": module_name}])
+            in_flight -= 1
+            events.append(("end", module_name))
+
+        return _handler
+
+    for module_name, attr in (
+        ("projects", "_sync_projects"),
+        ("users", "_sync_users"),
+        ("groups", "_sync_groups"),
+        ("trackers", "_sync_trackers"),
+        ("issue_statuses", "_sync_issue_statuses"),
+        ("issue_priorities", "_sync_issue_priorities"),
+        ("issues", "_sync_issues"),
+    ):
+        monkeypatch.setattr(sync_pipeline, attr, _fake_handler(module_name))
+
+    client = RedmineClient(
+        base_url="http://testserver",
+        api_key="mock-api-key",
+        transport=httpx.ASGITransport(app=mock_redmine_app),
+    )
+    summary = await run_incremental_sync(project_ids=[1], client=client)
+
+    assert max_in_flight == 3
+    issues_started = events.index(("start", "issues"))
+    for dependency in ("projects", "users", "trackers", "issue_statuses", "issue_priorities"):
+        assert events.index(("end", dependency)) < issues_started
+    assert list(summary["module_timings"]) == [
+        "projects",
+        "users",
+        "groups",
+        "trackers",
+        "issue_statuses",
+        "issue_priorities",
+        "issues",
+    ]
+    assert len(summary["critical_path"]) == 2
+    assert summary["critical_path"][-1] == "issues"
+    assert 0 < summary["critical_path_s"] <= summary["modules_wall_s"]
+
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        tracker_count = await session.scalar(select(func.count()).select_from(Tracker))
+    assert tracker_count == 7
+
+
+@pytest.mark.asyncio
+async def test_wiki_sync_tolerates_individual_page_failures(
+    isolated_sync_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("REDMINE_MODULES", "projects,wiki")
+    monkeypatch.setenv(
+        "REDMINE_WIKI_PAGES",
+        "platform-core:Feature-Login,platform-core:Missing-Page,"
+        "platform-core:Incident-Triage-Playbook",
+    )
+    get_settings.cache_clear()
+
+    client = RedmineClient(
+        base_url="http://testserver",
+        api_key="mock-api-key",
+        verify_ssl=False,
+        transport=httpx.ASGITransport(app=mock_redmine_app),
+        extra_headers={"X-Mock-Role": "admin"},
+    )
+    summary = await run_incremental_sync(project_ids=[1], client=client)
+
+    assert summary["wiki_pages_synced"] == 2
+    assert summary["items_failed"] == [
+        {"module": "wiki", "reference": "platform-core:Missing-Page", "status_code": 404}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_time_entries_sync_resumes_from_page_checkpoint(
+    isolated_sync_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("REDMINE_MODULES", "time_entries")
+    get_settings.cache_clear()
+
+    client = RedmineClient(
+        base_url="http://testserver",
+        api_key="mock-api-key",
+        verify_ssl=False,
+        transport=httpx.ASGITransport(app=mock_redmine_app),
+        extra_headers={"X-Mock-Role": "admin"},
+    )
+    original = client.get_time_entries
+    requested: list[int] = []
+    fail_at: int | None = 300
+
+    async def _get_time_entries(
+        updated_since: datetime | None, project_ids: list[int], limit: int, offset: int
+    ) -> dict[str, Any]:
+        requested.append(offset)
+        if offset == fail_at:
+            raise RuntimeError("connection dropped")
+        return await original(
+            updated_since=updated_since, project_ids=project_ids, limit=limit, offset=offset
+        )
+
+    monkeypatch.setattr(client, "get_time_entries", _get_time_entries)
+
+    with pytest.raises(RuntimeError, match="connection dropped"):
+        await run_incremental_sync(
+            project_ids=[1], client=client, modules_override=["time_entries"]
+        )
+
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        cursor = await session.scalar(
+            select(SyncCursor).where(SyncCursor.entity_type == "time_entries")
+        )
+        committed_entries = await session.scalar(select(func.count()).select_from(TimeEntry))
+    assert cursor is not None
+    assert cursor.last_seen_updated_on is None
+    checkpoint = PageCheckpoint.decode(cursor.cursor_token)
+    assert checkpoint is not None
+    assert checkpoint.offset == 300
+    assert checkpoint.updated_since is None
+    assert checkpoint.high_water is not None
+    assert committed_entries == 300
+
+    fail_at = None
+    requested.clear()
+    summary = await run_incremental_sync(
+        project_ids=[1], client=client, modules_override=["time_entries"]
+    )
+
+    assert min(requested) == 200
+    assert summary["modules_resumed"] == [
+        {"module": "time_entries", "project_ids": [1], "offset": 200, "checkpoint_offset": 300}
+    ]
+    async with session_factory() as session:
+        cursor = await session.scalar(
+            select(SyncCursor).where(SyncCursor.entity_type == "time_entries")
+        )
+        total_entries = await session.scalar(select(func.count()).select_from(TimeEntry))
+    assert cursor is not None
+    assert cursor.cursor_token is None
+    assert cursor.last_seen_updated_on is not None
+    assert total_entries is not None
+    assert total_entries > 300
+
+
+@pytest.mark.asyncio
+async def test_project_cursors_backfill_only_newly_added_projects(
+    isolated_sync_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("REDMINE_MODULES", "time_entries")
+    get_settings.cache_clear()
+
+    client = RedmineClient(
+        base_url="http://testserver",
+        api_key="mock-api-key",
+        verify_ssl=False,
+        transport=httpx.ASGITransport(app=mock_redmine_app),
+        extra_headers={"X-Mock-Role": "admin"},
+    )
+    original = client.get_time_entries
+    requested: set[tuple[tuple[int, ...], bool]] = set()
+
+    async def _get_time_entries(
+        updated_since: datetime | None, project_ids: list[int], limit: int, offset: int
+    ) -> dict[str, Any]:
+        requested.add((tuple(project_ids), updated_since is None))
+        return await original(
+            updated_since=updated_since, project_ids=project_ids, limit=limit, offset=offset
+        )
+
+    monkeypatch.setattr(client, "get_time_entries", _get_time_entries)
+
+    # A cursor left by the old composite scope seeds the per-project cursor.
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        session.add(
+            SyncCursor(
+                entity_type="time_entries",
+                project_scope="1,3",
+                last_seen_updated_on=datetime(2020, 1, 1, tzinfo=UTC),
+            )
+        )
+        await session.commit()
+
+    first = await run_incremental_sync(
+        project_ids=[1], client=client, modules_override=["time_entries"]
+    )
+    assert requested == {((1,), False)}
+    assert [group["mode"] for group in first["cursor_groups"]] == ["incremental"]
+
+    requested.clear()
+    second = await run_incremental_sync(
+        project_ids=[2, 1], client=client, modules_override=["time_entries"]
+    )
+
+    assert requested == {((2,), True), ((1,), False)}
+    assert {(tuple(group["project_ids"]), group["mode"]) for group in second["cursor_groups"]} == {
+        ((2,), "backfill"),
+        ((1,), "incremental"),
+    }
+    async with session_factory() as session:
+        scopes = set(
+            await session.scalars(
+                select(SyncCursor.project_scope).where(SyncCursor.entity_type == "time_entries")
+            )
+        )
+    assert scopes == {"1", "2", "1,3"}
+
+
+@pytest.mark.asyncio
+async def test_sharded_sync_partitions_projects_and_merges_summaries(
+    isolated_sync_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("REDMINE_MODULES", "time_entries,news")
+    monkeypatch.setenv("SYNC_PROJECT_SHARDS", "2")
+    get_settings.cache_clear()
+
+    client = RedmineClient(
+        base_url="http://testserver",
+        api_key="mock-api-key",
+        verify_ssl=False,
+        transport=httpx.ASGITransport(app=mock_redmine_app),
+        extra_headers={"X-Mock-Role": "admin"},
+    )
+    original = client.get_time_entries
+    requested_scopes: set[tuple[int, ...]] = set()
+
+    async def _get_time_entries(
+        updated_since: datetime | None, project_ids: list[int], limit: int, offset: int
+    ) -> dict[str, Any]:
+        requested_scopes.add(tuple(project_ids))
+        return await original(
+            updated_since=updated_since, project_ids=project_ids, limit=limit, offset=offset
+        )
+
+    monkeypatch.setattr(client, "get_time_entries", _get_time_entries)
+
+    summary = await run_incremental_sync(project_ids=[3, 1, 2], client=client)
+
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        entry_count = await session.scalar(select(func.count()).select_from(TimeEntry))
+
+    assert requested_scopes == {(1, 3), (2,)}
+    assert {(shard["module"], tuple(shard["project_ids"])) for shard in summary["shards"]} == {
+        ("time_entries", (1, 3)),
+        ("time_entries", (2,)),
+        ("news", (1, 3)),
+        ("news", (2,)),
+    }
+    assert entry_count is not None
+    assert entry_count > 0
+    assert summary["time_entries_synced"] == entry_count
+    assert summary["news_synced"] > 0
+    assert summary["upserts"]["time_entry"]["inserted"] == entry_count
+    assert len(summary["cursor_groups"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_each_bounds_fan_out_and_keeps_input_order() -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _fetch(item: int) -> dict[str, object]:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.001 * (10 - item))
+        in_flight -= 1
+        if item == 4:
+            request = httpx.Request("GET", "http://testserver/messages/4.json")
+            raise httpx.HTTPStatusError(
+                "boom", request=request, response=httpx.Response(500, request=request)
+            )
+        return {"id": item}
+
+    results = await fetch_each(list(range(10)), _fetch, concurrency=3)
+
+    assert [item for item, _ in results] == list(range(10))
+    assert isinstance(results[4][1], httpx.HTTPStatusError)
+    assert [payload for _, payload in results if isinstance(payload, dict)] == [
+        {"id": item} for item in range(10) if item != 4
+    ]
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_iter_paginated_prefetches_with_bounded_window_in_order() -> None:
+    in_flight = 0
+    max_in_flight = 0
+    requested: list[int] = []
+
+    async def _fetch_page(limit: int, offset: int) -> dict[str, object]:
+        nonlocal in_flight, max_in_flight
+        requested.append(offset)
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # Later offsets finish first to prove pages are still yielded in order.
+        await asyncio.sleep(0.001 * (10 - offset // limit))
+        in_flight -= 1
+        items = [{"id": item} for item in range(offset, min(offset + limit, 95))]
+        return {"items": items, "total_count": 95, "limit": limit, "offset": offset}
+
+    pages = [
+        [item["id"] for item in page]
+        async for page in iter_paginated(_fetch_page, payload_key="items", page_size=10, prefetch=3)
+    ]
+
+    assert [item for page in pages for item in page] == list(range(95))
+    assert len(pages) == 10
+    assert sorted(requested) == list(range(0, 100, 10))
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_iter_paginated_falls_back_to_sequential_without_total_count() -> None:
+    requested: list[int] = []
+
+    async def _fetch_page(limit: int, offset: int) -> dict[str, object]:
+        requested.append(offset)
+        return {"items": [{"id": item} for item in range(offset, min(offset + limit, 25))]}
+
+    pages = [page async for page in iter_paginated(_fetch_page, payload_key="items", page_size=10)]
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert requested == [0, 10, 20]
+
+    async def _unpaginated(limit: int, offset: int) -> dict[str, object]:
+        return {"items": [{"id": item} for item in range(limit)]}
+
+    repeated = [
+        page async for page in iter_paginated(_unpaginated, payload_key="items", page_size=10)
+    ]
+    assert len(repeated) == 1
+
+
+@pytest.mark.asyncio
+async def test_iter_paginated_reports_progress_and_stops_between_pages() -> None:
+    requested: list[int] = []
+
+    async def _fetch_page(limit: int, offset: int) -> dict[str, object]:
+        requested.append(offset)
+        items = [{"id": item} for item in range(offset, min(offset + limit, 45))]
+        return {"items": items, "total_count": 45, "limit": limit, "offset": offset}
+
+    progress = SyncProgress()
+    pages = 0
+
+    async def _consume() -> None:
+        nonlocal pages
+        async for _page in iter_paginated(
+            _fetch_page,
+            payload_key="items",
+            page_size=10,
+            prefetch=1,
+            progress=progress,
+            module="issues",
+        ):
+            pages += 1
+            if pages == 2:
+                progress.cancel()
+
+    with pytest.raises(SyncCancelledError):
+        await _consume()
+
+    snapshot = progress.snapshot()
+    assert pages == 2
+    assert snapshot["module"] == "issues"
+    assert snapshot["pages_done"] == 2
+    assert snapshot["pages_total"] == 5
+    assert snapshot["rows"] == 20
+    assert snapshot["modules"]["issues"]["eta_s"] is not None
+    # The prefetched third page is discarded, nothing later is requested.
+    assert max(requested) <= 20
+
+
+@pytest.mark.asyncio
+async def test_cancelled_sync_keeps_page_checkpoint_and_resumes(
+    isolated_sync_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("REDMINE_MODULES", "time_entries")
+    monkeypatch.setenv("SYNC_PAGE_PREFETCH", "1")
+    monkeypatch.setenv("SYNC_PROGRESS_INTERVAL_S", "0.01")
+    get_settings.cache_clear()
+
+    client = RedmineClient(
+        base_url="http://testserver",
+        api_key="mock-api-key",
+        verify_ssl=False,
+        transport=httpx.ASGITransport(app=mock_redmine_app),
+        extra_headers={"X-Mock-Role": "admin"},
+    )
+    original = client.get_time_entries
+    cancel = False
+    cancel_at: int | None = 200
+
+    async def _get_time_entries(
+        updated_since: datetime | None, project_ids: list[int], limit: int, offset: int
+    ) -> dict[str, Any]:
+        nonlocal cancel
+        if offset == cancel_at:
+            cancel = True
+            await asyncio.sleep(0.05)
+        return await original(
+            updated_since=updated_since, project_ids=project_ids, limit=limit, offset=offset
+        )
+
+    monkeypatch.setattr(client, "get_time_entries", _get_time_entries)
+    snapshots: list[dict[str, Any]] = []
+
+    async def _sink(snapshot: dict[str, Any]) -> bool:
+        snapshots.append(snapshot)
+        return cancel
+
+    with pytest.raises(SyncCancelledError):
+        await run_incremental_sync(
+            project_ids=[1], client=client, modules_override=["time_entries"], on_progress=_sink
+        )
+
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        cursor = await session.scalar(
+            select(SyncCursor).where(SyncCursor.entity_type == "time_entries")
+        )
+        committed_entries = await session.scalar(select(func.count()).select_from(TimeEntry))
+        state = await session.scalar(
+            select(SyncState).where(SyncState.key == "redmine_incremental")
+        )
+    assert cursor is not None
+    checkpoint = PageCheckpoint.decode(cursor.cursor_token)
+    assert checkpoint is not None
+    assert checkpoint.offset in {200, 300}
+    assert committed_entries == checkpoint.offset
+    assert state is not None
+    assert state.last_success_at is None
+    final = snapshots[-1]
+    assert final["cancel_requested"] is True
+    assert final["rate_limiter"]["requests"] > 0
+    assert final["modules"]["time_entries"]["pages_done"] == checkpoint.offset // 100
+    assert final["modules"]["time_entries"]["pages_total"] > final["pages_done"]
+
+    cancel = False
+    cancel_at = None
+    summary = await run_incremental_sync(
+        project_ids=[1], client=client, modules_override=["time_entries"], on_progress=_sink
+    )
+
+    assert summary["modules_resumed"][0]["checkpoint_offset"] == checkpoint.offset
+    assert snapshots[-1]["modules"]["time_entries"]["finished"] is True
+    async with session_factory() as session:
+        total_entries = await session.scalar(select(func.count()).select_from(TimeEntry))
+    assert total_entries is not None
+    assert total_entries > checkpoint.offset
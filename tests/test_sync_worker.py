@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from redmine_rag.core.config import get_settings
+from redmine_rag.db.base import Base
+from redmine_rag.db.models import SyncJob
+from redmine_rag.db.session import get_engine, get_session_factory
+from redmine_rag.main import app
+from redmine_rag.services import sync_service
+from redmine_rag.services.sync_service import renew_sync_job_lease
+from redmine_rag.workers.locks import SYNC_LOCK_NAME, acquire_lock, get_lock_owner
+from redmine_rag.workers.sync_worker import SyncWorker, claim_sync_job
+
+
+@pytest.fixture
+async def isolated_worker_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'sync_worker.db'}")
+    monkeypatch.setenv("SYNC_JOB_EXECUTOR", "worker")
+
+    get_settings.cache_clear()
+    get_engine.cache_clear()
+    get_session_factory.cache_clear()
+
+    engine = get_engine()
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    yield
+
+    await engine.dispose()
+    get_settings.cache_clear()
+    get_engine.cache_clear()
+    get_session_factory.cache_clear()
+
+
+async def _add_jobs(*jobs: SyncJob) -> None:
+    async with get_session_factory()() as session:
+        session.add_all(jobs)
+        await session.commit()
+
+
+async def _get_job(job_id: str) -> SyncJob:
+    async with get_session_factory()() as session:
+        job = await session.scalar(select(SyncJob).where(SyncJob.id == job_id))
+    assert job is not None
+    return job
+
+
+async def _claim(owner: str) -> str | None:
+    async with get_session_factory()() as session:
+        return await claim_sync_job(session, owner=owner, ttl_s=60, max_attempts=3)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_workers_claim_distinct_jobs(isolated_worker_env: None) -> None:
+    await _add_jobs(
+        SyncJob(id="job-a", status="queued", payload={"project_ids": [1]}),
+        SyncJob(id="job-b", status="queued", payload={"project_ids": [2]}),
+        SyncJob(id="job-done", status="finished", payload={}),
+    )
+
+    claimed = await asyncio.gather(*(_claim(f"worker-{index}") for index in range(4)))
+
+    assert sorted(job_id for job_id in claimed if job_id) == ["job-a", "job-b"]
+    assert claimed.count(None) == 2
+    job = await _get_job("job-a")
+    assert job.status == "running"
+    assert job.attempts == 1
+    assert job.lease_owner is not None
+    async with get_session_factory()() as session:
+        assert await renew_sync_job_lease(session, "job-a", owner=job.lease_owner, ttl_s=60)
+        assert not await renew_sync_job_lease(session, "job-a", owner="intruder", ttl_s=60)
+
+
+@pytest.mark.asyncio
+async def test_expired_leases_are_reclaimed_until_attempts_run_out(
+    isolated_worker_env: None,
+) -> None:
+    expired = datetime.now(UTC) - timedelta(seconds=5)
+    await _add_jobs(
+        SyncJob(
+            id="job-stale",
+            status="running",
+            payload={},
+            lease_owner="dead-worker",
+            lease_expires_at=expired,
+            attempts=1,
+        ),
+        SyncJob(
+            id="job-exhausted",
+            status="running",
+            payload={},
+            lease_owner="dead-worker",
+            lease_expires_at=expired,
+            attempts=3,
+        ),
+        SyncJob(id="job-inline", status="running", payload={}),
+        SyncJob(
+            id="job-scheduler",
+            status="running",
+            payload={"trigger": "scheduler"},
+            lease_owner="dead-scheduler",
+            lease_expires_at=expired,
+        ),
+    )
+
+    assert await _claim("worker-2") == "job-stale"
+    assert await _claim("worker-2") is None
+
+    stale = await _get_job("job-stale")
+    assert stale.lease_owner == "worker-2"
+    assert stale.attempts == 2
+    exhausted = await _get_job("job-exhausted")
+    assert exhausted.status == "failed"
+    assert exhausted.error_message is not None
+    assert (await _get_job("job-inline")).status == "running"
+    # Scheduler runs are never retried by workers; an expired one is failed.
+    scheduler_job = await _get_job("job-scheduler")
+    assert scheduler_job.status == "failed"
+    assert scheduler_job.attempts == 0
+
+
+@pytest.mark.asyncio
+async def test_worker_runs_claimed_job_and_clears_lease(
+    isolated_worker_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    captured: dict[str, object] = {}
+
+    async def _fake_incremental_sync(
+        *, project_ids: list[int], modules_override: list[str] | None, **_kwargs
+    ):
+        captured["project_ids"] = project_ids
+        return {"issues_synced": 2}
+
+    monkeypatch.setattr(sync_service, "run_incremental_sync", _fake_incremental_sync)
+    await _add_jobs(SyncJob(id="job-run", status="queued", payload={"project_ids": [7]}))
+
+    worker = SyncWorker(owner="worker-1")
+    assert await worker.run_once() == "job-run"
+    assert await worker.run_once() is None
+
+    job = await _get_job("job-run")
+    assert captured["project_ids"] == [7]
+    assert job.status == "finished"
+    assert job.payload["summary"] == {"issues_synced": 2}
+    assert job.lease_owner == "worker-1"
+    assert job.lease_expires_at is None
+
+
+@pytest.mark.asyncio
+async def test_worker_discards_result_after_losing_lease(
+    isolated_worker_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def _slow_sync(*, project_ids: list[int], modules_override: list[str] | None, **_kwargs):
+        async with get_session_factory()() as session:
+            job = await session.scalar(select(SyncJob).where(SyncJob.id == "job-taken"))
+            assert job is not None
+            job.lease_owner = "other-worker"
+            await session.commit()
+        return {"issues_synced": 1}
+
+    monkeypatch.setattr(sync_service, "run_incremental_sync", _slow_sync)
+    await _add_jobs(SyncJob(id="job-taken", status="queued", payload={}))
+
+    assert await SyncWorker(owner="worker-1").run_once() == "job-taken"
+
+    job = await _get_job("job-taken")
+    assert job.status == "running"
+    assert job.lease_owner == "other-worker"
+    assert "summary" not in job.payload
+
+
+@pytest.mark.asyncio
+async def test_workers_run_at_most_one_sync_at_a_time(
+    isolated_worker_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    running = 0
+    peak = 0
+
+    async def _slow_sync(*, project_ids: list[int], modules_override: list[str] | None, **_kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.2)
+        running -= 1
+        return {}
+
+    monkeypatch.setattr(sync_service, "run_incremental_sync", _slow_sync)
+    await _add_jobs(
+        SyncJob(id="job-a", status="queued", payload={}),
+        SyncJob(id="job-b", status="queued", payload={}),
+    )
+
+    workers = [SyncWorker(owner="worker-1"), SyncWorker(owner="worker-1"), SyncWorker()]
+    claimed = await asyncio.gather(*(worker.run_once() for worker in workers))
+
+    assert peak == 1
+    assert len([job_id for job_id in claimed if job_id]) == 1
+    assert (await SyncWorker().run_once()) is not None
+    async with get_session_factory()() as session:
+        assert await get_lock_owner(session, SYNC_LOCK_NAME) is None
+
+
+@pytest.mark.asyncio
+async def test_worker_waits_while_sync_lock_is_held(isolated_worker_env: None) -> None:
+    await _add_jobs(SyncJob(id="job-wait", status="queued", payload={}))
+    async with get_session_factory()() as session:
+        assert await acquire_lock(session, SYNC_LOCK_NAME, owner="scheduler", ttl_s=60)
+
+    assert await SyncWorker(owner="worker-1").run_once() is None
+
+    assert (await _get_job("job-wait")).status == "queued"
+    async with get_session_factory()() as session:
+        assert await get_lock_owner(session, SYNC_LOCK_NAME) == "scheduler"
+
+
+def test_sync_endpoint_only_enqueues_in_worker_mode(
+    isolated_worker_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[int] = []
+
+    async def _never(*, project_ids: list[int], modules_override: list[str] | None, **_kwargs):
+        calls.append(1)
+        return {}
+
+    monkeypatch.setattr(sync_service, "run_incremental_sync", _never)
+    client = TestClient(app)
+
+    response = client.post("/v1/sync/redmine", json={"project_ids": [1]})
+
+    assert response.status_code == 200
+    job_id = response.json()["job_id"]
+    detail = client.get(f"/v1/sync/jobs/{job_id}").json()
+    assert detail["status"] == "queued"
+    assert detail["attempts"] == 0
+    assert calls == []